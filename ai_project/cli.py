@@ -5,9 +5,10 @@ from ai_project.nash import solve_nash_equilibrium
 from ai_project.nqueens import generate_response, run_experiment
 from ai_project.minimax import solve_minimax
 from ai_project.csp import solve_csp_problem
+from ai_project.graph_coloring.graph import load_graph
 from ai_project.graph_coloring.solver import solve_graph_coloring
 from ai_project.knights_tour.solver import solve_knights_tour
-from ai_project.hanoi.solver import solve_hanoi
+from ai_project.hanoi.solver import solve_hanoi, solve_hanoi_query
 
 
 def handle_nqueens():
@@ -65,7 +66,8 @@ def handle_hanoi():
     """Handles the Generalized Hanoi problem."""
     try:
         n_disks = int(input("Enter the number of disks: "))
-        response = solve_hanoi(n_disks)
+        n_pegs = int(input("Enter the number of pegs (default 3): ") or 3)
+        response = solve_hanoi(n_disks, n_pegs)
         print("\n" + "=" * 50 + "\n")
         print(response)
     except ValueError:
@@ -83,11 +85,19 @@ def main():
     parser.add_argument("--n", type=int, help="Board size for N-Queens")
     parser.add_argument("--tree", type=str, help="Game tree for Minimax")
     parser.add_argument("--csp_problem", type=str, help="CSP problem string")
+    parser.add_argument("--csp_preprocess", nargs='*', default=[], choices=["AC3", "SAC", "PC2"],
+                        help="Consistency passes run before the CSP search, in order (e.g. SAC PC2)")
     parser.add_argument("--nash_matrix", type=str, help="Nash equilibrium game matrix")
     parser.add_argument("--graph", type=str, help="Graph for Graph Coloring (JSON adjacency list)")
+    parser.add_argument("--graph_file", type=str, help="Graph file for Graph Coloring (.col DIMACS, .json, edge list)")
     parser.add_argument("--colors", type=str, help="Colors for Graph Coloring (comma-separated)")
+    parser.add_argument("--graph_mode", type=str, default="feasibility", choices=["feasibility", "chromatic"],
+                        help="Graph Coloring mode: feasibility with --colors, or the chromatic number")
     parser.add_argument("--knights_tour_size", type=int, help="Board size for Knight's Tour")
     parser.add_argument("--hanoi_disks", type=int, help="Number of disks for Generalized Hanoi")
+    parser.add_argument("--hanoi_pegs", type=int, default=3, help="Number of pegs for Generalized Hanoi (default: 3)")
+    parser.add_argument("--hanoi_start", type=str, help="Hanoi start configuration: peg letter of each disk, smallest first (e.g. AAB)")
+    parser.add_argument("--hanoi_goal", type=str, help="Hanoi goal configuration, same format as --hanoi_start")
 
     args = parser.parse_args()
 
@@ -110,16 +120,26 @@ def main():
                 print("Please provide the game tree using --tree")
         elif args.problem == 'csp':
             if args.csp_problem:
-                response = solve_csp_problem(args.csp_problem)
+                response = solve_csp_problem(args.csp_problem, preprocess=tuple(args.csp_preprocess))
                 print(response)
             else:
                 print("Please provide the CSP problem string using --csp_problem")
         elif args.problem == 'graph-coloring':
-            if args.graph and args.colors:
-                response = solve_graph_coloring(args.graph, args.colors)
+            graph = args.graph
+            if args.graph_file:
+                try:
+                    graph = load_graph(args.graph_file)
+                except (OSError, ValueError) as e:
+                    print(f"Could not load the graph file: {e}")
+                    sys.exit(1)
+            if graph and args.graph_mode == 'chromatic':
+                response = solve_graph_coloring(graph, args.colors or "", mode='chromatic')
+                print(response)
+            elif graph and args.colors:
+                response = solve_graph_coloring(graph, args.colors)
                 print(response)
             else:
-                print("Please provide the graph and colors using --graph and --colors")
+                print("Please provide the graph (--graph or --graph_file) and colors using --colors")
         elif args.problem == 'knights-tour':
             if args.knights_tour_size:
                 response = solve_knights_tour(args.knights_tour_size)
@@ -127,11 +147,14 @@ def main():
             else:
                 print("Please provide the board size using --knights_tour_size")
         elif args.problem == 'hanoi':
-            if args.hanoi_disks:
-                response = solve_hanoi(args.hanoi_disks)
+            if args.hanoi_start and args.hanoi_goal:
+                response = solve_hanoi_query(args.hanoi_start, args.hanoi_goal, args.hanoi_pegs)
+                print(response)
+            elif args.hanoi_disks:
+                response = solve_hanoi(args.hanoi_disks, args.hanoi_pegs)
                 print(response)
             else:
-                print("Please provide the number of disks using --hanoi_disks")
+                print("Please provide the number of disks using --hanoi_disks (or --hanoi_start and --hanoi_goal)")
         sys.exit(0)
 
     print("Welcome to the AI Project CLI!")
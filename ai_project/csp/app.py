@@ -1,12 +1,14 @@
 
-from .model import CSP, BinaryConstraint
+from .model import CSP, BinaryConstraint, SoftConstraint
 from .solver import solve_step_by_step
+from .optimization import solve_weighted
 import re
 
 def parse_csp_problem(problem_str):
     """
     Parses a CSP problem description string.
     Format: "variables: A, B, C; domains: 1, 2, 3; constraints: A != B, B != C"
+    A constraint followed by "@ weight" is soft, e.g. "A < B @ 3".
     """
     try:
         vars_str = re.search(r'variables:(.*?);', problem_str).group(1).strip()
@@ -27,30 +29,40 @@ def parse_csp_problem(problem_str):
         constraints = []
         for c_str in cons_str.split(','):
             c_str = c_str.strip()
-            match = re.match(r'(\w+)\s*(!=|==|<|>|<=|>=)\s*(\w+)', c_str)
+            match = re.match(r'(\w+)\s*(!=|==|<|>|<=|>=)\s*(\w+)(?:\s*@\s*(\d+(?:\.\d+)?))?', c_str)
             if match:
-                var1, op, var2 = match.groups()
-                constraints.append(BinaryConstraint(var1, var2, op))
+                var1, op, var2, weight = match.groups()
+                if weight is not None:
+                    constraints.append(SoftConstraint(var1, var2, op, float(weight)))
+                else:
+                    constraints.append(BinaryConstraint(var1, var2, op))
 
         return CSP(variables, domains, constraints)
     except Exception as e:
         print(f"Error parsing CSP problem: {e}")
         return None
 
-def solve_csp_problem(problem_str):
+def solve_csp_problem(problem_str, preprocess=()):
     """
     Solves a CSP problem from a string description.
+    preprocess: consistency passes run before the search, e.g. ('SAC',).
     """
     csp = parse_csp_problem(problem_str)
     if not csp:
         return "Failed to parse CSP problem."
 
-    solver_gen = solve_step_by_step(csp)
-    history = list(solver_gen)
+    if any(isinstance(c, SoftConstraint) for c in csp.constraints):
+        result = solve_weighted(csp)
+        if result['solution'] is None:
+            return "No solution satisfies the hard constraints."
+        status = "optimal" if result['optimal'] else "best found within the time limit"
+        return f"Solution found ({status}, cost {result['cost']:g}): {result['solution']}"
 
-    final_event, final_assign, _ = history[-1]
+    solver_gen = solve_step_by_step(csp, preprocess=preprocess)
+    history = list(solver_gen)
 
-    if final_event == 'SOLUTION':
+    if history and history[-1][0] == 'SOLUTION':
+        final_assign = history[-1][1]
         return f"Solution found: {final_assign}"
     else:
         return "No solution found."
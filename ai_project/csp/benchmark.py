@@ -0,0 +1,227 @@
+import argparse
+import csv
+import glob
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Any, Tuple
+
+from .model import CSP, CSPGenerator
+from .solver import solve_step_by_step, HEURISTICS, INFERENCES, PREPROCESSING
+from .generator import generate_model_b, read_instance
+
+# ==========================================
+# CSP Solver Benchmark Matrix
+# ==========================================
+#
+# Solves every instance of a corpus under every (heuristic, inference)
+# combination of `solve_step_by_step` (the SAT backend ignores the heuristic,
+# so it gets a single row per instance with heuristic '-'), with and without
+# the preprocessing passes of PREPROCESSING (column preprocess, '-' = none;
+# their checks and time are included), and records:
+#   nodes        STEP events (successful assignments; SAT: CDCL decisions)
+#   backtracks   BACKTRACK events (SAT: CDCL conflicts)
+#   checks       constraint checks (calls to Constraint.check)
+#   time         median wall time over the timed repeats (after warm-up)
+#   peak_kb      peak traced memory of one extra run under tracemalloc
+#
+# nodes / backtracks / checks are deterministic for a given seed, so they are
+# what the CI comparison relies on; time only fails beyond a tolerance.
+#
+#   python -m ai_project.csp.benchmark --out results.csv
+#   python -m ai_project.csp.benchmark --baseline results.csv --time-tolerance 0.5
+
+FIELDS = ['instance', 'heuristic', 'inference', 'preprocess', 'solved', 'nodes', 'backtracks', 'checks', 'time', 'peak_kb']
+
+def default_corpus(seed: int = 0) -> List[Tuple[str, CSP]]:
+    """A small, fixed set of generated instances (model B plus CSPGenerator topologies)."""
+    corpus = []
+    model_b = [(10, 5, 0.5, 0.2), (15, 5, 0.3, 0.3), (20, 6, 0.2, 0.35), (12, 4, 0.6, 0.25), (25, 8, 0.25, 0.4)]
+    for n, d, density, tightness in model_b:
+        name = f"modelB_n{n}_d{d}_p{density}_q{tightness}"
+        corpus.append((name, generate_model_b(n, d, density, tightness, seed=seed)))
+
+    # CSPGenerator draws from the global RNG: seed it without disturbing callers
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        for topology in ('chain', 'cycle', 'random_connected'):
+            csp = CSPGenerator.generate(num_vars=12, min_domain_size=3, max_domain_size=5, topology=topology)
+            corpus.append((f"generator_{topology}", csp))
+    finally:
+        random.setstate(state)
+    return corpus
+
+def load_corpus(paths: List[str]) -> List[Tuple[str, CSP]]:
+    """Instance files (see generator.read_instance); directories are scanned for *.csp."""
+    corpus = []
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, '*.csp'))) if os.path.isdir(path) else [path]
+        for f in files:
+            corpus.append((os.path.basename(f), read_instance(f)))
+    return corpus
+
+class CheckCounter:
+    """Counts constraint checks by shadowing `check` on each constraint instance."""
+    def __init__(self, csp: CSP):
+        self.csp = csp
+        self.count = 0
+
+    def __enter__(self):
+        for c in self.csp.constraints:
+            original = c.check
+            def counted(val1, val2, _original=original):
+                self.count += 1
+                return _original(val1, val2)
+            c.check = counted
+        return self
+
+    def __exit__(self, *exc):
+        for c in self.csp.constraints:
+            del c.check
+        return False
+
+def run_once(csp: CSP, heuristic: str, inference: str, node_limit: int, preprocess=(),
+             sat_time_limit: float = None) -> Dict[str, Any]:
+    """One solve; stops after `node_limit` events (the SAT backend: after `sat_time_limit` seconds)."""
+    nodes = backtracks = events = 0
+    solved = False
+    stats = {}
+    with CheckCounter(csp) as counter:
+        start = time.perf_counter()
+        for event, _, _ in solve_step_by_step(csp, heuristic=heuristic, inference=inference, preprocess=preprocess,
+                                              time_limit=sat_time_limit, stats=stats):
+            events += 1
+            if event == 'STEP':
+                nodes += 1
+            elif event == 'BACKTRACK':
+                backtracks += 1
+            elif event == 'SOLUTION':
+                solved = True
+            if events >= node_limit:
+                break
+        elapsed = time.perf_counter() - start
+    status = 'yes' if solved else ('limit' if events >= node_limit else 'no')
+    if inference == 'SAT':
+        # No search events: CDCL decisions and conflicts stand in for nodes and backtracks
+        status = {'sat': 'yes', 'unsat': 'no', 'limit': 'limit'}.get(stats.get('status'), status)
+        nodes, backtracks = stats.get('decisions', 0), stats.get('conflicts', 0)
+    return {'solved': status, 'nodes': nodes, 'backtracks': backtracks, 'checks': counter.count, 'time': elapsed}
+
+def measure(csp: CSP, heuristic: str, inference: str, warmup: int, repeats: int, node_limit: int,
+            preprocess=(), sat_time_limit: float = None) -> Dict[str, Any]:
+    for _ in range(warmup):
+        run_once(csp, heuristic, inference, node_limit, preprocess, sat_time_limit)
+    runs = [run_once(csp, heuristic, inference, node_limit, preprocess, sat_time_limit) for _ in range(repeats)]
+    result = dict(runs[0])
+    result['time'] = statistics.median(r['time'] for r in runs)
+
+    tracemalloc.start()
+    run_once(csp, heuristic, inference, node_limit, preprocess, sat_time_limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result['peak_kb'] = peak / 1024
+    return result
+
+def run_matrix(
+    corpus: List[Tuple[str, CSP]],
+    heuristics=HEURISTICS,
+    inferences=INFERENCES,
+    preprocessing=PREPROCESSING,
+    warmup: int = 1,
+    repeats: int = 3,
+    node_limit: int = 200000,
+    sat_time_limit: float = 60.0,
+) -> List[Dict[str, Any]]:
+    rows = []
+    for name, csp in corpus:
+        for heuristic in heuristics:
+            for inference in inferences:
+                # The SAT backend does not branch on variables: one row per instance
+                if inference == 'SAT' and heuristic != heuristics[0]:
+                    continue
+                for passes in preprocessing:
+                    result = measure(csp, heuristic, inference, warmup, repeats, node_limit, passes, sat_time_limit)
+                    label = '-' if inference == 'SAT' else heuristic
+                    rows.append({'instance': name, 'heuristic': label, 'inference': inference,
+                                 'preprocess': '+'.join(passes) or '-', **result})
+    return rows
+
+def write_csv(rows: List[Dict[str, Any]], path: str):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: (f"{row[k]:.6f}" if k in ('time', 'peak_kb') else row[k]) for k in FIELDS})
+
+def read_csv(path: str) -> List[Dict[str, Any]]:
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Comparison table: one line per (instance, heuristic, inference, preprocess)."""
+    header = f"{'instance':<36} {'heur':<6} {'inf':<4} {'pre':<4} {'solved':<6} {'nodes':>8} {'backtr':>8} {'checks':>10} {'time(s)':>9} {'peak(KB)':>9}"
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['instance']:<36} {r['heuristic']:<6} {r['inference']:<4} {r['preprocess']:<4} {r['solved']:<6} "
+            f"{r['nodes']:>8} {r['backtracks']:>8} {r['checks']:>10} {r['time']:>9.4f} {r['peak_kb']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+def compare(rows: List[Dict[str, Any]], baseline: List[Dict[str, Any]], time_tolerance: float) -> List[str]:
+    """Regressions of `rows` against a baseline CSV (empty list = no regression)."""
+    # Baselines written before the preprocess column are runs without preprocessing
+    base = {(b['instance'], b['heuristic'], b['inference'], b.get('preprocess', '-')): b for b in baseline}
+    problems = []
+    for r in rows:
+        key = (r['instance'], r['heuristic'], r['inference'], r['preprocess'])
+        if key not in base:
+            continue
+        b = base[key]
+        for field in ('nodes', 'backtracks', 'checks'):
+            if r[field] > int(b[field]):
+                problems.append(f"{'/'.join(key)}: {field} {b[field]} -> {r[field]}")
+        if r['solved'] != b['solved']:
+            problems.append(f"{'/'.join(key)}: solved {b['solved']} -> {r['solved']}")
+        if r['time'] > float(b['time']) * (1 + time_tolerance):
+            problems.append(f"{'/'.join(key)}: time {float(b['time']):.4f}s -> {r['time']:.4f}s")
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSP solver benchmark matrix")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated corpus")
+    parser.add_argument("--instances", nargs='*', default=[], help="Extra instance files or directories")
+    parser.add_argument("--no-generated", action='store_true', help="Only use --instances")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--node-limit", type=int, default=200000, help="Max solver events per run")
+    parser.add_argument("--sat-time-limit", type=float, default=60.0, help="Seconds per run of the SAT backend")
+    parser.add_argument("--out", type=str, help="Write the results as CSV")
+    parser.add_argument("--baseline", type=str, help="CSV of a previous run to compare against")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="Allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    corpus = [] if args.no_generated else default_corpus(args.seed)
+    corpus += load_corpus(args.instances)
+
+    rows = run_matrix(corpus, warmup=args.warmup, repeats=args.repeats, node_limit=args.node_limit,
+                      sat_time_limit=args.sat_time_limit)
+    print(format_table(rows))
+    if args.out:
+        write_csv(rows, args.out)
+
+    if args.baseline:
+        problems = compare(rows, read_csv(args.baseline), args.time_tolerance)
+        if problems:
+            print("\nRegressions:")
+            print("\n".join(f"  {p}" for p in problems))
+            return 1
+        print("\nNo regressions against the baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+import time
+from typing import Dict, List, Any, Tuple, Set
+
+from .model import CSP, RelationConstraint
+from .solver import ac3_inference
+
+# ==========================================
+# Preprocessing Passes (stronger than AC)
+# ==========================================
+#
+# Run once before search, on small but hard models, to shrink the domains
+# further than the per-node FC / AC-3 of `solve_step_by_step` can:
+#
+# - SAC (singleton arc consistency): a value is kept only if assigning it and
+#   running AC-3 does not wipe out a domain. Implemented SAC-1 style with a
+#   queue, plus the SAC-Opt idea of remembering, for every value, the domains
+#   its singleton test ended with: after a removal, only the values whose
+#   remembered domains contained a removed value are tested again.
+# - PC-2 (path consistency): every pair of variables gets an explicit
+#   relation, tightened by composition along every third variable. Values
+#   left without support are removed and the tightened relations are added
+#   to the model as extensional constraints.
+#
+# Every pass returns a report: {'pass', 'removed', 'time', 'consistent'}.
+
+def _all_arcs(csp: CSP) -> List[Tuple[str, str]]:
+    arcs = []
+    for c in csp.constraints:
+        arcs.append((c.var1, c.var2))
+        arcs.append((c.var2, c.var1))
+    return arcs
+
+def _arcs_into(csp: CSP, var: str) -> List[Tuple[str, str]]:
+    return [(c.var1 if c.var1 != var else c.var2, var) for c in csp.neighbors[var]]
+
+def _domain_size(domains: Dict[str, List[Any]]) -> int:
+    return sum(len(vals) for vals in domains.values())
+
+def arc_consistency(csp: CSP, domains: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Plain AC-3 over the whole model, as a pass (modifies `domains` in place)."""
+    start = time.time()
+    before = _domain_size(domains)
+    consistent = ac3_inference(csp, _all_arcs(csp), domains)
+    return {'pass': 'AC3', 'removed': before - _domain_size(domains),
+            'time': time.time() - start, 'consistent': consistent}
+
+def singleton_arc_consistency(csp: CSP, domains: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Enforces SAC on `domains` in place."""
+    start = time.time()
+    before = _domain_size(domains)
+
+    def report(consistent):
+        return {'pass': 'SAC', 'removed': before - _domain_size(domains),
+                'time': time.time() - start, 'consistent': consistent}
+
+    if not ac3_inference(csp, _all_arcs(csp), domains):
+        return report(False)
+
+    # Remembered singleton-test domains (SAC-Opt style): (x, a) -> {var: set(values)}
+    support: Dict[Tuple[str, Any], Dict[str, Set[Any]]] = {}
+    queue = [(x, a) for x in csp.variables for a in domains[x]]
+
+    while queue:
+        x, a = queue.pop()
+        if a not in domains[x]:
+            continue
+
+        test = {v: list(vals) for v, vals in domains.items()}
+        test[x] = [a]
+        if ac3_inference(csp, _arcs_into(csp, x), test):
+            support[(x, a)] = {v: set(vals) for v, vals in test.items()}
+            continue
+
+        # (x, a) is not singleton arc consistent: remove it and restore AC
+        support.pop((x, a), None)
+        domains[x].remove(a)
+        trail = {x: [a]}
+        if not domains[x] or not ac3_inference(csp, _arcs_into(csp, x), domains, trail):
+            return report(False)
+
+        # Re-test the values whose singleton domains relied on a removed value
+        for key, sup in list(support.items()):
+            if any(val in sup[v] for v, vals in trail.items() for val in vals):
+                del support[key]
+                queue.append(key)
+
+    return report(True)
+
+def path_consistency(csp: CSP, domains: Dict[str, List[Any]]) -> Tuple[Dict[str, Any], List[RelationConstraint]]:
+    """
+    Enforces PC-2 on `domains` in place. Meant for small, dense models: the
+    relations of all n(n-1) ordered pairs are kept explicitly.
+
+    Returns: (report, extensional constraints for the tightened relations)
+    """
+    start = time.time()
+    before = _domain_size(domains)
+    variables = list(csp.variables)
+
+    # rel[(i, j)][a] = set of values b of j compatible with i = a
+    rel: Dict[Tuple[str, str], Dict[Any, Set[Any]]] = {}
+    for i in variables:
+        for j in variables:
+            if i != j:
+                rel[(i, j)] = {a: set(domains[j]) for a in domains[i]}
+    for c in csp.constraints:
+        i, j = c.var1, c.var2
+        for a in domains[i]:
+            for b in domains[j]:
+                if not c.check(a, b):
+                    rel[(i, j)][a].discard(b)
+                    rel[(j, i)][b].discard(a)
+    original = {key: {a: set(bs) for a, bs in r.items()} for key, r in rel.items()}
+
+    def remove_value(i, a):
+        domains[i].remove(a)
+        for j in variables:
+            if j != i:
+                del rel[(i, j)][a]
+                for b in rel[(j, i)]:
+                    rel[(j, i)][b].discard(a)
+
+    def report(consistent):
+        return {'pass': 'PC2', 'removed': before - _domain_size(domains),
+                'time': time.time() - start, 'consistent': consistent}
+
+    # Triples (i, k, j), i < j: revise R_ij through k
+    queue = {(i, k, j) for i in variables for j in variables for k in variables
+             if i < j and k != i and k != j}
+    while queue:
+        i, k, j = queue.pop()
+        r_ij, r_ik, r_jk = rel[(i, j)], rel[(i, k)], rel[(j, k)]
+        changed = False
+        for a in list(r_ij):
+            for b in list(r_ij[a]):
+                if not (r_ik[a] & r_jk[b]):
+                    r_ij[a].discard(b)
+                    rel[(j, i)][b].discard(a)
+                    changed = True
+        if not changed:
+            continue
+
+        # Values without any support left on (i, j) disappear from the domains
+        dead = [(i, a) for a in domains[i] if not r_ij[a]] + [(j, b) for b in domains[j] if not rel[(j, i)][b]]
+        for var, val in dead:
+            remove_value(var, val)
+        if not domains[i] or not domains[j]:
+            return report(False), []
+
+        for m in variables:
+            if m != i and m != j:
+                queue.add((min(i, m), j, max(i, m)))
+                queue.add((min(m, j), i, max(m, j)))
+        for var, _ in dead:
+            for p in variables:
+                for q in variables:
+                    if p < q and var not in (p, q):
+                        queue.add((p, var, q))
+
+    # Relations that are now tighter than the model become new constraints
+    added = []
+    for i in variables:
+        for j in variables:
+            if i < j:
+                nogoods = [(a, b) for a in domains[i] for b in original[(i, j)][a]
+                           if b in domains[j] and b not in rel[(i, j)][a]]
+                if nogoods:
+                    added.append(RelationConstraint(i, j, nogoods))
+    result = report(True)
+    result['tightened'] = len(added)
+    return result, added
+
+def preprocess(csp: CSP, passes=('SAC',)) -> Tuple[CSP, List[Dict[str, Any]]]:
+    """
+    Runs the given passes ('AC3', 'SAC', 'PC2') in order on a copy of `csp`.
+
+    Returns: (reduced CSP, one report per pass). Stops early if a pass proves
+    the model inconsistent.
+    """
+    # One list per variable: parsed models share a single domain list, which deepcopy would keep shared
+    domains = {var: list(vals) for var, vals in csp.domains.items()}
+    reduced = CSP(list(csp.variables), domains, list(csp.constraints))
+    reports = []
+    for name in passes:
+        if name == 'AC3':
+            result = arc_consistency(reduced, domains)
+        elif name == 'SAC':
+            result = singleton_arc_consistency(reduced, domains)
+        elif name == 'PC2':
+            result, added = path_consistency(reduced, domains)
+            for constraint in added:
+                reduced.add_constraint(constraint)
+        else:
+            raise ValueError(f"Unknown preprocessing pass: {name}")
+        reports.append(result)
+        if not result['consistent']:
+            break
+    return reduced, reports
@@ -0,0 +1,266 @@
+import math
+import os
+import random
+import re
+from typing import List, Dict, Any, Tuple, Iterator, Optional
+
+from .model import CSP, BinaryConstraint, RelationConstraint, SoftConstraint
+
+# ==========================================
+# 1. Random Binary CSP Models (B / RB)
+# ==========================================
+#
+# Model B <n, d, p1, p2>: exactly round(p1 * n(n-1)/2) constraints, each one
+# forbidding exactly round(p2 * d^2) value pairs.
+#
+# Model RB <n, alpha, r, p>: d = round(n^alpha) values per variable,
+# m = round(r * n * ln n) constraints, each forbidding round(p * d^2) pairs.
+# For alpha > 1/2 and p <= 1/2 it has a proven phase transition at
+# p_cr = 1 - exp(-alpha / r), which makes it the standard source of hard
+# benchmark instances.
+#
+# Both models are generated by direct sampling: scopes and nogoods are drawn
+# as ranks in [0, total) without replacement and decoded, so generation cost
+# is proportional to the output, not to the number of rejected draws.
+
+def indexed_variable_names(num_vars: int) -> List[str]:
+    """Zero-padded names (X00, X01, ...) that also sort in creation order.
+
+    (`CSPGenerator.variable_names` gives spreadsheet-style names A, B, ... instead.)
+    """
+    width = len(str(max(num_vars - 1, 0)))
+    return [f"X{i:0{width}d}" for i in range(num_vars)]
+
+def unrank_pair(k: int, n: int) -> Tuple[int, int]:
+    """Maps k in [0, n(n-1)/2) to the k-th pair (i, j), i < j, in lexicographic order."""
+    total = n * (n - 1) // 2
+    # Count pairs from the end: the last row (i = n-2) holds pair 0 of the reversed order
+    r = total - 1 - k
+    t = (math.isqrt(8 * r + 1) - 1) // 2
+    i = n - 2 - t
+    j = n - 1 - (r - t * (t + 1) // 2)
+    return i, j
+
+def sample_scopes(n: int, m: int, rng: random.Random) -> Iterator[Tuple[int, int]]:
+    """Yields m distinct variable pairs, sampled uniformly."""
+    total = n * (n - 1) // 2
+    if m > total:
+        raise ValueError(f"Cannot place {m} constraints on {n} variables (max {total}).")
+    for k in rng.sample(range(total), m):
+        yield unrank_pair(k, n)
+
+def sample_nogoods(d: int, t: int, rng: random.Random) -> List[Tuple[int, int]]:
+    """Samples t distinct forbidden pairs from a d x d value grid."""
+    return [divmod(k, d) for k in rng.sample(range(d * d), t)]
+
+def model_b_params(n: int, d: int, density: float, tightness: float) -> Tuple[int, int]:
+    """Returns (number of constraints, nogoods per constraint) for model B."""
+    m = round(density * n * (n - 1) / 2)
+    t = round(tightness * d * d)
+    return m, t
+
+def model_rb_params(n: int, alpha: float, r: float, p: float) -> Tuple[int, int, int]:
+    """Returns (domain size, number of constraints, nogoods per constraint) for model RB."""
+    d = max(2, round(n ** alpha))
+    m = min(round(r * n * math.log(n)), n * (n - 1) // 2)
+    t = round(p * d * d)
+    return d, m, t
+
+def critical_tightness_rb(alpha: float, r: float) -> float:
+    """Theoretical phase-transition tightness of model RB."""
+    return 1 - math.exp(-alpha / r)
+
+def critical_tightness_b(n: int, d: int, density: float) -> float:
+    """Smith's estimate of the phase-transition tightness for model B (expected 1 solution)."""
+    return 1 - d ** (-2 / (density * (n - 1)))
+
+def iter_random_constraints(
+    n: int, d: int, m: int, t: int, seed: Optional[int] = None
+) -> Iterator[RelationConstraint]:
+    """
+    Streams the constraints of a random binary CSP with n variables, domains
+    0..d-1, m constraints and t nogoods per constraint. The same seed always
+    gives the same instance.
+    """
+    rng = random.Random(seed)
+    names = indexed_variable_names(n)
+    for i, j in sample_scopes(n, m, rng):
+        yield RelationConstraint(names[i], names[j], sample_nogoods(d, t, rng))
+
+def generate_model_b(
+    n: int, d: int, density: float, tightness: float, seed: Optional[int] = None
+) -> CSP:
+    """Builds a model B instance in memory."""
+    m, t = model_b_params(n, d, density, tightness)
+    return _build(n, d, iter_random_constraints(n, d, m, t, seed))
+
+# Default RB parameters. Caveat: alpha = r = 0.8 puts p_cr = 1 - exp(-1) ~ 0.632 above
+# the p <= 1/2 range of the threshold theorem, so around it the transition is the
+# empirically observed one, not a proven one.
+RB_ALPHA = 0.8
+RB_R = 0.8
+
+def generate_model_rb(
+    n: int, alpha: float = RB_ALPHA, r: float = RB_R, p: float = 0.25, seed: Optional[int] = None
+) -> CSP:
+    """Builds a model RB instance in memory."""
+    d, m, t = model_rb_params(n, alpha, r, p)
+    return _build(n, d, iter_random_constraints(n, d, m, t, seed))
+
+def _build(n: int, d: int, constraints: Iterator[BinaryConstraint]) -> CSP:
+    variables = indexed_variable_names(n)
+    domains = {v: list(range(d)) for v in variables}
+    return CSP(variables, domains, list(constraints))
+
+# ==========================================
+# 2. Instance Files
+# ==========================================
+#
+# Plain-text, line-oriented format (one constraint per line, so instances can
+# be written and read in a streaming fashion):
+#
+#   # free-form comment
+#   variables: X0, X1, X2
+#   domains: 0-9                      (shared domain, range or list)
+#   domain X2: 1, 3, 5                (optional per-variable override)
+#   X0 != X1                          (operator constraint)
+#   X0 < X2 @ 3                       (soft constraint with weight 3)
+#   nogoods X1 X2: 0 1, 3 3           (extensional constraint)
+
+def _format_values(values: List[Any]) -> str:
+    if values and all(isinstance(v, int) for v in values) and values == list(range(values[0], values[-1] + 1)):
+        return f"{values[0]}-{values[-1]}"
+    return ", ".join(str(v) for v in values)
+
+def _parse_values(text: str) -> List[Any]:
+    text = text.strip()
+    m = re.fullmatch(r'(-?\d+)\s*-\s*(-?\d+)', text)
+    if m:
+        return list(range(int(m.group(1)), int(m.group(2)) + 1))
+    values = []
+    for v in text.split(','):
+        v = v.strip()
+        values.append(int(v) if re.fullmatch(r'-?\d+', v) else v)
+    return values
+
+def _format_constraint(c: BinaryConstraint) -> str:
+    if isinstance(c, RelationConstraint):
+        pairs = ", ".join(f"{a} {b}" for a, b in sorted(c.nogoods))
+        return f"nogoods {c.var1} {c.var2}: {pairs}"
+    if isinstance(c, SoftConstraint):
+        return f"{c.var1} {c.op} {c.var2} @ {c.weight:g}"
+    return f"{c.var1} {c.op} {c.var2}"
+
+def _write_stream(f, variables, domains, constraints, comment=None):
+    if comment:
+        f.write(f"# {comment}\n")
+    f.write(f"variables: {', '.join(variables)}\n")
+    shared = domains[variables[0]] if variables else []
+    f.write(f"domains: {_format_values(shared)}\n")
+    for v in variables:
+        if domains[v] != shared:
+            f.write(f"domain {v}: {_format_values(domains[v])}\n")
+    count = 0
+    for c in constraints:
+        f.write(_format_constraint(c) + "\n")
+        count += 1
+    return count
+
+def write_instance(csp: CSP, path: str, comment: str = None) -> None:
+    """Writes a CSP with binary constraints to `path`."""
+    with open(path, 'w') as f:
+        _write_stream(f, csp.variables, csp.domains, csp.constraints, comment)
+
+def write_random_instance(
+    path: str, n: int, d: int, m: int, t: int, seed: Optional[int] = None, comment: str = None
+) -> int:
+    """
+    Samples a random binary CSP straight to disk without building the model
+    in memory. Returns the number of constraints written.
+    """
+    variables = indexed_variable_names(n)
+    domains = {v: list(range(d)) for v in variables}
+    with open(path, 'w') as f:
+        return _write_stream(f, variables, domains, iter_random_constraints(n, d, m, t, seed), comment)
+
+def read_instance(path: str) -> CSP:
+    """Reads an instance written by `write_instance` / `write_random_instance`."""
+    variables, shared, overrides, constraints = [], [], {}, []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('variables:'):
+                variables = [v.strip() for v in line[len('variables:'):].split(',') if v.strip()]
+            elif line.startswith('domains:'):
+                shared = _parse_values(line[len('domains:'):])
+            elif line.startswith('domain '):
+                head, values = line[len('domain '):].split(':', 1)
+                overrides[head.strip()] = _parse_values(values)
+            elif line.startswith('nogoods '):
+                head, pairs = line[len('nogoods '):].split(':', 1)
+                var1, var2 = head.split()
+                nogoods = []
+                for pair in pairs.split(','):
+                    if pair.strip():
+                        a, b = _parse_values(pair.strip().replace(' ', ',', 1))
+                        nogoods.append((a, b))
+                constraints.append(RelationConstraint(var1, var2, nogoods))
+            else:
+                match = re.fullmatch(r'(\w+)\s*(!=|==|<=|>=|<|>)\s*(\w+)(?:\s*@\s*(\d+(?:\.\d+)?))?', line)
+                if not match:
+                    raise ValueError(f"Invalid constraint line: {line}")
+                var1, op, var2, weight = match.groups()
+                if weight is not None:
+                    constraints.append(SoftConstraint(var1, var2, op, float(weight)))
+                else:
+                    constraints.append(BinaryConstraint(var1, var2, op))
+    domains = {v: list(overrides.get(v, shared)) for v in variables}
+    return CSP(variables, domains, constraints)
+
+# ==========================================
+# 3. Phase-Transition Benchmark Suites
+# ==========================================
+
+def write_phase_transition_suite(
+    directory: str,
+    n: int,
+    alpha: float = RB_ALPHA,
+    r: float = RB_R,
+    tightness_values: List[float] = None,
+    instances_per_point: int = 5,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Writes model RB instances for a sweep of tightness values around the
+    theoretical threshold p_cr. By default the sweep covers p_cr +/- 0.1.
+    With the default alpha and r, p_cr ~ 0.632 is above 1/2, outside the range
+    the threshold is proven for (see RB_ALPHA).
+
+    Returns: one manifest entry per written file (path, parameters, seed).
+    """
+    p_cr = critical_tightness_rb(alpha, r)
+    if tightness_values is None:
+        tightness_values = [round(p_cr + delta, 3) for delta in (-0.1, -0.05, -0.02, 0.0, 0.02, 0.05, 0.1)]
+
+    os.makedirs(directory, exist_ok=True)
+    manifest = []
+    for p in tightness_values:
+        d, m, t = model_rb_params(n, alpha, r, p)
+        for k in range(instances_per_point):
+            # Each instance gets its own derived seed, so a single file can be
+            # regenerated without replaying the whole suite.
+            instance_seed = random.Random(f"{seed}/{n}/{alpha}/{r}/{p}/{k}").getrandbits(32)
+            name = f"rb_n{n}_d{d}_m{m}_p{p:.3f}_{k}.csp"
+            path = os.path.join(directory, name)
+            comment = f"model RB n={n} alpha={alpha} r={r} p={p} p_cr={p_cr:.4f} seed={instance_seed}"
+            write_random_instance(path, n, d, m, t, instance_seed, comment)
+            manifest.append({'path': path, 'n': n, 'd': d, 'm': m, 'p': p, 'seed': instance_seed})
+    return manifest
+
+# --- Quick Test ---
+if __name__ == "__main__":
+    print(f"p_cr (alpha={RB_ALPHA}, r={RB_R}) = {critical_tightness_rb(RB_ALPHA, RB_R):.4f}")
+    csp = generate_model_rb(8, seed=1)
+    print(csp)
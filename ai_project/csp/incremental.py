@@ -0,0 +1,266 @@
+import copy
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
+
+from .model import CSP, Constraint
+from .solver import solve_step_by_step
+
+# ==========================================
+# Incremental CSP Solving
+# ==========================================
+#
+# The solver keeps two pieces of state between calls:
+#   1. The arc-consistent domains of the whole model, together with the
+#      reason each value was removed (the arc (x, y) that lost its support,
+#      or the user's domain). Tightening (new constraint, smaller domain) is
+#      propagated from the affected arcs only. Relaxing (removed constraint,
+#      larger domain) restores the values whose removal depended on the
+#      change, transitively, and re-propagates around them (DnAC style).
+#   2. The last solution. After an edit we first try to repair it locally
+#      with min-conflicts, and only run a full search if the repair fails.
+
+DOMAIN = 'domain'  # Removal reason: the value is not in the user's domain
+
+class IncrementalSolver:
+    """
+    Re-solves a CSP after small edits, starting from the previous solution.
+
+    Usage:
+        solver = IncrementalSolver(csp)
+        solver.solve()
+        solver.add_constraint(BinaryConstraint('A', 'B', '<'))
+        solver.solve()          # repaired from the previous solution
+        solver.stats            # {'mode': 'repair', 'time': ..., 'changed': [...]}
+    """
+    def __init__(
+        self,
+        csp: CSP,
+        heuristic: str = 'MRV',
+        inference: str = 'FC',
+        max_repair_steps: int = 1000,
+        seed: Optional[int] = None,
+    ):
+        self.csp = csp
+        self.heuristic = heuristic
+        self.inference = inference
+        self.max_repair_steps = max_repair_steps
+        self.rng = random.Random(seed)
+
+        self.solution: Optional[Dict[str, Any]] = None
+        self.stats: Dict[str, Any] = {}
+
+        # Arc-consistency state
+        self.domains: Dict[str, List[Any]] = {}
+        self.removed: Dict[Tuple[str, Any], Any] = {}  # (var, value) -> reason
+        self.pending: List[Tuple[str, str]] = []        # arcs to revise before the next solve
+        self.consistent = True
+        self._reset_arc_consistency()
+
+    # ------------------------------------------
+    # Edits
+    # ------------------------------------------
+
+    def add_constraint(self, constraint: Constraint):
+        self.csp.add_constraint(constraint)
+        self.pending.append((constraint.var1, constraint.var2))
+        self.pending.append((constraint.var2, constraint.var1))
+
+    def remove_constraint(self, constraint: Constraint):
+        self.csp.remove_constraint(constraint)
+        self._restore([
+            (var, value) for (var, value), reason in self.removed.items()
+            if reason in ((constraint.var1, constraint.var2), (constraint.var2, constraint.var1))
+        ])
+
+    def set_domain(self, var: str, values: List[Any]):
+        old = set(self.csp.domains[var])
+        self.csp.domains[var] = list(values)
+        new = set(values)
+
+        # Values that left the domain
+        for value in old - new:
+            if value in self.domains[var]:
+                self.domains[var].remove(value)
+            self.removed[(var, value)] = DOMAIN
+        if old - new:
+            if not self.domains[var]:
+                self.consistent = False
+            self.pending.extend((self._other(c, var), var) for c in self.csp.neighbors[var])
+
+        # Values that joined the domain
+        for value in new - old:
+            self.removed.pop((var, value), None)
+        self._restore([(var, value) for value in new - old])
+
+    # ------------------------------------------
+    # Solving
+    # ------------------------------------------
+
+    def solve(self) -> Optional[Dict[str, Any]]:
+        """Returns a solution of the current model, or None if there is none."""
+        start = time.time()
+        self._propagate()
+
+        if not self.consistent:
+            self.solution = None
+            self.stats = {'mode': 'inconsistent', 'time': time.time() - start, 'changed': []}
+            return None
+
+        previous = self.solution
+        solution, mode = None, 'search'
+        if previous is not None:
+            solution = self._repair(previous)
+            if solution is not None:
+                mode = 'repair'
+        if solution is None:
+            solution = self._search()
+
+        changed = []
+        if previous is not None and solution is not None:
+            changed = sorted(v for v in solution if previous.get(v) != solution[v])
+
+        self.solution = solution
+        self.stats = {'mode': mode, 'time': time.time() - start, 'changed': changed}
+        return solution
+
+    def _repair(self, previous: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Min-conflicts local search seeded with the previous solution and
+        restricted to the arc-consistent domains.
+        """
+        assignment = {}
+        for var in self.csp.variables:
+            if previous.get(var) in self.domains[var]:
+                assignment[var] = previous[var]
+            else:
+                # The old value was pruned: take the least conflicting survivor
+                assignment[var] = min(
+                    sorted(self.domains[var]), key=lambda val: self._conflicts(var, val, assignment)
+                )
+
+        conflicted = {v for v in self.csp.variables if self._conflicts(v, assignment[v], assignment)}
+        last_moved = None
+        for _ in range(self.max_repair_steps):
+            if not conflicted:
+                return assignment
+
+            candidates = sorted(conflicted - {last_moved}) or sorted(conflicted)
+            var = self.rng.choice(candidates)
+            scores = [(self._conflicts(var, val, assignment), val) for val in sorted(self.domains[var])]
+            best = min(score for score, _ in scores)
+            value = self.rng.choice([val for score, val in scores if score == best])
+
+            assignment[var] = value
+            last_moved = var
+
+            # Only var and its neighbours can change conflict status
+            for v in [var] + [self._other(c, var) for c in self.csp.neighbors[var]]:
+                if self._conflicts(v, assignment[v], assignment):
+                    conflicted.add(v)
+                else:
+                    conflicted.discard(v)
+        return None
+
+    def _search(self) -> Optional[Dict[str, Any]]:
+        """Full backtracking search over the arc-consistent domains."""
+        sub_csp = copy.copy(self.csp)
+        sub_csp.domains = {v: list(vals) for v, vals in self.domains.items()}
+        for event, assignment, _ in solve_step_by_step(sub_csp, heuristic=self.heuristic, inference=self.inference):
+            if event == 'SOLUTION':
+                return dict(assignment)
+        return None
+
+    def _conflicts(self, var: str, value: Any, assignment: Dict[str, Any]) -> int:
+        count = 0
+        for constraint in self.csp.neighbors[var]:
+            other = self._other(constraint, var)
+            if other in assignment and not constraint.satisfied({var: value, other: assignment[other]}):
+                count += 1
+        return count
+
+    # ------------------------------------------
+    # Arc consistency with removal reasons
+    # ------------------------------------------
+
+    @staticmethod
+    def _other(constraint: Constraint, var: str) -> str:
+        return constraint.var1 if constraint.var1 != var else constraint.var2
+
+    def _reset_arc_consistency(self):
+        self.domains = {v: list(vals) for v, vals in self.csp.domains.items()}
+        self.removed = {}
+        self.consistent = all(self.domains[v] for v in self.csp.variables)
+        self.pending = [
+            (x, y) for c in self.csp.constraints for x, y in ((c.var1, c.var2), (c.var2, c.var1))
+        ]
+
+    def _revise(self, xi: str, xj: str) -> bool:
+        constraints = [c for c in self.csp.neighbors[xi] if xj in c.variables]
+        revised = False
+        for x_val in self.domains[xi][:]:
+            if not any(
+                all(c.satisfied({xi: x_val, xj: y_val}) for c in constraints)
+                for y_val in self.domains[xj]
+            ):
+                self.domains[xi].remove(x_val)
+                self.removed[(xi, x_val)] = (xi, xj)
+                revised = True
+        return revised
+
+    def _propagate(self):
+        """AC-3 over the pending arcs, recording why each value is removed."""
+        queue = self.pending
+        self.pending = []
+        if not self.consistent:
+            # A previous wipe-out interrupted propagation: the recorded state
+            # is incomplete, so start again from the model.
+            self._reset_arc_consistency()
+            queue = self.pending
+            self.pending = []
+            if not self.consistent:
+                return
+
+        while queue:
+            xi, xj = queue.pop()
+            if self._revise(xi, xj):
+                if not self.domains[xi]:
+                    self.consistent = False
+                    return
+                for constraint in self.csp.neighbors[xi]:
+                    neighbor = self._other(constraint, xi)
+                    if neighbor != xj:
+                        queue.append((neighbor, xi))
+
+    def _restore(self, values: List[Tuple[str, Any]]):
+        """
+        Puts back `values` and, transitively, every value that was removed for
+        lack of support on a variable that just regained values. Over-restored
+        values are pruned again by the arcs queued here.
+        """
+        # Removed values grouped by the variable whose domain failed to support them
+        unsupported_by = defaultdict(list)
+        for key, reason in self.removed.items():
+            if reason != DOMAIN:
+                unsupported_by[reason[1]].append(key)
+
+        stack = list(values)
+        touched = set()
+        while stack:
+            var, value = stack.pop()
+            if self.removed.get((var, value)) == DOMAIN:
+                continue
+            self.removed.pop((var, value), None)
+            if value in self.domains[var] or value not in self.csp.domains[var]:
+                continue
+            self.domains[var].append(value)
+            if var not in touched:
+                touched.add(var)
+                stack.extend(unsupported_by.pop(var, []))
+
+        for var in touched:
+            for constraint in self.csp.neighbors[var]:
+                neighbor = self._other(constraint, var)
+                self.pending.append((var, neighbor))
+                self.pending.append((neighbor, var))
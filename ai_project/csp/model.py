@@ -1,7 +1,7 @@
 import random
 import copy
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 
 # ==========================================
 # 1. Constraint Classes
@@ -54,6 +54,38 @@ class BinaryConstraint(Constraint):
     def __str__(self):
         return f"{self.var1} {self.op} {self.var2}"
 
+class SoftConstraint(BinaryConstraint):
+    """
+    A binary constraint that may be violated at a price: `weight` is added to
+    the cost of any assignment that breaks it. Satisfaction solvers treat it
+    as hard; the branch-and-bound optimiser minimises the total weight.
+    """
+    def __init__(self, var1: str, var2: str, op: str, weight: float = 1):
+        super().__init__(var1, var2, op)
+        self.weight = weight
+
+    def cost(self, val1, val2) -> float:
+        return 0 if self.check(val1, val2) else self.weight
+
+    def __str__(self):
+        return f"{self.var1} {self.op} {self.var2} @ {self.weight}"
+
+class RelationConstraint(BinaryConstraint):
+    """
+    A binary constraint given in extension, as the set of forbidden value pairs
+    (nogoods). This is the representation used by random CSP models (B, RB),
+    where relations are sampled tuple by tuple instead of being comparisons.
+    """
+    def __init__(self, var1: str, var2: str, nogoods):
+        super().__init__(var1, var2, 'nogoods')
+        self.nogoods = set(nogoods)
+
+    def check(self, val1, val2) -> bool:
+        return (val1, val2) not in self.nogoods
+
+    def __str__(self):
+        return f"{self.var1} {self.var2} nogoods: {len(self.nogoods)}"
+
 # ==========================================
 # 2. The CSP Model
 # ==========================================
@@ -64,6 +96,11 @@ class CSP:
         self.variables = variables
         self.domains = domains
         self.constraints: List[Constraint] = constraints if constraints is not None else []
+
+        # Value symmetry: if set, these values are interchangeable for every
+        # variable (e.g. the colours of graph colouring), and the solver only
+        # tries the values already used plus one unused value of this list.
+        self.interchangeable_values: Optional[List[Any]] = None
         
         # Adjacency list: Map variable -> List of constraints it is involved in
         # Crucial for efficient Forward Checking and AC-3
@@ -81,6 +118,12 @@ class CSP:
             if var in self.neighbors:
                 self.neighbors[var].append(constraint)
 
+    def remove_constraint(self, constraint: Constraint):
+        self.constraints.remove(constraint)
+        for var in constraint.variables:
+            if var in self.neighbors:
+                self.neighbors[var].remove(constraint)
+
     def is_consistent(self, var: str, value: Any, assignment: Dict[str, Any]) -> bool:
         """
         Checks if assigning `value` to `var` conflicts with any CURRENTLY
@@ -130,7 +173,7 @@ class CSPGenerator:
     ) -> CSP:
         
         # 1. Create Variables
-        variables = [chr(65 + i) for i in range(num_vars)]
+        variables = CSPGenerator.variable_names(num_vars)
         
         # 2. Create Diverse Domains
         domains = {}
@@ -165,6 +208,22 @@ class CSPGenerator:
             
         return model
 
+    @staticmethod
+    def variable_names(num_vars: int) -> List[str]:
+        """
+        Spreadsheet-style names: A..Z, then AA, AB, ... so that models with
+        more than 26 variables still get unique names.
+        """
+        names = []
+        for i in range(num_vars):
+            name = ''
+            i += 1
+            while i > 0:
+                i, rem = divmod(i - 1, 26)
+                name = chr(65 + rem) + name
+            names.append(name)
+        return names
+
     # --- Updated Helper to respect data types ---
 
     @staticmethod
@@ -216,14 +275,17 @@ class CSPGenerator:
         target_edges = int(max_edges * density)
         target_edges = max(target_edges, n - 1)
 
-        while len(model.constraints) < target_edges:
-            v1, v2 = random.sample(vars, 2)
-            edge_key = tuple(sorted((v1, v2)))
-            if edge_key not in existing_edges:
-                c = CSPGenerator._get_random_binary_constraint(v1, v2, allow_ineq)
-                model.add_constraint(c)
-                existing_edges.add(edge_key)
-
+        # Sample the missing edges directly from the complement of the tree
+        # instead of rejection sampling, which stalls as density approaches 1.
+        remaining = [
+            (vars[i], vars[j])
+            for i in range(n) for j in range(i + 1, n)
+            if tuple(sorted((vars[i], vars[j]))) not in existing_edges
+        ]
+        for v1, v2 in random.sample(remaining, max(0, target_edges - len(model.constraints))):
+            c = CSPGenerator._get_random_binary_constraint(v1, v2, allow_ineq)
+            model.add_constraint(c)
+            existing_edges.add(tuple(sorted((v1, v2))))
                 
 # --- Quick Test ---
 if __name__ == "__main__":
@@ -0,0 +1,221 @@
+import math
+import time
+from typing import Dict, List, Any, Optional, Generator, Tuple
+
+from .model import CSP, SoftConstraint
+
+# ==========================================
+# Weighted CSP Optimisation (Branch and Bound)
+# ==========================================
+#
+# Every binary constraint becomes a cost function: hard constraints cost
+# infinity when violated, SoftConstraint costs its weight. The optimiser is a
+# depth-first branch and bound that minimises the total cost.
+#
+# Lower bound at each node (soft arc consistency, AC* style):
+#   1. Assigned variables are conditioned away: constraints between two
+#      assigned variables go into the constant cost c0, constraints between an
+#      assigned and an unassigned variable become unary costs.
+#   2. Every binary cost function between unassigned variables projects its
+#      row minima onto the unary costs of both ends.
+#   3. Every unary cost function projects its minimum onto c0.
+#   4. A value with c0 + unary cost >= best known cost is pruned (node
+#      consistency); if that happens, 2-3 are repeated on the smaller domains.
+# Projections only move cost around, so c0 never exceeds the cost of the best
+# completion and is a valid lower bound.
+
+INF = math.inf
+
+def _cost_tables(csp: CSP) -> Dict[Tuple[str, str], List[List[float]]]:
+    """table[(x, y)][i][j] = total cost of x = domains[x][i], y = domains[y][j]."""
+    tables = {}
+    for c in csp.constraints:
+        x, y = c.var1, c.var2
+        dx, dy = csp.domains[x], csp.domains[y]
+        if (x, y) not in tables:
+            tables[(x, y)] = [[0] * len(dy) for _ in dx]
+            tables[(y, x)] = [[0] * len(dx) for _ in dy]
+        for i, a in enumerate(dx):
+            for j, b in enumerate(dy):
+                if isinstance(c, SoftConstraint):
+                    cost = c.cost(a, b)
+                else:
+                    cost = 0 if c.check(a, b) else INF
+                tables[(x, y)][i][j] += cost
+                tables[(y, x)][j][i] += cost
+    return tables
+
+def assignment_cost(csp: CSP, assignment: Dict[str, Any]) -> float:
+    """Total cost of a complete assignment (infinity if a hard constraint is broken)."""
+    total = 0
+    for c in csp.constraints:
+        a, b = assignment[c.var1], assignment[c.var2]
+        if isinstance(c, SoftConstraint):
+            total += c.cost(a, b)
+        elif not c.check(a, b):
+            return INF
+    return total
+
+def soft_arc_consistency(
+    csp: CSP,
+    tables: Dict[Tuple[str, str], List[List[float]]],
+    assignment: Dict[str, int],
+    domains: Dict[str, List[int]],
+    upper_bound: float,
+) -> Tuple[float, Dict[str, Dict[int, float]], bool]:
+    """
+    Computes the AC* lower bound at a node and prunes `domains` (value
+    indices of unassigned variables) in place.
+
+    Returns: (lower bound c0, unary costs per unassigned variable, feasible)
+    """
+    neighbors = {}
+    for (x, y) in tables:
+        neighbors.setdefault(x, []).append(y)
+
+    c0 = 0
+    unary = {x: {i: 0 for i in domains[x]} for x in domains}
+
+    # 1. Condition on the assignment
+    for x, i in assignment.items():
+        for y in neighbors.get(x, []):
+            if y in assignment:
+                if x < y:
+                    c0 += tables[(x, y)][i][assignment[y]]
+            else:
+                row = tables[(x, y)][i]
+                for j in domains[y]:
+                    unary[y][j] += row[j]
+    if c0 >= upper_bound:
+        return c0, unary, False
+
+    # Residual copies of the binary tables between unassigned variables
+    residual = {}
+    for (x, y), table in tables.items():
+        if x in domains and y in domains and x < y:
+            residual[(x, y)] = [row[:] for row in table]
+
+    changed = True
+    while changed:
+        changed = False
+
+        # 2. Binary -> unary projections (both directions)
+        for (x, y), table in residual.items():
+            for i in domains[x]:
+                alpha = min(table[i][j] for j in domains[y])
+                if alpha == INF:
+                    unary[x][i] = INF  # no support at all: pruned below
+                elif alpha > 0:
+                    unary[x][i] += alpha
+                    for j in domains[y]:
+                        table[i][j] -= alpha
+            for j in domains[y]:
+                alpha = min(table[i][j] for i in domains[x])
+                if alpha == INF:
+                    unary[y][j] = INF
+                elif alpha > 0:
+                    unary[y][j] += alpha
+                    for i in domains[x]:
+                        table[i][j] -= alpha
+
+        # 3. Unary -> c0 projections
+        for x, costs in unary.items():
+            beta = min(costs[i] for i in domains[x])
+            if beta > 0:
+                c0 += beta
+                for i in domains[x]:
+                    costs[i] -= beta
+        if c0 >= upper_bound:
+            return c0, unary, False
+
+        # 4. Node consistency
+        for x in domains:
+            kept = [i for i in domains[x] if c0 + unary[x][i] < upper_bound]
+            if not kept:
+                return c0, unary, False
+            if len(kept) < len(domains[x]):
+                domains[x] = kept
+                changed = True
+
+    return c0, unary, True
+
+def branch_and_bound(
+    csp: CSP,
+    time_limit: Optional[float] = None,
+    upper_bound: float = INF,
+) -> Generator[Tuple[str, Dict[str, Any], float], None, Tuple[Optional[Dict[str, Any]], float, bool]]:
+    """
+    Depth-first branch and bound over the weighted CSP. Yields
+    ("IMPROVED", assignment, cost) every time a cheaper solution is found, so
+    callers always have the current best at hand.
+
+    Returns: (best assignment, best cost, proven optimal). `proven` is False
+    when the time limit stopped the search early.
+    """
+    tables = _cost_tables(csp)
+    deadline = time.time() + time_limit if time_limit is not None else None
+    best: Optional[Dict[str, Any]] = None
+    best_cost = upper_bound
+    timed_out = False
+
+    degree = {v: len(csp.neighbors[v]) for v in csp.variables}
+
+    def search(assignment: Dict[str, int], domains: Dict[str, List[int]]):
+        nonlocal best, best_cost, timed_out
+        if deadline is not None and time.time() > deadline:
+            timed_out = True
+            return
+
+        lb, unary, feasible = soft_arc_consistency(csp, tables, assignment, domains, best_cost)
+        if not feasible:
+            return
+
+        if not domains:
+            solution = {v: csp.domains[v][i] for v, i in assignment.items()}
+            best, best_cost = solution, lb
+            yield ("IMPROVED", dict(solution), lb)
+            return
+
+        # Smallest domain first, most constrained (degree) on ties, then alphabetical
+        var = min(domains, key=lambda v: (len(domains[v]), -degree[v], v))
+        for i in sorted(domains[var], key=lambda i: unary[var][i]):
+            if lb + unary[var][i] >= best_cost:
+                continue
+            child_domains = {v: list(d) for v, d in domains.items() if v != var}
+            child_assignment = dict(assignment)
+            child_assignment[var] = i
+            yield from search(child_assignment, child_domains)
+            if timed_out:
+                return
+
+    initial = {v: list(range(len(csp.domains[v]))) for v in csp.variables}
+    yield from search({}, initial)
+    return best, best_cost, not timed_out
+
+def solve_weighted(csp: CSP, time_limit: Optional[float] = 10.0, on_improvement=None) -> Dict[str, Any]:
+    """
+    Minimises the total soft-constraint cost within `time_limit` seconds.
+    `on_improvement(assignment, cost)` is called for every new best solution.
+
+    Returns: dict with 'solution', 'cost', 'optimal', 'improvements', 'time'.
+    """
+    start = time.time()
+    improvements = 0
+    gen = branch_and_bound(csp, time_limit)
+    while True:
+        try:
+            _, assignment, cost = next(gen)
+        except StopIteration as stop:
+            best, best_cost, proven = stop.value
+            break
+        improvements += 1
+        if on_improvement is not None:
+            on_improvement(assignment, cost)
+
+    return {
+        'solution': best,
+        'cost': best_cost,
+        'optimal': proven,
+        'improvements': improvements,
+        'time': time.time() - start,
+    }
@@ -0,0 +1,469 @@
+import heapq
+import time
+from typing import Dict, List, Any, Optional, Generator, Tuple
+
+from .model import CSP, RelationConstraint
+
+# ==========================================
+# 1. CDCL SAT Solver
+# ==========================================
+#
+# Literals are non-zero ints in DIMACS style: v is "variable v is true",
+# -v is "variable v is false". The solver implements the usual modern
+# ingredients:
+#   - two watched literals per clause (unit propagation without scanning)
+#   - first-UIP conflict analysis with clause learning and local minimisation
+#   - non-chronological backjumping
+#   - VSIDS variable activities (lazy heap) and phase saving
+#   - Luby restarts
+
+def luby(i: int) -> int:
+    """The i-th element (1-based) of the Luby sequence 1 1 2 1 1 2 4 1 1 2 ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        if (1 << (k - 1)) - 1 < i:
+            i -= (1 << (k - 1)) - 1
+            k = 1
+            while (1 << k) - 1 < i:
+                k += 1
+        else:
+            k -= 1
+    return 1 << (k - 1)
+
+class CDCLSolver:
+    """
+    Usage:
+        solver = CDCLSolver(3, [[1, -2], [2, 3], [-1, -3]])
+        if solver.solve():
+            solver.model   # {1: True, 2: ..., 3: ...}
+    """
+    RESTART_BASE = 100
+    VAR_DECAY = 0.95
+
+    def __init__(self, num_vars: int, clauses: List[List[int]]):
+        self.num_vars = num_vars
+        self.clauses: List[List[int]] = []
+        self.watches: List[List[int]] = [[] for _ in range(2 * num_vars + 2)]
+        self.units: List[int] = []
+        self.ok = True
+
+        self.value = [0] * (num_vars + 1)       # 1 true, -1 false, 0 unassigned
+        self.level = [0] * (num_vars + 1)
+        self.reason: List[Optional[int]] = [None] * (num_vars + 1)
+        self.trail: List[int] = []
+        self.trail_lim: List[int] = []
+        self.qhead = 0
+
+        self.activity = [0.0] * (num_vars + 1)
+        self.var_inc = 1.0
+        self.phase = [False] * (num_vars + 1)
+        self.heap = [(0.0, v) for v in range(1, num_vars + 1)]
+
+        self.model: Dict[int, bool] = {}
+        self.stats = {'decisions': 0, 'conflicts': 0, 'propagations': 0, 'restarts': 0, 'learned': 0}
+
+        for clause in clauses:
+            self.add_clause(clause)
+
+    @staticmethod
+    def _idx(lit: int) -> int:
+        return 2 * lit if lit > 0 else -2 * lit + 1
+
+    def _lit_value(self, lit: int) -> int:
+        v = self.value[abs(lit)]
+        return v if lit > 0 else -v
+
+    def add_clause(self, clause: List[int]):
+        """Adds an input clause (only before `solve`)."""
+        lits = list(dict.fromkeys(clause))
+        if any(-lit in lits for lit in lits):
+            return  # tautology
+        if not lits:
+            self.ok = False
+        elif len(lits) == 1:
+            self.units.append(lits[0])
+        else:
+            self._attach(lits)
+
+    def _attach(self, lits: List[int]) -> int:
+        ci = len(self.clauses)
+        self.clauses.append(lits)
+        self.watches[self._idx(lits[0])].append(ci)
+        self.watches[self._idx(lits[1])].append(ci)
+        return ci
+
+    def _enqueue(self, lit: int, reason: Optional[int]):
+        v = abs(lit)
+        self.value[v] = 1 if lit > 0 else -1
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def _propagate(self) -> Optional[int]:
+        """Unit propagation; returns the index of a conflicting clause or None."""
+        clauses, watches, value = self.clauses, self.watches, self.value
+        while self.qhead < len(self.trail):
+            p = self.trail[self.qhead]
+            self.qhead += 1
+            self.stats['propagations'] += 1
+            false_lit = -p
+            watch_list = watches[self._idx(false_lit)]
+            kept = []
+            conflict = None
+            for pos, ci in enumerate(watch_list):
+                c = clauses[ci]
+                if c[0] == false_lit:
+                    c[0], c[1] = c[1], c[0]
+                first = c[0]
+                first_val = value[abs(first)] if first > 0 else -value[abs(first)]
+                if first_val == 1:
+                    kept.append(ci)
+                    continue
+                # Look for a new literal to watch
+                for k in range(2, len(c)):
+                    lit = c[k]
+                    if (value[abs(lit)] if lit > 0 else -value[abs(lit)]) != -1:
+                        c[1], c[k] = c[k], c[1]
+                        watches[self._idx(c[1])].append(ci)
+                        break
+                else:
+                    kept.append(ci)
+                    if first_val == -1:
+                        conflict = ci
+                        kept.extend(watch_list[pos + 1:])
+                        break
+                    self._enqueue(first, ci)
+            watches[self._idx(false_lit)] = kept
+            if conflict is not None:
+                return conflict
+        return None
+
+    def _bump(self, v: int):
+        self.activity[v] += self.var_inc
+        if self.activity[v] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[u], u) for u in range(1, self.num_vars + 1) if self.value[u] == 0]
+            heapq.heapify(self.heap)
+        elif self.value[v] == 0:
+            heapq.heappush(self.heap, (-self.activity[v], v))
+
+    def _analyze(self, conflict: int) -> Tuple[List[int], int]:
+        """First-UIP learning. Returns (learned clause, backjump level)."""
+        current = len(self.trail_lim)
+        seen = set()
+        learnt = [0]
+        counter = 0
+        p = None
+        index = len(self.trail) - 1
+        clause = self.clauses[conflict]
+
+        while True:
+            for q in clause:
+                if q == p:
+                    continue
+                v = abs(q)
+                if v not in seen and self.level[v] > 0:
+                    seen.add(v)
+                    self._bump(v)
+                    if self.level[v] == current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            p = self.trail[index]
+            index -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self.clauses[self.reason[abs(p)]]
+        learnt[0] = -p
+
+        # Local minimisation: drop literals implied by the rest of the clause
+        marked = {abs(q) for q in learnt}
+        minimized = [learnt[0]]
+        for q in learnt[1:]:
+            r = self.reason[abs(q)]
+            if r is None or any(abs(x) not in marked and self.level[abs(x)] > 0
+                                for x in self.clauses[r] if abs(x) != abs(q)):
+                minimized.append(q)
+        learnt = minimized
+
+        if len(learnt) == 1:
+            return learnt, 0
+        # Watch the highest-level literal among the rest
+        best = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def _cancel_until(self, level: int):
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            v = abs(lit)
+            self.phase[v] = lit > 0
+            self.value[v] = 0
+            self.reason[v] = None
+            heapq.heappush(self.heap, (-self.activity[v], v))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _pick_branch_var(self) -> Optional[int]:
+        while self.heap:
+            _, v = heapq.heappop(self.heap)
+            if self.value[v] == 0:
+                return v
+        return None
+
+    def solve(self, time_limit: Optional[float] = None) -> Optional[bool]:
+        """
+        Returns True (model in `self.model`), False (unsatisfiable) or None
+        if the time limit was reached first.
+        """
+        if not self.ok:
+            return False
+        for lit in self.units:
+            val = self._lit_value(lit)
+            if val == -1:
+                return False
+            if val == 0:
+                self._enqueue(lit, None)
+        if self._propagate() is not None:
+            return False
+
+        deadline = time.time() + time_limit if time_limit is not None else None
+        restart = 1
+        budget = self.RESTART_BASE * luby(restart)
+        conflicts_here = 0
+
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.stats['conflicts'] += 1
+                conflicts_here += 1
+                if not self.trail_lim:
+                    return False
+                learnt, back_level = self._analyze(conflict)
+                self._cancel_until(back_level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._enqueue(learnt[0], self._attach(learnt))
+                    self.stats['learned'] += 1
+                self.var_inc /= self.VAR_DECAY
+
+                if deadline is not None and self.stats['conflicts'] % 100 == 0 and time.time() > deadline:
+                    self._cancel_until(0)
+                    return None
+                if conflicts_here >= budget:
+                    self._cancel_until(0)
+                    self.stats['restarts'] += 1
+                    restart += 1
+                    budget = self.RESTART_BASE * luby(restart)
+                    conflicts_here = 0
+            else:
+                v = self._pick_branch_var()
+                if v is None:
+                    self.model = {u: self.value[u] == 1 for u in range(1, self.num_vars + 1)}
+                    return True
+                self.stats['decisions'] += 1
+                self.trail_lim.append(len(self.trail))
+                self._enqueue(v if self.phase[v] else -v, None)
+
+# ==========================================
+# 2. CSP -> CNF Encodings
+# ==========================================
+#
+# direct: one boolean per (variable, value); exactly-one per variable; one
+#         clause per forbidden value pair. Works for any domain.
+# order:  one boolean [x <= a] per value but the largest; chains
+#         [x <= a_i] -> [x <= a_(i+1)]. Comparison operators become one
+#         clause per value instead of one per forbidden pair. Numeric
+#         domains only.
+
+class CSPEncoder:
+    """Builds the CNF of a CSP and decodes SAT models back to assignments."""
+
+    def __init__(self, csp: CSP, encoding: str = 'auto'):
+        if encoding == 'auto':
+            numeric = all(isinstance(a, (int, float)) for vals in csp.domains.values() for a in vals)
+            encoding = 'order' if numeric else 'direct'
+        if encoding not in ('direct', 'order'):
+            raise ValueError(f"Unknown encoding: {encoding}")
+        self.csp = csp
+        self.encoding = encoding
+        self.num_vars = 0
+        self.clauses: List[List[int]] = []
+        self.values = {v: sorted(set(csp.domains[v])) if encoding == 'order' else list(csp.domains[v])
+                       for v in csp.variables}
+        self.lits: Dict[str, List[int]] = {}
+
+        if encoding == 'direct':
+            self._encode_direct()
+        else:
+            self._encode_order()
+
+    def _new_var(self) -> int:
+        self.num_vars += 1
+        return self.num_vars
+
+    def _add(self, clause: List[Any]):
+        """Adds a clause whose items may be the constants True / False."""
+        if any(lit is True for lit in clause):
+            return
+        self.clauses.append([lit for lit in clause if lit is not False])
+
+    # --- direct ---
+
+    def _encode_direct(self):
+        for v in self.csp.variables:
+            lits = [self._new_var() for _ in self.values[v]]
+            self.lits[v] = lits
+            self.clauses.append(list(lits))
+            for i in range(len(lits)):
+                for j in range(i + 1, len(lits)):
+                    self.clauses.append([-lits[i], -lits[j]])
+        for c in self.csp.constraints:
+            for i, a in enumerate(self.values[c.var1]):
+                for j, b in enumerate(self.values[c.var2]):
+                    if not c.check(a, b):
+                        self.clauses.append([-self.lits[c.var1][i], -self.lits[c.var2][j]])
+
+    # --- order ---
+
+    def _encode_order(self):
+        for v in self.csp.variables:
+            lits = [self._new_var() for _ in self.values[v][:-1]]
+            self.lits[v] = lits
+            for i in range(len(lits) - 1):
+                self.clauses.append([-lits[i], lits[i + 1]])
+            if not self.values[v]:
+                self.clauses.append([])
+
+        for c in self.csp.constraints:
+            x, y = c.var1, c.var2
+            if isinstance(c, RelationConstraint) or c.op == '!=':
+                for a in self.values[x]:
+                    for b in self.values[y]:
+                        if not c.check(a, b):
+                            self._forbid(x, a, y, b)
+            elif c.op in ('<=', '>=', '<', '>', '=='):
+                if c.op in ('<=', '=='):
+                    self._leq(x, y, strict=False)
+                if c.op in ('>=', '=='):
+                    self._leq(y, x, strict=False)
+                if c.op == '<':
+                    self._leq(x, y, strict=True)
+                if c.op == '>':
+                    self._leq(y, x, strict=True)
+            else:
+                for a in self.values[x]:
+                    for b in self.values[y]:
+                        if not c.check(a, b):
+                            self._forbid(x, a, y, b)
+
+    def le(self, var: str, c: Any):
+        """Literal for [var <= c], or the constant True / False."""
+        vals = self.values[var]
+        idx = None
+        for i, a in enumerate(vals):
+            if a <= c:
+                idx = i
+            else:
+                break
+        if idx is None:
+            return False
+        if idx == len(vals) - 1:
+            return True
+        return self.lits[var][idx]
+
+    def lt(self, var: str, c: Any):
+        """Literal for [var < c], or the constant True / False."""
+        vals = self.values[var]
+        below = [i for i, a in enumerate(vals) if a < c]
+        if not below:
+            return False
+        if below[-1] == len(vals) - 1:
+            return True
+        return self.lits[var][below[-1]]
+
+    @staticmethod
+    def _neg(lit):
+        if lit is True or lit is False:
+            return not lit
+        return -lit
+
+    def _leq(self, x: str, y: str, strict: bool):
+        """x <= y (or x < y): for every value b of y, [y <= b] -> [x <= b] ([x < b])."""
+        for b in self.values[y]:
+            head = self.lt(x, b) if strict else self.le(x, b)
+            self._add([self._neg(self.le(y, b)), head])
+
+    def _forbid(self, x: str, a: Any, y: str, b: Any):
+        """not (x == a and y == b)."""
+        self._add([self._neg(self.le(x, a)), self.lt(x, a), self._neg(self.le(y, b)), self.lt(y, b)])
+
+    def fix(self, var: str, value: Any):
+        """Adds unit clauses forcing var == value."""
+        if self.encoding == 'direct':
+            self.clauses.append([self.lits[var][self.values[var].index(value)]])
+        else:
+            self._add([self.le(var, value)])
+            self._add([self._neg(self.lt(var, value))])
+
+    # --- decoding ---
+
+    def decode(self, model: Dict[int, bool]) -> Dict[str, Any]:
+        assignment = {}
+        for v in self.csp.variables:
+            vals, lits = self.values[v], self.lits[v]
+            if self.encoding == 'direct':
+                assignment[v] = next(a for a, lit in zip(vals, lits) if model[lit])
+            else:
+                assignment[v] = next((a for a, lit in zip(vals, lits) if model[lit]), vals[-1])
+        return assignment
+
+# ==========================================
+# 3. Solver Entry Point
+# ==========================================
+
+def solve_sat(
+    csp: CSP,
+    assignment: Dict[str, Any] = None,
+    encoding: str = 'auto',
+    time_limit: Optional[float] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Generator[Tuple[str, Dict, Dict], None, Optional[Dict]]:
+    """
+    Solves `csp` by compiling it to CNF and running the CDCL solver. Follows
+    the event protocol of `solve_step_by_step`: yields a single
+    ("SOLUTION", assignment, domains) event when a solution exists.
+
+    The generator returns None both when the CSP is unsatisfiable and when
+    `time_limit` ran out: `stats`, if given, receives the CDCL counters and
+    'status' ('sat', 'unsat' or 'limit') to tell them apart.
+    """
+    if stats is None:
+        stats = {}
+    encoder = CSPEncoder(csp, encoding)
+    for var, value in (assignment or {}).items():
+        if value not in encoder.values[var]:
+            stats['status'] = 'unsat'
+            return None
+        encoder.fix(var, value)
+
+    solver = CDCLSolver(encoder.num_vars, encoder.clauses)
+    outcome = solver.solve(time_limit)
+    stats.update(solver.stats)
+    stats['status'] = {True: 'sat', False: 'unsat', None: 'limit'}[outcome]
+    if not outcome:
+        return None
+
+    solution = encoder.decode(solver.model)
+    yield ("SOLUTION", solution, {v: [val] for v, val in solution.items()})
+    return solution
@@ -1,11 +1,13 @@
 import copy
 from typing import Dict, List, Any, Optional, Generator, Tuple
 from .model import CSP
+from .sat import solve_sat
 
-def revise(csp: CSP, xi: str, xj: str, domains: Dict[str, List[Any]]) -> bool:
+def revise(csp: CSP, xi: str, xj: str, domains: Dict[str, List[Any]], trail: Dict[str, List[Any]] = None) -> bool:
     """
     Checks if there is any value in domains[xi] that conflicts with ALL values in domains[xj].
     If so, removes the conflicting value from domains[xi].
+    If `trail` is given, removed values are also recorded there (var -> values).
     
     Returns: True if domains[xi] was modified.
     """
@@ -35,11 +37,13 @@ def revise(csp: CSP, xi: str, xj: str, domains: Dict[str, List[Any]]) -> bool:
         # If no value y allows x to exist, delete x
         if not satisfiable:
             domains[xi].remove(x_val)
+            if trail is not None:
+                trail.setdefault(xi, []).append(x_val)
             revised = True
             
     return revised
 
-def ac3_inference(csp: CSP, queue: List[Tuple[str, str]], domains: Dict[str, List[Any]]) -> bool:
+def ac3_inference(csp: CSP, queue: List[Tuple[str, str]], domains: Dict[str, List[Any]], trail: Dict[str, List[Any]] = None) -> bool:
     """
     The AC-3 Algorithm.
     Propagates constraints until consistency is reached or a domain becomes empty.
@@ -47,11 +51,12 @@ def ac3_inference(csp: CSP, queue: List[Tuple[str, str]], domains: Dict[str, Lis
     Args:
         queue: Initial list of arcs (xi, xj) to check.
         domains: The current domain state (will be modified in place).
+        trail: Optional dict collecting the removed values (var -> values).
     """
     while queue:
         (xi, xj) = queue.pop(0)
         
-        if revise(csp, xi, xj, domains):
+        if revise(csp, xi, xj, domains, trail):
             if not domains[xi]: # Domain became empty -> Failure
                 return False
             
@@ -66,6 +71,12 @@ def ac3_inference(csp: CSP, queue: List[Tuple[str, str]], domains: Dict[str, Lis
                     
     return True
 
+# Strategies understood by `solve_step_by_step` (the benchmark runner iterates these).
+# 'SAT' hands the whole problem to the CDCL backend, so the heuristic is ignored.
+HEURISTICS = ('first', 'MRV')
+INFERENCES = ('FC', 'AC3', 'SAT')
+PREPROCESSING = ((), ('SAC',))
+
 def select_unassigned_variable(assignment: Dict[str, Any], csp: CSP, heuristic: str = 'MRV') -> str:
     """
     Selects the next variable to assign.
@@ -89,9 +100,10 @@ def select_unassigned_variable(assignment: Dict[str, Any], csp: CSP, heuristic:
         
     return unassigned[0]
 
-def forward_checking(csp: CSP, var: str, value: Any, domains: Dict[str, List[Any]]) -> bool:
+def forward_checking(csp: CSP, var: str, value: Any, domains: Dict[str, List[Any]], trail: Dict[str, List[Any]] = None) -> bool:
     """
     Updates `domains` by removing values inconsistent with `var = value`.
+    If `trail` is given, removed values are also recorded there (var -> values).
     Returns False if any domain becomes empty (failure), True otherwise.
     """
     # Find neighbors of the current variable
@@ -121,6 +133,8 @@ def forward_checking(csp: CSP, var: str, value: Any, domains: Dict[str, List[Any
             temp_assignment = {var: value, neighbor: n_val}
             if not constraint.satisfied(temp_assignment):
                 domains[neighbor].remove(n_val)
+                if trail is not None:
+                    trail.setdefault(neighbor, []).append(n_val)
         
         if not domains[neighbor]: # Domain became empty!
             return False
@@ -131,13 +145,70 @@ def forward_checking(csp: CSP, var: str, value: Any, domains: Dict[str, List[Any
 # 2. The Generator Solver
 # ==========================================
 
+def order_values(csp: CSP, domain: List[Any], assignment: Dict[str, Any]) -> List[Any]:
+    """
+    Values to try for a variable, in order. Normally the sorted domain.
+
+    With interchangeable values (csp.interchangeable_values, e.g. colours),
+    the unused values are symmetric: a dead end under one of them is a dead
+    end under all of them. Only the used values (sorted) and the first unused
+    value of the list are tried, so each subtree is explored once instead of
+    once per permutation of the unused values. If the first unused value has
+    been pruned from this domain, no unused value can work here.
+    """
+    values = sorted(domain)
+    palette = csp.interchangeable_values
+    if not palette:
+        return values
+    used = set(assignment.values())
+    new = next((v for v in palette if v not in used), None)
+    ordered = [v for v in values if v in used]
+    if new is not None and new in domain:
+        ordered.append(new)
+    return ordered
+
 def solve_step_by_step(
     csp: CSP, 
     assignment: Dict[str, Any] = None, 
     heuristic: str = 'MRV', 
-    inference: str = 'FC'
+    inference: str = 'FC',
+    trace: str = 'full',
+    checkpoint_interval: int = 1000,
+    preprocess: Tuple[str, ...] = (),
+    time_limit: Optional[float] = None,
+    stats: Optional[Dict[str, Any]] = None
 ) -> Generator[Tuple[str, Dict, Dict], None, Optional[Dict]]:
-    
+    """
+    Backtracking search that yields an event after every assignment attempt.
+
+    inference: 'FC', 'AC3', or 'SAT' (compile to CNF and run the CDCL solver).
+    preprocess: consistency passes run once before the search (see
+    `consistency.preprocess`: 'AC3', 'SAC', 'PC2'); if one proves the model
+    inconsistent, no event is yielded.
+    time_limit, stats: for inference='SAT' (see `solve_sat`): the CDCL time
+    budget, and a dict that receives 'status' ('sat', 'unsat', 'limit') and
+    the CDCL counters. A model refuted by preprocessing gets 'unsat'.
+    trace='full' (default): every event is (kind, assignment, domains) with a
+    full copy of the state.
+    trace='delta': events only carry what changed (see `solve_with_delta_trace`),
+    which keeps long traces small; use `rebuild_state` to get a full state back.
+    """
+    if preprocess:
+        # Imported here: consistency builds on this module's AC-3
+        from .consistency import preprocess as run_passes
+        csp, reports = run_passes(csp, preprocess)
+        if not reports[-1]['consistent']:
+            if stats is not None:
+                stats['status'] = 'unsat'
+            return None
+
+    if inference == 'SAT':
+        # Compiled to CNF and solved by CDCL: a single SOLUTION event, no search trace
+        return (yield from solve_sat(csp, assignment, time_limit=time_limit, stats=stats))
+
+    if trace == 'delta':
+        return (yield from solve_with_delta_trace(csp, assignment, heuristic, inference, checkpoint_interval))
+
     if assignment is None:
         assignment = {}
 
@@ -150,7 +221,7 @@ def solve_step_by_step(
     var = select_unassigned_variable(assignment, csp, heuristic)
 
     # 3. Value Ordering
-    ordered_values = sorted(csp.domains[var])
+    ordered_values = order_values(csp, csp.domains[var], assignment)
 
     for value in ordered_values:
         
@@ -200,3 +271,125 @@ def solve_step_by_step(
             yield ("BACKTRACK", new_assignment, new_domains)
     
     return None
+
+# ==========================================
+# 3. Delta-Encoded Trace
+# ==========================================
+#
+# Event format (trace='delta'):
+#   ("CHECKPOINT", assignment, domains)  full copy; the first event, then one
+#                                         every `checkpoint_interval` events
+#   ("STEP", {var: value}, removed)       var assigned; removed = {var: [values]}
+#                                         pruned by the assignment + inference
+#   ("BACKTRACK", {var: value}, restored) var unassigned; restored = {var: [values]}
+#                                         put back into the domains
+#   ("SOLUTION", assignment, domains)     full copy
+#
+# The state after a BACKTRACK is the parent state (in the full trace, the
+# BACKTRACK event shows the abandoned child). A BACKTRACK with an empty
+# `restored` dict is a value whose inference failed before any STEP.
+
+def solve_with_delta_trace(
+    csp: CSP,
+    assignment: Dict[str, Any] = None,
+    heuristic: str = 'MRV',
+    inference: str = 'FC',
+    checkpoint_interval: int = 1000
+) -> Generator[Tuple[str, Dict, Dict], None, Optional[Dict]]:
+    """
+    Same search as `solve_step_by_step`, but on a single set of domains that
+    is pruned and restored in place, yielding only the differences.
+    """
+    assignment = dict(assignment) if assignment else {}
+    domains = copy.deepcopy(csp.domains)
+    work_csp = copy.copy(csp)
+    work_csp.domains = domains
+    since_checkpoint = 0
+
+    yield ("CHECKPOINT", dict(assignment), copy.deepcopy(domains))
+
+    def checkpoint():
+        nonlocal since_checkpoint
+        since_checkpoint += 1
+        if since_checkpoint >= checkpoint_interval:
+            since_checkpoint = 0
+            yield ("CHECKPOINT", dict(assignment), copy.deepcopy(domains))
+
+    def search():
+        if len(assignment) == len(csp.variables):
+            yield ("SOLUTION", dict(assignment), copy.deepcopy(domains))
+            return dict(assignment)
+
+        var = select_unassigned_variable(assignment, work_csp, heuristic)
+
+        for value in order_values(csp, domains[var], assignment):
+            if not csp.is_consistent(var, value, assignment):
+                continue
+
+            # Everything removed from here on is recorded, so it can be undone
+            trail = {}
+            others = [v for v in domains[var] if v != value]
+            if others:
+                trail[var] = others
+            domains[var] = [value]
+
+            if inference == 'FC':
+                inference_success = forward_checking(csp, var, value, domains, trail)
+            elif inference == 'AC3':
+                queue = []
+                for constraint in csp.neighbors[var]:
+                    neighbor = constraint.var1 if constraint.var1 != var else constraint.var2
+                    if neighbor not in assignment:
+                        queue.append((neighbor, var))
+                inference_success = ac3_inference(csp, queue, domains, trail)
+            else:
+                inference_success = True
+
+            if inference_success:
+                assignment[var] = value
+                yield ("STEP", {var: value}, trail)
+                yield from checkpoint()
+
+                result = yield from search()
+                if result is not None:
+                    return result
+
+                del assignment[var]
+
+            for v, values in trail.items():
+                domains[v].extend(values)
+            yield ("BACKTRACK", {var: value}, trail if inference_success else {})
+            yield from checkpoint()
+
+        return None
+
+    return (yield from search())
+
+def rebuild_state(trace: List[Tuple[str, Dict, Dict]], index: int) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+    """
+    Rebuilds (assignment, domains) right after event `trace[index]` of a delta
+    trace, starting from the closest preceding checkpoint. Cost is bounded by
+    the checkpoint interval, not by the length of the trace.
+    """
+    start = index
+    while start >= 0 and trace[start][0] not in ("CHECKPOINT", "SOLUTION"):
+        start -= 1
+    if start < 0:
+        raise ValueError("No checkpoint before this event; is this a delta trace?")
+
+    _, base_assignment, base_domains = trace[start]
+    assignment = dict(base_assignment)
+    domains = {v: list(vals) for v, vals in base_domains.items()}
+
+    for kind, changed, delta in trace[start + 1:index + 1]:
+        if kind == "STEP":
+            assignment.update(changed)
+            for v, values in delta.items():
+                for val in values:
+                    domains[v].remove(val)
+        elif kind == "BACKTRACK":
+            for v in changed:
+                assignment.pop(v, None)
+            for v, values in delta.items():
+                domains[v].extend(values)
+    return assignment, domains
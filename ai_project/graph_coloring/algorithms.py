@@ -1,14 +1,17 @@
 import random
-import math
 import time
 from collections import deque
 
+from .graph import index_graph
+from .local_search import annealing
+
 class GraphColoringState:
-    def __init__(self, graph, colors, assignment=None):
+    def __init__(self, graph, colors, assignment=None, nodes=None):
         self.graph = graph
         self.colors = colors
         self.assignment = assignment if assignment is not None else {}
-        self.nodes = list(graph.keys())
+        # Children share the parent's node order instead of rebuilding it (O(n) per state)
+        self.nodes = nodes if nodes is not None else list(graph.keys())
 
     def is_goal(self):
         return len(self.assignment) == len(self.nodes) and self.is_valid()
@@ -29,11 +32,12 @@ class GraphColoringState:
         
         children = []
         for color in self.colors:
+            # Pruning invalid branches early: the parent is valid, so only the new node can clash
+            if any(self.assignment.get(neighbor) == color for neighbor in self.graph.get(next_node, [])):
+                continue
             new_assignment = self.assignment.copy()
             new_assignment[next_node] = color
-            child_state = GraphColoringState(self.graph, self.colors, new_assignment)
-            if child_state.is_valid(): # Pruning invalid branches early
-                children.append(child_state)
+            children.append(GraphColoringState(self.graph, self.colors, new_assignment, self.nodes))
         return children
 
     def __hash__(self):
@@ -44,42 +48,73 @@ class GraphColoringState:
         return self.assignment == other.assignment
 
 # --- Search Algorithms ---
+#
+# Nodes are coloured in a fixed order, so the state space is a tree and no
+# state is generated twice. `time_limit` is a wall-clock budget in seconds and
+# `max_nodes` bounds the number of expanded states (None = unbounded); when
+# either is reached the search gives up and returns None.
+
+class NodeBudgetExceeded(Exception):
+    pass
+
+def _out_of_budget(expanded, max_nodes, deadline):
+    return (max_nodes is not None and expanded > max_nodes) or (deadline is not None and time.time() > deadline)
 
-def bfs(graph, colors):
+def _deadline(time_limit):
+    return None if time_limit is None else time.time() + time_limit
+
+def bfs(graph, colors, max_nodes=None, time_limit=None):
+    deadline = _deadline(time_limit)
     start_state = GraphColoringState(graph, colors)
     if start_state.is_goal(): return start_state.assignment
 
     frontier = deque([start_state])
     # explored = set() # Optional for tree search structure here, but good for graph search
+    expanded = 0
     
     while frontier:
         state = frontier.popleft()
         if state.is_goal():
             return state.assignment
+        expanded += 1
+        if _out_of_budget(expanded, max_nodes, deadline):
+            return None
         
         for child in state.successors():
             frontier.append(child)
     return None
 
-def dfs(graph, colors):
+def dfs(graph, colors, max_nodes=None, time_limit=None):
+    deadline = _deadline(time_limit)
     start_state = GraphColoringState(graph, colors)
     stack = [start_state]
+    expanded = 0
     
     while stack:
         state = stack.pop()
         if state.is_goal():
             return state.assignment
+        expanded += 1
+        if _out_of_budget(expanded, max_nodes, deadline):
+            return None
         
         for child in state.successors():
             stack.append(child)
     return None
 
-def iddfs(graph, colors):
+def iddfs(graph, colors, max_nodes=None, time_limit=None):
+    deadline = _deadline(time_limit)
+    expanded = 0
+
     def dls(state, limit):
+        nonlocal expanded
         if state.is_goal():
             return state.assignment
         if limit == 0:
             return None
+        expanded += 1
+        if _out_of_budget(expanded, max_nodes, deadline):
+            raise NodeBudgetExceeded
         
         for child in state.successors():
             result = dls(child, limit - 1)
@@ -90,7 +125,10 @@ def iddfs(graph, colors):
     start_state = GraphColoringState(graph, colors)
     depth = 0
     while True:
-        result = dls(start_state, depth)
+        try:
+            result = dls(start_state, depth)
+        except NodeBudgetExceeded:
+            return None
         if result is not None:
             return result
         depth += 1
@@ -108,54 +146,24 @@ def count_conflicts(graph, assignment):
                     conflicts += 1
     return conflicts
 
-def simulated_annealing(graph, colors, max_steps=10000, initial_temp=100.0, cooling_rate=0.995):
-    nodes = list(graph.keys())
-    # Initial random assignment
-    current_assignment = {node: random.choice(colors) for node in nodes}
-    current_conflicts = count_conflicts(graph, current_assignment)
-    
-    best_assignment = current_assignment.copy()
-    best_conflicts = current_conflicts
-    
-    temp = initial_temp
-    
-    for step in range(max_steps):
-        if best_conflicts == 0:
-            return best_assignment
-            
-        if temp <= 0.001:
-            break
-
-        # Pick a random node and change its color
-        node = random.choice(nodes)
-        old_color = current_assignment[node]
-        new_color = random.choice(colors)
-        while new_color == old_color and len(colors) > 1:
-            new_color = random.choice(colors)
-            
-        next_assignment = current_assignment.copy()
-        next_assignment[node] = new_color
-        next_conflicts = count_conflicts(graph, next_assignment)
-        
-        delta = next_conflicts - current_conflicts
-        
-        if delta < 0 or random.random() < math.exp(-delta / temp):
-            current_assignment = next_assignment
-            current_conflicts = next_conflicts
-            
-            if current_conflicts < best_conflicts:
-                best_assignment = current_assignment.copy()
-                best_conflicts = current_conflicts
-        
-        temp *= cooling_rate
-        
-    return best_assignment # May not be optimal (0 conflicts)
+def simulated_annealing(graph, colors, max_steps=10000, initial_temp=100.0, cooling_rate=0.995, seed=None):
+    # Runs on the conflict table of local_search: O(1) move scoring, O(deg) updates
+    nodes, adj = index_graph(graph)
+    if not nodes or not colors:
+        return {}
+    rng = random.Random(seed)
+    initial = [rng.randrange(len(colors)) for _ in nodes]
+    best, _, _ = annealing(adj, len(colors), initial, max_steps=max_steps,
+                           initial_temp=initial_temp, cooling_rate=cooling_rate, rng=rng)
+    return {nodes[i]: colors[c] for i, c in enumerate(best)} # May not be optimal (0 conflicts)
 
 # --- MRV Backtracking ---
 
-def solve_coloring_mrv(graph, colors):
+def solve_coloring_mrv(graph, colors, max_nodes=None, time_limit=None):
+    deadline = _deadline(time_limit)
     nodes = list(graph.keys())
     assignment = {}
+    expanded = 0
     
     def get_valid_colors(node, current_assignment):
         valid = set(colors)
@@ -171,8 +179,12 @@ def solve_coloring_mrv(graph, colors):
         return min(unassigned, key=lambda n: len(get_valid_colors(n, assignment)))
 
     def backtrack():
+        nonlocal expanded
         if len(assignment) == len(nodes):
             return assignment
+        expanded += 1
+        if _out_of_budget(expanded, max_nodes, deadline):
+            raise NodeBudgetExceeded
         
         var = select_unassigned_variable(assignment)
         for value in get_valid_colors(var, assignment):
@@ -183,4 +195,7 @@ def solve_coloring_mrv(graph, colors):
             del assignment[var]
         return None
 
-    return backtrack()
+    try:
+        return backtrack()
+    except NodeBudgetExceeded:
+        return None
@@ -0,0 +1,232 @@
+import argparse
+import csv
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from ai_project.csp.solver import solve_step_by_step
+from .algorithms import bfs, dfs, iddfs, simulated_annealing, solve_coloring_mrv
+from .generators import (gnp_edges, geometric_edges, queen_edges, mycielski_edges, mycielski_nodes,
+                         planted_edges, to_adjacency)
+from .graph import colors_used, is_proper, load_graph
+from .greedy import dsatur, rlf, welsh_powell
+from .evolutionary import hybrid_evolutionary
+from .local_search import tabucol
+from .planner import graph_features, plan
+from .problem import create_coloring_problem
+
+# ==========================================
+# Graph Colouring Benchmark
+# ==========================================
+#
+# Runs every colouring algorithm on every instance of a corpus and records:
+#   solved       'yes' (proper colouring), 'no', 'limit' (capped by the
+#                planner's node budget) or 'skip' (planner: would not finish)
+#   colors       colours used by the colouring found
+#   time         median wall time over the timed repeats (after warm-up)
+#   peak_kb      peak traced memory of one extra run under tracemalloc
+#
+# Palette algorithms get the instance's palette (its known chromatic number,
+# or the DSATUR colour count for random graphs), and all of them stop at the
+# first proper colouring, so `time` is also the time to a valid colouring.
+# The randomised ones (SA, Tabucol, HEA) run with a fixed seed.
+#
+#   python -m ai_project.graph_coloring.benchmark --out results.csv
+#   python -m ai_project.graph_coloring.benchmark --baseline results.csv --time-tolerance 0.5
+
+FIELDS = ['instance', 'algorithm', 'nodes', 'edges', 'palette', 'solved', 'colors', 'time', 'peak_kb']
+
+# Exhaustive searches whose cost the planner checks first
+EXHAUSTIVE = ('BFS', 'DFS', 'IDDFS', 'MRV')
+
+
+def default_corpus(seed=0):
+    """(name, graph, palette size) for a small fixed set of the standard families."""
+    corpus = []
+
+    def add(name, n, edges, k=None):
+        graph = to_adjacency(n, edges)
+        corpus.append((name, graph, k if k is not None else colors_used(dsatur(graph))))
+
+    add("gnp_30_0.2", 30, gnp_edges(30, 0.2, seed=seed))
+    add("gnp_200_0.1", 200, gnp_edges(200, 0.1, seed=seed))
+    add("rgg_40_0.25", 40, geometric_edges(40, 0.25, seed=seed))
+    add("rgg_300_0.1", 300, geometric_edges(300, 0.1, seed=seed))
+    add("queen5_5", 25, queen_edges(5), 5)
+    add("queen6_6", 36, queen_edges(6), 7)
+    add("myciel3", mycielski_nodes(3), mycielski_edges(3), 3)
+    add("myciel4", mycielski_nodes(4), mycielski_edges(4), 4)
+    add("myciel5", mycielski_nodes(5), mycielski_edges(5), 5)
+    add("planted_60_3_0.15", 60, planted_edges(60, 3, 0.15, seed=seed), 3)
+    add("flat_90_4_0.3", 90, planted_edges(90, 4, 0.3, seed=seed, flat=True), 4)
+    return corpus
+
+
+def load_corpus(paths):
+    """Graph files (.col, .json, edge lists); the palette is the DSATUR colour count."""
+    corpus = []
+    for path in paths:
+        graph = load_graph(path)
+        corpus.append((os.path.basename(path), graph, colors_used(dsatur(graph))))
+    return corpus
+
+
+def _csp(graph, colors, max_nodes=None, symmetry_breaking=False):
+    csp = create_coloring_problem(graph, colors, symmetry_breaking=symmetry_breaking)
+    events = 0
+    for event, assignment, _ in solve_step_by_step(csp):
+        if event == 'SOLUTION':
+            return dict(assignment)
+        events += 1
+        if max_nodes is not None and events >= max_nodes:
+            return None
+    return None
+
+
+def _greedy(fn):
+    return lambda graph, colors, max_nodes=None: fn(graph)
+
+
+ALGORITHMS = {
+    'DSATUR': _greedy(dsatur),
+    'RLF': _greedy(rlf),
+    'Welsh-Powell': _greedy(welsh_powell),
+    'BFS': bfs,
+    'DFS': dfs,
+    'IDDFS': iddfs,
+    'MRV': solve_coloring_mrv,
+    'Simulated Annealing': lambda graph, colors, max_nodes=None: simulated_annealing(graph, colors, seed=0),
+    'Tabucol': lambda graph, colors, max_nodes=None: tabucol(graph, colors, time_limit=10.0, seed=0),
+    'Evolutiv (HEA)': lambda graph, colors, max_nodes=None: hybrid_evolutionary(
+        graph, colors, time_limit=10.0, workers=1, seed=0)['coloring'],
+    'CSP (MRV+FC)': _csp,
+    'CSP (MRV+FC+SB)': lambda graph, colors, max_nodes=None: _csp(graph, colors, max_nodes, symmetry_breaking=True),
+}
+
+
+def run_once(graph, colors, name, max_nodes):
+    start = time.perf_counter()
+    coloring = ALGORITHMS[name](graph, colors, max_nodes=max_nodes)
+    elapsed = time.perf_counter() - start
+    valid = bool(coloring) and is_proper(graph, coloring)
+    return {
+        'solved': 'yes' if valid else ('limit' if max_nodes is not None else 'no'),
+        'colors': colors_used(coloring) if valid else '',
+        'time': elapsed,
+    }
+
+
+def measure(graph, colors, name, max_nodes, warmup, repeats):
+    for _ in range(warmup):
+        run_once(graph, colors, name, max_nodes)
+    runs = [run_once(graph, colors, name, max_nodes) for _ in range(repeats)]
+    result = dict(runs[0])
+    result['time'] = statistics.median(r['time'] for r in runs)
+
+    tracemalloc.start()
+    run_once(graph, colors, name, max_nodes)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result['peak_kb'] = peak / 1024
+    return result
+
+
+def run_corpus(corpus, algorithms=tuple(ALGORITHMS), warmup=1, repeats=3, budget=2.0):
+    rows = []
+    for name, graph, k in corpus:
+        colors = list(range(k))
+        features = graph_features(graph, colors)
+        planned = {e['algorithm']: e for e in plan(features, EXHAUSTIVE, budget=budget)}
+        for algorithm in algorithms:
+            row = {'instance': name, 'algorithm': algorithm, 'nodes': features['nodes'],
+                   'edges': features['edges'], 'palette': k}
+            # The CSP path is a backtracking search too: budget it like MRV
+            entry = planned.get('MRV' if algorithm.startswith('CSP') else algorithm)
+            if entry and entry['action'] == 'skip':
+                row.update({'solved': 'skip', 'colors': '', 'time': 0.0, 'peak_kb': 0.0})
+            else:
+                max_nodes = entry['max_nodes'] if entry else None
+                row.update(measure(graph, colors, algorithm, max_nodes, warmup, repeats))
+            rows.append(row)
+    return rows
+
+
+def write_csv(rows, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: (f"{row[k]:.6f}" if isinstance(row[k], float) else row[k]) for k in FIELDS})
+
+
+def read_csv(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def format_table(rows):
+    header = (f"{'instance':<20} {'algorithm':<20} {'n':>5} {'m':>6} {'k':>3} {'solved':<6} "
+              f"{'colors':>6} {'time(s)':>9} {'peak(KB)':>9}")
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        lines.append(
+            f"{r['instance']:<20} {r['algorithm']:<20} {r['nodes']:>5} {r['edges']:>6} {r['palette']:>3} "
+            f"{r['solved']:<6} {str(r['colors']):>6} {r['time']:>9.4f} {r['peak_kb']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(rows, baseline, time_tolerance):
+    """Regressions against a baseline CSV: lost solutions, more colours, slower beyond the tolerance."""
+    base = {(b['instance'], b['algorithm']): b for b in baseline}
+    problems = []
+    for r in rows:
+        key = (r['instance'], r['algorithm'])
+        if key not in base:
+            continue
+        b = base[key]
+        if b['solved'] == 'yes' and r['solved'] != 'yes':
+            problems.append(f"{'/'.join(key)}: solved {b['solved']} -> {r['solved']}")
+        elif b['colors'] and r['colors'] != '' and r['colors'] > int(b['colors']):
+            problems.append(f"{'/'.join(key)}: colors {b['colors']} -> {r['colors']}")
+        if r['time'] > float(b['time']) * (1 + time_tolerance):
+            problems.append(f"{'/'.join(key)}: time {float(b['time']):.4f}s -> {r['time']:.4f}s")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Graph colouring benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated corpus")
+    parser.add_argument("--instances", nargs='*', default=[], help="Extra graph files (.col, .json, edge lists)")
+    parser.add_argument("--no-generated", action='store_true', help="Only use --instances")
+    parser.add_argument("--algorithms", nargs='*', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=2.0, help="Seconds allowed to each exhaustive search")
+    parser.add_argument("--out", type=str, help="Write the results as CSV")
+    parser.add_argument("--baseline", type=str, help="CSV of a previous run to compare against")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="Allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    corpus = [] if args.no_generated else default_corpus(args.seed)
+    corpus += load_corpus(args.instances)
+
+    rows = run_corpus(corpus, args.algorithms, warmup=args.warmup, repeats=args.repeats, budget=args.budget)
+    print(format_table(rows))
+    if args.out:
+        write_csv(rows, args.out)
+
+    if args.baseline:
+        problems = compare(rows, read_csv(args.baseline), args.time_tolerance)
+        if problems:
+            print("\nRegressions:")
+            print("\n".join(f"  {p}" for p in problems))
+            return 1
+        print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Colouring maintenance for graphs that change over time.
+
+`DynamicColoring` holds a graph and a proper colouring of it. Every update
+(add/remove node, add/remove edge) returns {node: new colour} for the nodes
+whose colour changed. Removals never create conflicts and change nothing.
+An insertion that creates a conflict is repaired locally, in three stages:
+
+1. recolour one endpoint with a colour none of its neighbours has;
+2. Kempe-chain swap: for a colour d, swap c <-> d on the connected {c, d}
+   component of one endpoint, if the other endpoint is not on it (chains
+   larger than `max_chain` are not tried);
+3. a bounded min-conflicts / tabu search (`max_repair_steps` moves) that
+   only touches the conflicting nodes and their neighbours.
+
+With an open palette (colors=None) a node that is still in conflict gets
+a brand new colour. With a fixed palette the leftover conflicts are kept
+in `conflicts` and repaired again on the next update. Each stage costs
+O(degree) per node it touches, so updates are independent of the graph size.
+"""
+
+import random
+from collections import deque
+
+from .greedy import dsatur
+
+
+class DynamicColoring:
+    def __init__(self, graph=None, colors=None, max_repair_steps=100, max_chain=64, seed=None):
+        self.adj = {}
+        for node, neighbors in (graph or {}).items():
+            self.adj.setdefault(node, set())
+            for neighbor in neighbors:
+                if neighbor != node:
+                    self.adj[node].add(neighbor)
+                    self.adj.setdefault(neighbor, set()).add(node)
+        self.palette = list(colors) if colors is not None else None
+        self.max_repair_steps = max_repair_steps
+        self.max_chain = max_chain
+        self.rng = random.Random(seed)
+        self.colors = dsatur(self.adj) if self.adj else {}
+        self.conflicts = set()  # frozenset({u, v}) edges whose ends share a colour
+        self.num_colors = 0
+        if self.palette is not None:
+            k = len(self.palette)
+            for node, color in self.colors.items():
+                if color >= k:
+                    self.colors[node] = self.rng.randrange(k)
+            self.conflicts = {frozenset((u, v)) for u in self.adj for v in self.adj[u]
+                              if self.colors[u] == self.colors[v]}
+            if self.conflicts:
+                self._repair({})
+        # Colours in use with an open palette (a high-water mark, so it stays O(1))
+        self.num_colors = max(self.colors.values(), default=-1) + 1
+
+    @property
+    def coloring(self):
+        """Current colouring, with palette colours if a palette was given."""
+        if self.palette is None:
+            return dict(self.colors)
+        return {node: self.palette[c] for node, c in self.colors.items()}
+
+    def _out(self, changed):
+        """Maps colour indices to palette colours."""
+        if self.palette is None:
+            return changed
+        return {node: self.palette[c] for node, c in changed.items()}
+
+    # --- Updates ---
+
+    def add_node(self, node, neighbors=()):
+        if node in self.adj:
+            raise ValueError(f"Node {node!r} already exists")
+        before = {}
+        self._new_node(node, before)
+        for neighbor in neighbors:
+            if neighbor not in self.adj:
+                self._new_node(neighbor, before)
+            self._link(node, neighbor)
+        for new in list(before):
+            self._place(new, before)
+        return self._finish(before)
+
+    def remove_node(self, node):
+        for neighbor in self.adj.pop(node):
+            self.adj[neighbor].discard(node)
+            self.conflicts.discard(frozenset((node, neighbor)))
+        del self.colors[node]
+        return {}
+
+    def add_edge(self, u, v):
+        before = {}
+        for node in (u, v):
+            if node not in self.adj:
+                self._new_node(node, before)
+        self._link(u, v)
+        for new in list(before):
+            self._place(new, before)
+        return self._finish(before)
+
+    def remove_edge(self, u, v):
+        self.adj[u].discard(v)
+        self.adj[v].discard(u)
+        self.conflicts.discard(frozenset((u, v)))
+        return {}
+
+    # --- Internals ---
+
+    def _new_node(self, node, before):
+        self.adj[node] = set()
+        self.colors[node] = -1  # uncoloured: conflicts with nobody until placed
+        before[node] = None
+
+    def _place(self, node, before):
+        """Colours a new node with a free colour, or (full palette) the least conflicting one."""
+        color = self._free_color(node)
+        if color is None:
+            counts = [0] * len(self.palette)
+            for neighbor in self.adj[node]:
+                if self.colors[neighbor] >= 0:
+                    counts[self.colors[neighbor]] += 1
+            color = counts.index(min(counts))
+        self._set(node, color, before)
+
+    def _finish(self, before):
+        """Repairs the conflicts and returns {node: new colour} for the nodes that really changed."""
+        if self.conflicts:
+            self._repair(before)
+        changed = {node: self.colors[node] for node, old in before.items() if self.colors[node] != old}
+        return self._out(changed)
+
+    def _link(self, u, v):
+        if u == v:
+            return
+        self.adj[u].add(v)
+        self.adj[v].add(u)
+        if self.colors[u] == self.colors[v] and self.colors[u] >= 0:
+            self.conflicts.add(frozenset((u, v)))
+
+    def _set(self, node, color, before):
+        """Recolours `node`, keeping the conflict set in sync (O(degree))."""
+        old = self.colors[node]
+        if old == color:
+            return
+        for neighbor in self.adj[node]:
+            c = self.colors[neighbor]
+            if c == old:
+                self.conflicts.discard(frozenset((node, neighbor)))
+            elif c == color:
+                self.conflicts.add(frozenset((node, neighbor)))
+        self.colors[node] = color
+        self.num_colors = max(self.num_colors, color + 1)
+        before.setdefault(node, old)
+
+    def _free_color(self, node, limit=None):
+        """Smallest colour no neighbour has, or None if it is not below `limit` (default: palette size)."""
+        used = {self.colors[n] for n in self.adj[node]}
+        color = 0
+        while color in used:
+            color += 1
+        if limit is None and self.palette is not None:
+            limit = len(self.palette)
+        if limit is not None and color >= limit:
+            return None
+        return color
+
+    def _num_colors(self):
+        return len(self.palette) if self.palette is not None else self.num_colors
+
+    def _kempe_chain(self, start, c, d, blocked):
+        """Nodes of the {c, d} component of `start` without the edge start-`blocked`
+        (the conflict being repaired), or None if it contains `blocked` or is too large."""
+        chain = {start}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for neighbor in self.adj[node]:
+                if neighbor in chain or self.colors[neighbor] not in (c, d):
+                    continue
+                if node == start and neighbor == blocked:
+                    continue
+                if neighbor == blocked or len(chain) >= self.max_chain:
+                    return None
+                chain.add(neighbor)
+                queue.append(neighbor)
+        return chain
+
+    def _repair_edge(self, u, v, changed):
+        k = self._num_colors()
+        for node in (v, u):
+            color = self._free_color(node, k)
+            if color is not None:
+                self._set(node, color, changed)
+                return True
+        c = self.colors[u]
+        for node, other in ((v, u), (u, v)):
+            for d in range(k):
+                if d == c:
+                    continue
+                chain = self._kempe_chain(node, c, d, other)
+                if chain is None:
+                    continue
+                swap = {n: (d if self.colors[n] == c else c) for n in chain}
+                for n, color in swap.items():
+                    self._set(n, color, changed)
+                return True
+        return False
+
+    def _local_search(self, changed):
+        k = self._num_colors()
+        tabu = {}
+        for step in range(self.max_repair_steps):
+            if not self.conflicts:
+                return
+            node = self.rng.choice(sorted({n for edge in self.conflicts for n in edge}, key=str))
+            counts = [0] * k
+            for neighbor in self.adj[node]:
+                c = self.colors[neighbor]
+                if c < k:
+                    counts[c] += 1
+            current = self.colors[node]
+            options = [c for c in range(k) if c != current and tabu.get((node, c), -1) < step]
+            if not options:
+                continue
+            best = min(counts[c] for c in options)
+            color = self.rng.choice([c for c in options if counts[c] == best])
+            tabu[(node, current)] = step + 3 + self.rng.randrange(3)
+            self._set(node, color, changed)
+
+    def _repair(self, changed):
+        for edge in list(self.conflicts):
+            if edge in self.conflicts:
+                u, v = tuple(edge)
+                self._repair_edge(u, v, changed)
+        if self.conflicts:
+            self._local_search(changed)
+        if self.conflicts and self.palette is None:
+            # Open palette: give a fresh colour to one end of each remaining conflict
+            for edge in list(self.conflicts):
+                if edge in self.conflicts:
+                    node = next(iter(edge))
+                    self._set(node, self.num_colors, changed)
+        return changed
@@ -0,0 +1,181 @@
+"""
+Hybrid evolutionary colouring (Galinier & Hao's HEA).
+
+A population of k-colourings is evolved by GPX crossover (the child
+inherits whole colour classes, alternately the largest remaining class of
+each parent) followed by Tabucol improvement of every child. The child
+replaces the worse of its parents. Children are improved in parallel in a
+process pool: the workers receive the graph once through the pool
+initializer, and every task carries its own seed drawn from the master RNG.
+The Tabucol runs stop at the deadline, so equal seeds do not give equal
+results: how far each run gets depends on the machine and the load.
+
+The search is anytime. Without a target palette it starts from k = DSATUR
+colours - 1, and each time a proper k-colouring is found it records it and
+retries with k - 1, until the time budget runs out or k drops below the
+size of a clique (no k-colouring can exist then).
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .exact import greedy_clique
+from .graph import index_graph
+from .greedy import dsatur_order
+from .local_search import ConflictTable, tabu_search
+
+_ADJ = None
+
+
+def _init_worker(adj):
+    global _ADJ
+    _ADJ = adj
+
+
+def _improve(colors, k, max_iters, seed, deadline):
+    best, conflicts, _ = tabu_search(_ADJ, k, colors, max_iters=max_iters, time_limit=max(deadline - time.time(), 0),
+                                     rng=random.Random(seed))
+    return best, conflicts
+
+
+class _LocalExecutor:
+    """Runs the tasks in-process (workers=1), with the same interface as the pool."""
+    def __init__(self, adj):
+        _init_worker(adj)
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+    def shutdown(self):
+        pass
+
+
+def gpx(parent_a, parent_b, k, rng):
+    """Greedy partition crossover of two colour lists; returns the child colour list."""
+    n = len(parent_a)
+    classes = []
+    for parent in (parent_a, parent_b):
+        groups = [set() for _ in range(k)]
+        for v, c in enumerate(parent):
+            groups[c].add(v)
+        classes.append(groups)
+
+    child = [-1] * n
+    for color in range(k):
+        groups = classes[color % 2]
+        chosen = max(groups, key=len)
+        if not chosen:
+            break
+        chosen = set(chosen)
+        for v in chosen:
+            child[v] = color
+        for parent_groups in classes:
+            for group in parent_groups:
+                group -= chosen
+    return [c if c != -1 else rng.randrange(k) for c in child]
+
+
+def hybrid_evolutionary(graph, colors=None, time_limit=10.0, population_size=10, tabu_iters=2000,
+                        workers=None, seed=None, on_improvement=None):
+    """
+    Runs HEA on an adjacency dict or CSRGraph.
+
+    Args:
+        colors: target palette; if given, stop at the first proper len(colors)-colouring.
+                If None, minimise the number of colours.
+        workers: processes for offspring improvement (default: all cores; 1 = in-process).
+        on_improvement: optional callback(k, coloring) for every new proper colouring.
+
+    Returns a dict:
+        'coloring'     node -> colour index (or palette colour) of the best colouring found
+        'colors'       number of colours of that colouring
+        'conflicts'    its conflicting edges (0 unless no proper colouring was found for the target)
+        'generations'  crossovers performed
+        'time'         seconds
+    """
+    start_time = time.time()
+    deadline = start_time + time_limit
+    rng = random.Random(seed)
+    nodes, adj = index_graph(graph)
+    n = len(nodes)
+
+    def result(best_colors, k, conflicts, generations):
+        coloring = {nodes[i]: (colors[c] if colors else c) for i, c in enumerate(best_colors)}
+        return {'coloring': coloring, 'colors': k, 'conflicts': conflicts,
+                'generations': generations, 'time': time.time() - start_time}
+
+    initial, _ = dsatur_order(nodes, adj)
+    best_colors = initial
+    best_k = len(set(initial)) if n else 0
+    best_conflicts = 0
+    if colors is not None:
+        if best_k <= len(colors) or not colors:
+            return result(initial, best_k, 0, 0)
+        # Best k-colouring so far: DSATUR with the extra colours made random
+        k = best_k = len(colors)
+        best_colors = [c if c < k else rng.randrange(k) for c in initial]
+        best_conflicts = ConflictTable(adj, k, best_colors).conflicts
+    else:
+        if on_improvement:
+            on_improvement(best_k, {nodes[i]: c for i, c in enumerate(initial)})
+        k = best_k - 1
+    by_degree = sorted(range(n), key=lambda v: -len(adj[v]))
+    lower_bound = max(len(greedy_clique(nodes, adj, by_degree[:200])), 1)
+    if k < lower_bound:
+        return result(best_colors, best_k, best_conflicts, 0)
+    population_size = max(population_size, 2)
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(adj,))
+    else:
+        executor = _LocalExecutor(adj)
+
+    generations = 0
+    try:
+        while k >= lower_bound and time.time() < deadline:
+            # Initial population: random colourings improved by Tabucol
+            starts = [[rng.randrange(k) for _ in range(n)] for _ in range(population_size)]
+            seeds = [rng.getrandbits(32) for _ in starts]
+            population = list(executor.map(_improve, starts, [k] * len(starts), [tabu_iters] * len(starts), seeds,
+                                           [deadline] * len(starts)))
+            found = None
+
+            # The population is ranked before the deadline check, so a budget spent on
+            # building it still returns its best member rather than the seed colouring
+            while True:
+                population.sort(key=lambda ind: ind[1])
+                if colors is not None and population[0][1] < best_conflicts:
+                    best_colors, best_conflicts = population[0]
+                if population[0][1] == 0:
+                    found = population[0][0]
+                    break
+                if time.time() >= deadline:
+                    break
+
+                # One child per worker per generation
+                pairs = [rng.sample(range(len(population)), 2) for _ in range(workers)]
+                children = [gpx(population[a][0], population[b][0], k, rng) for a, b in pairs]
+                seeds = [rng.getrandbits(32) for _ in children]
+                improved = executor.map(_improve, children, [k] * len(children), [tabu_iters] * len(children), seeds,
+                                        [deadline] * len(children))
+                for (a, b), child in zip(pairs, improved):
+                    generations += 1
+                    worse = a if population[a][1] >= population[b][1] else b
+                    if child[1] <= population[worse][1] and child[0] not in (ind[0] for ind in population):
+                        population[worse] = child
+
+            if found is None:
+                break
+            best_colors, best_k, best_conflicts = found, k, 0
+            if on_improvement:
+                on_improvement(k, {nodes[i]: c for i, c in enumerate(found)})
+            if colors is not None:
+                break
+            k -= 1
+    finally:
+        executor.shutdown()
+
+    return result(best_colors, best_k, best_conflicts, generations)
@@ -0,0 +1,173 @@
+"""
+Exact chromatic number by DSATUR-based branch and bound.
+
+1. Upper bound: the best of the DSATUR and RLF colourings.
+2. Lower bound: the largest clique found by a greedy heuristic (started from
+   every high-degree node); a graph needs at least as many colours as the
+   size of any of its cliques.
+3. Branch and bound (Brélaz / Sewell style): nodes are coloured in DSATUR
+   order, each one with any colour already in use or one new colour. A branch
+   is cut as soon as it would need as many colours as the best colouring
+   found so far. The clique nodes are pre-coloured 0..q-1, which removes the
+   colour symmetry among them.
+
+If the search finishes, the best colouring is optimal; otherwise the result
+carries the best bounds found when the time budget ran out.
+"""
+
+import time
+
+from .graph import index_graph
+from .greedy import dsatur_order, rlf
+
+
+def greedy_clique(nodes, adj, starts=None):
+    """
+    Maximal cliques grown greedily from each start node (all nodes by default),
+    always adding the candidate with most neighbours among the candidates.
+    Returns the largest one as a list of node ids.
+    """
+    neighbor_sets = [set(a) for a in adj]
+    if starts is None:
+        starts = range(len(nodes))
+    best = []
+    for s in starts:
+        if len(adj[s]) + 1 <= len(best):
+            continue
+        clique = [s]
+        candidates = set(neighbor_sets[s])
+        while candidates:
+            v = max(candidates, key=lambda u: (len(neighbor_sets[u] & candidates), -u))
+            clique.append(v)
+            candidates &= neighbor_sets[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def chromatic_number(graph, time_limit=10.0, clique_starts=200):
+    """
+    Computes the chromatic number of `graph` (adjacency dict).
+
+    Returns a dict:
+        'colors'       best number of colours found (upper bound)
+        'lower_bound'  proven lower bound
+        'coloring'     node -> colour index for the best colouring
+        'optimal'      True if colors == lower_bound was proven
+        'nodes'        branch-and-bound nodes explored
+        'time'         seconds
+    """
+    start_time = time.time()
+    deadline = start_time + time_limit if time_limit is not None else None
+    nodes, adj = index_graph(graph)
+    n = len(nodes)
+    if n == 0:
+        return {'colors': 0, 'lower_bound': 0, 'coloring': {}, 'optimal': True, 'nodes': 0, 'time': 0.0}
+
+    # --- Upper bound ---
+    best_colors, _ = dsatur_order(nodes, adj)
+    rlf_coloring = rlf(graph)
+    if len(set(rlf_coloring.values())) < len(set(best_colors)):
+        best_colors = [rlf_coloring[node] for node in nodes]
+    upper = len(set(best_colors))
+
+    # --- Lower bound ---
+    by_degree = sorted(range(n), key=lambda v: -len(adj[v]))
+    clique = greedy_clique(nodes, adj, by_degree[:clique_starts])
+    lower = len(clique)
+
+    explored = 0
+    timed_out = False
+
+    if lower < upper:
+        colors = [-1] * n
+        # neighbor_count[v][c] = number of coloured neighbours of v with colour c
+        neighbor_count = [dict() for _ in range(n)]
+        saturation = [0] * n
+        # Uncoloured neighbours of each node, kept up to date by assign / unassign
+        uncolored_degree = [len(a) for a in adj]
+
+        def assign(v, c):
+            colors[v] = c
+            for u in adj[v]:
+                uncolored_degree[u] -= 1
+                counts = neighbor_count[u]
+                counts[c] = counts.get(c, 0) + 1
+                if counts[c] == 1:
+                    saturation[u] += 1
+
+        def unassign(v, c):
+            colors[v] = -1
+            for u in adj[v]:
+                uncolored_degree[u] += 1
+                counts = neighbor_count[u]
+                counts[c] -= 1
+                if counts[c] == 0:
+                    del counts[c]
+                    saturation[u] -= 1
+
+        for i, v in enumerate(clique):
+            assign(v, i)
+        uncolored = set(range(n)) - set(clique)
+
+        def select():
+            # DSATUR choice: max saturation, then max uncoloured degree
+            return max(uncolored, key=lambda v: (saturation[v], uncolored_degree[v], -v))
+
+        def enter(used):
+            """Opens a search node: a frame [node, colour options, colours used, colour tried], or None if it is a leaf."""
+            nonlocal upper, best_colors, explored, timed_out
+            explored += 1
+            if used >= upper:
+                return None
+            if deadline is not None and explored % 256 == 0 and time.time() > deadline:
+                timed_out = True
+                return None
+            if not uncolored:
+                upper = used
+                best_colors = list(colors)
+                return None
+            v = select()
+            uncolored.discard(v)
+            # Existing colours first, then (if it can still improve) one new colour
+            options = [c for c in range(used) if c not in neighbor_count[v]]
+            if used + 1 < upper:
+                options.append(used)
+            return [v, iter(options), used, -1]
+
+        # Iterative depth-first search: one frame per coloured node, no recursion limit
+        stack = []
+        frame = enter(lower)
+        if frame is not None:
+            stack.append(frame)
+        while stack:
+            frame = stack[-1]
+            v, options, used, tried = frame
+            if tried >= 0:
+                unassign(v, tried)
+                frame[3] = -1
+                if timed_out or upper == lower:
+                    uncolored.add(v)
+                    stack.pop()
+                    continue
+            # Skip the colours that can no longer beat the incumbent (it may have improved)
+            c = next((c for c in options if c + 1 < upper), None)
+            if c is None:
+                uncolored.add(v)
+                stack.pop()
+                continue
+            assign(v, c)
+            frame[3] = c
+            child = enter(max(used, c + 1))
+            if child is not None:
+                stack.append(child)
+
+    coloring = {nodes[i]: c for i, c in enumerate(best_colors)}
+    return {
+        'colors': upper,
+        'lower_bound': lower if timed_out else upper,
+        'coloring': coloring,
+        'optimal': not timed_out,
+        'nodes': explored,
+        'time': time.time() - start_time,
+    }
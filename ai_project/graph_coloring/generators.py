@@ -0,0 +1,177 @@
+"""
+Seeded generators for the standard graph-colouring benchmark families.
+
+Every generator yields undirected edges (u, v) with u < v over the node ids
+0..n-1, one at a time, so large instances can go straight into
+`CSRGraph.from_edges` (see `to_csr`) or a DIMACS file (`write_dimacs`)
+without an intermediate adjacency dict (small ones into `to_adjacency`).
+
+- `gnp_edges`        Erdős–Rényi G(n, p), by geometric skipping: O(n + m).
+- `geometric_edges`  random geometric graph: n points in the unit square,
+                     joined when closer than `radius` (grid buckets).
+- `queen_edges`      queen graph of a rows x cols board (DIMACS queenR_C).
+- `mycielski_edges`  Mycielski graph M_k: triangle-free, chromatic number k.
+- `planted_edges`    k-colourable by construction: n nodes split into k
+                     near-equal classes, edges only between classes.
+                     flat=True gives every pair of classes the same number
+                     of edges (Culberson's flat graphs) instead of p-sampling.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from .graph import CSRGraph, _build_csr
+
+
+def gnp_edges(n, p, seed=None):
+    rng = random.Random(seed)
+    if p <= 0:
+        return
+    if p >= 1:
+        for v in range(1, n):
+            for u in range(v):
+                yield u, v
+        return
+    # Batagelj & Brandes: jump over the non-edges with geometric gaps
+    log_q = math.log(1 - p)
+    v, w = 1, -1
+    while v < n:
+        w += 1 + int(math.log(1 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            yield w, v
+
+
+def geometric_edges(n, radius, seed=None):
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    cells = max(int(1 / radius), 1) if radius > 0 else 1
+    grid = {}
+    for i, (x, y) in enumerate(points):
+        grid.setdefault((min(int(x * cells), cells - 1), min(int(y * cells), cells - 1)), []).append(i)
+    r2 = radius * radius
+    for (cx, cy), members in grid.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                others = grid.get((cx + dx, cy + dy))
+                if not others:
+                    continue
+                for i in members:
+                    xi, yi = points[i]
+                    for j in others:
+                        if i < j and (xi - points[j][0]) ** 2 + (yi - points[j][1]) ** 2 < r2:
+                            yield i, j
+
+
+def queen_edges(rows, cols=None):
+    cols = cols or rows
+    for r1 in range(rows):
+        for c1 in range(cols):
+            u = r1 * cols + c1
+            for r2 in range(r1, rows):
+                for c2 in range(cols):
+                    v = r2 * cols + c2
+                    if v <= u:
+                        continue
+                    if r1 == r2 or c1 == c2 or abs(r1 - r2) == abs(c1 - c2):
+                        yield u, v
+
+
+def mycielski_edges(k):
+    """M_2 = K_2; M_{i+1} adds a shadow u' of every node u (joined to u's neighbours) and a hub joined to all shadows."""
+    if k < 2:
+        return
+    edges = [(0, 1)]
+    n = 2
+    for _ in range(k - 2):
+        new_edges = list(edges)
+        for u, v in edges:
+            new_edges.append((u, n + v))
+            new_edges.append((v, n + u))
+        hub = 2 * n
+        new_edges.extend((n + u, hub) for u in range(n))
+        edges = new_edges
+        n = 2 * n + 1
+    for u, v in edges:
+        yield min(u, v), max(u, v)
+
+
+def mycielski_nodes(k):
+    return 3 * 2 ** (k - 2) - 1 if k >= 2 else 1
+
+
+def planted_edges(n, k, p, seed=None, flat=False):
+    rng = random.Random(seed)
+    classes = [list(range(c, n, k)) for c in range(k)]
+    for a in range(k):
+        for b in range(a + 1, k):
+            A, B = classes[a], classes[b]
+            if flat:
+                total = len(A) * len(B)
+                for index in sorted(rng.sample(range(total), round(p * total))):
+                    u, v = A[index // len(B)], B[index % len(B)]
+                    yield min(u, v), max(u, v)
+            else:
+                for u in A:
+                    for v in B:
+                        if rng.random() < p:
+                            yield min(u, v), max(u, v)
+
+
+def planted_coloring(n, k):
+    """The colouring hidden in `planted_edges(n, k, ...)`."""
+    return {v: v % k for v in range(n)}
+
+
+# --- Sinks ---
+
+def to_adjacency(n, edges):
+    graph = {v: [] for v in range(n)}
+    for u, v in edges:
+        graph[u].append(v)
+        graph[v].append(u)
+    return graph
+
+
+def to_csr(n, make_edges, chunk=1 << 20, mmap_path=None):
+    """
+    Builds a CSRGraph from `make_edges`, a zero-argument callable returning a
+    fresh edge stream (e.g. lambda: gnp_edges(n, p, seed=1)). The generators
+    are seeded, so the stream is replayed for the second CSR pass instead of
+    being held in memory.
+    """
+    def chunks():
+        buffer = []
+        for edge in make_edges():
+            buffer.append(edge)
+            if len(buffer) >= chunk:
+                pairs = np.array(buffer, dtype=np.int64)
+                yield pairs[:, 0], pairs[:, 1]
+                buffer = []
+        if buffer:
+            pairs = np.array(buffer, dtype=np.int64)
+            yield pairs[:, 0], pairs[:, 1]
+
+    indptr, indices = _build_csr(n, chunks, mmap_path)
+    return CSRGraph(range(n), indptr, indices, check=False)
+
+
+def write_dimacs(path, n, edges, comment=None):
+    """Streams the edges into a DIMACS .col file (the header's edge count is patched at the end)."""
+    width = 20
+    with open(path, 'w') as f:
+        if comment:
+            f.write(f"c {comment}\n")
+        header_at = f.tell()
+        f.write(f"p edge {n} ".ljust(width + 8) + "\n")
+        m = 0
+        for u, v in edges:
+            f.write(f"e {u + 1} {v + 1}\n")
+            m += 1
+        f.seek(header_at)
+        f.write(f"p edge {n} {m}".ljust(width + 8))
+    return m
@@ -0,0 +1,302 @@
+"""
+Graph helpers shared by the colouring algorithms.
+
+The solvers receive graphs as adjacency dicts keyed by node name
+({'A': ['B', 'C'], ...}). The fast algorithms work on integer ids instead:
+`index_graph` interns the names once and returns symmetric, duplicate-free
+integer adjacency lists.
+
+`CSRGraph` is the compact form for large graphs: names interned to ids
+0..n-1 and the adjacency stored as CSR NumPy arrays (`indices[indptr[i]:
+indptr[i+1]]` are the sorted neighbours of i). It is symmetric by
+construction (checked once when built from raw arrays) and behaves as a
+read-only adjacency dict, so every colouring algorithm accepts it.
+`load_dimacs` / `load_edge_list` stream files in two passes (degrees, then
+placement) and can keep `indices` in a memory-mapped .npy file.
+"""
+
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+
+import numpy as np
+
+CHUNK_EDGES = 1 << 20  # edges per block when deduplicating rows
+
+
+class CSRGraph(Mapping):
+    def __init__(self, nodes, indptr, indices, check=True):
+        self.nodes = list(nodes)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices)
+        self._index = None
+        if len(self.indptr) != len(self.nodes) + 1 or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr does not match the number of nodes / indices")
+        if check and not self.is_symmetric():
+            raise ValueError("CSR adjacency is not symmetric (the graph must be undirected)")
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """Builds the CSR form of an adjacency dict (one-sided edges are symmetrised)."""
+        nodes, adj = index_graph(graph)
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in adj], out=indptr[1:])
+        indices = np.fromiter((u for a in adj for u in a), dtype=_id_dtype(len(nodes)), count=int(indptr[-1]))
+        return cls(nodes, indptr, indices, check=False)
+
+    @classmethod
+    def from_edges(cls, num_nodes, src, dst, nodes=None, mmap_path=None):
+        """Undirected graph on ids 0..num_nodes-1 from edge arrays (duplicates and self-loops dropped)."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        indptr, indices = _build_csr(num_nodes, lambda: iter([(src, dst)]), mmap_path)
+        nodes = nodes if nodes is not None else range(num_nodes)
+        return cls(nodes, indptr, indices, check=False)
+
+    def is_symmetric(self):
+        n = len(self.nodes)
+        rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(self.indptr))
+        cols = self.indices.astype(np.int64)
+        forward = np.sort(rows * n + cols)
+        backward = np.sort(cols * n + rows)
+        return bool(np.array_equal(forward, backward))
+
+    @property
+    def num_edges(self):
+        return len(self.indices) // 2
+
+    def neighbors(self, i):
+        """Neighbour ids of node id i (a view into `indices`)."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def index(self, node):
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self.nodes)}
+        return self._index[node]
+
+    # --- Mapping protocol: node name -> list of neighbour names ---
+
+    def __getitem__(self, node):
+        nodes = self.nodes
+        return [nodes[u] for u in self.neighbors(self.index(node)).tolist()]
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        try:
+            self.index(node)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __repr__(self):
+        return f"CSRGraph({len(self.nodes)} nodes, {self.num_edges} edges)"
+
+
+def _id_dtype(num_nodes):
+    return np.int32 if num_nodes < 2 ** 31 else np.int64
+
+
+def _build_csr(num_nodes, chunks, mmap_path=None):
+    """
+    CSR arrays of an undirected graph. `chunks()` must return a fresh iterator
+    of (src, dst) id arrays each time it is called: the first pass counts
+    degrees, the second places both directions of every edge. Each row is
+    then sorted and deduplicated in place, so peak memory beyond `indices`
+    is one chunk (plus one row at a time).
+    """
+    degree = np.zeros(num_nodes, dtype=np.int64)
+    for src, dst in chunks():
+        keep = src != dst
+        degree += np.bincount(src[keep], minlength=num_nodes)
+        degree += np.bincount(dst[keep], minlength=num_nodes)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+
+    dtype = _id_dtype(num_nodes)
+    total = int(indptr[-1])
+    if mmap_path is not None:
+        indices = np.lib.format.open_memmap(mmap_path, mode='w+', dtype=dtype, shape=(total,))
+    else:
+        indices = np.empty(total, dtype=dtype)
+
+    fill = indptr[:-1].copy()
+    for src, dst in chunks():
+        keep = src != dst
+        src, dst = src[keep], dst[keep]
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        order = np.argsort(rows, kind='stable')
+        rows, cols = rows[order], cols[order]
+        # Rank of each entry within its row in this chunk
+        starts = np.searchsorted(rows, rows, side='left')
+        rank = np.arange(len(rows)) - starts
+        indices[fill[rows] + rank] = cols
+        fill += np.bincount(rows, minlength=num_nodes)
+
+    # Sort each row and squeeze out duplicate edges, a block of rows at a time
+    new_indptr = np.zeros_like(indptr)
+    write = 0
+    first = 0
+    while first < num_nodes:
+        last = int(np.searchsorted(indptr, indptr[first] + CHUNK_EDGES, side='right')) - 1
+        last = min(max(last, first + 1), num_nodes)
+        lo, hi = int(indptr[first]), int(indptr[last])
+        rows = np.repeat(np.arange(first, last, dtype=np.int64), np.diff(indptr[first:last + 1]))
+        keys = np.sort(rows * num_nodes + indices[lo:hi])
+        if len(keys):
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        block_rows = keys // num_nodes
+        indices[write:write + len(keys)] = keys % num_nodes
+        counts = np.bincount(block_rows - first, minlength=last - first)
+        new_indptr[first + 1:last + 1] = write + np.cumsum(counts)
+        write += len(keys)
+        first = last
+    if mmap_path is not None:
+        indices.flush()
+        if write < total:
+            del indices
+            indices = np.load(mmap_path, mmap_mode='r+')[:write]
+    else:
+        indices = indices[:write].copy()
+    return new_indptr, indices
+
+
+def _read_pairs(path, parse_block, block_bytes=1 << 25):
+    """
+    Yields (src, dst) int64 id arrays, one per block of lines of about
+    `block_bytes`; `parse_block(lines)` turns a list of lines into a pair of arrays.
+    """
+    with open(path) as f:
+        while True:
+            lines = f.readlines(block_bytes)
+            if not lines:
+                return
+            src, dst = parse_block(lines)
+            if len(src):
+                yield src, dst
+
+
+def load_dimacs(path, mmap_path=None):
+    """
+    DIMACS .col file: 'c' comments, 'p edge <n> <m>' header, 'e <u> <v>'
+    edges with 1-based vertices. Node names are the vertex numbers.
+    """
+    num_nodes = None
+    with open(path) as f:
+        for line in f:
+            if line.startswith('p'):
+                num_nodes = int(line.split()[2])
+                break
+    if num_nodes is None:
+        raise ValueError(f"{path}: missing 'p edge' header")
+
+    def parse_block(lines):
+        # In 'e u v' lines the only letter is the leading 'e'
+        text = ''.join([line for line in lines if line[0] == 'e']).replace('e', ' ')
+        edges = np.array(text.split(), dtype=np.int64)
+        edges = edges.reshape(-1, 2) - 1
+        return edges[:, 0], edges[:, 1]
+
+    indptr, indices = _build_csr(num_nodes, lambda: _read_pairs(path, parse_block), mmap_path)
+    return CSRGraph(range(1, num_nodes + 1), indptr, indices, check=False)
+
+
+def load_edge_list(path, mmap_path=None):
+    """
+    Whitespace-separated 'u v' lines ('#' and '%' start comments). Node names
+    are interned in order of first appearance during the first pass.
+    """
+    index = {}
+    nodes = []
+
+    def intern(name):
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(nodes)
+            nodes.append(name)
+        return i
+
+    def parse_block(lines):
+        src, dst = [], []
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 2 or parts[0][0] in '#%':
+                continue
+            src.append(intern(parts[0]))
+            dst.append(intern(parts[1]))
+        return np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64)
+
+    # The first pass interns every name, so it must run before the CSR size is known
+    for _ in _read_pairs(path, parse_block):
+        pass
+    indptr, indices = _build_csr(len(nodes), lambda: _read_pairs(path, parse_block), mmap_path)
+    return CSRGraph(nodes, indptr, indices, check=False)
+
+
+def load_graph(path, mmap_path=None):
+    """Loads a graph file by extension: .col (DIMACS), .json (adjacency dict), anything else an edge list."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.col':
+        return load_dimacs(path, mmap_path)
+    if extension == '.json':
+        with open(path) as f:
+            return CSRGraph.from_adjacency(json.load(f))
+    return load_edge_list(path, mmap_path)
+
+
+def memmap_path(directory=None):
+    """A fresh .npy path for the memory-mapped `indices` of a large graph."""
+    fd, path = tempfile.mkstemp(suffix='.npy', dir=directory)
+    os.close(fd)
+    return path
+
+
+def index_graph(graph):
+    """
+    Returns (nodes, adj): `nodes[i]` is the name of node i, `adj[i]` the sorted
+    list of its neighbours' ids. Edges listed on one side only are added on
+    both sides; self-loops are dropped.
+    """
+    if isinstance(graph, CSRGraph):
+        indices = graph.indices
+        indptr = graph.indptr.tolist()
+        return list(graph.nodes), [indices[indptr[i]:indptr[i + 1]].tolist() for i in range(len(graph.nodes))]
+    nodes = list(graph.keys())
+    index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for neighbor in neighbors:
+            if neighbor not in index:
+                index[neighbor] = len(nodes)
+                nodes.append(neighbor)
+
+    adj_sets = [set() for _ in nodes]
+    for node, neighbors in graph.items():
+        i = index[node]
+        for neighbor in neighbors:
+            j = index[neighbor]
+            if i != j:
+                adj_sets[i].add(j)
+                adj_sets[j].add(i)
+    return nodes, [sorted(s) for s in adj_sets]
+
+
+def colors_used(coloring):
+    """Number of distinct colours in a colouring dict."""
+    return len(set(coloring.values())) if coloring else 0
+
+
+def is_proper(graph, coloring):
+    """True if every node is coloured and no edge joins two nodes of the same colour."""
+    nodes, adj = index_graph(graph)
+    if any(node not in coloring for node in nodes):
+        return False
+    return all(coloring[nodes[i]] != coloring[nodes[j]] for i in range(len(nodes)) for j in adj[i] if i < j)
@@ -0,0 +1,131 @@
+"""
+Fast constructive colourers. They need no palette: each one colours the whole
+graph with integer colours 0, 1, 2, ... and tries to use as few as possible.
+
+- DSATUR (Brélaz): colour next the node with the most distinct colours among
+  its neighbours (saturation), ties broken by degree in the uncoloured graph.
+  O((V + E) log V) with a bucketed priority queue.
+- Welsh-Powell: first-fit in order of decreasing degree. O(V log V + E).
+- RLF (Recursive Largest First, Leighton): builds one colour class at a time
+  as a large independent set. O(k (V + E) log V) for k colours.
+"""
+
+import heapq
+
+from .graph import index_graph
+
+
+def _smallest_missing(used):
+    color = 0
+    while color in used:
+        color += 1
+    return color
+
+
+def dsatur_order(nodes, adj):
+    """
+    Runs DSATUR on an indexed graph. Returns (colors, order): colors[i] is the
+    colour of node i, `order` the sequence in which nodes were coloured.
+    """
+    n = len(nodes)
+    colors = [-1] * n
+    saturation = [0] * n
+    neighbor_colors = [set() for _ in range(n)]
+    degree = [len(a) for a in adj]  # degree among uncoloured nodes
+
+    # buckets[s] is a heap of (-degree, node) for nodes with saturation s;
+    # entries are pushed again on every change and stale ones skipped on pop.
+    buckets = [[(-degree[v], v) for v in range(n)]]
+    heapq.heapify(buckets[0])
+    top = 0
+    order = []
+
+    for _ in range(n):
+        while True:
+            while not buckets[top]:
+                top -= 1
+            neg_deg, v = heapq.heappop(buckets[top])
+            if colors[v] == -1 and saturation[v] == top and -neg_deg == degree[v]:
+                break
+
+        color = _smallest_missing(neighbor_colors[v])
+        colors[v] = color
+        order.append(v)
+
+        for u in adj[v]:
+            if colors[u] != -1:
+                continue
+            degree[u] -= 1
+            if color not in neighbor_colors[u]:
+                neighbor_colors[u].add(color)
+                saturation[u] += 1
+                if saturation[u] == len(buckets):
+                    buckets.append([])
+                top = max(top, saturation[u])
+            heapq.heappush(buckets[saturation[u]], (-degree[u], u))
+    return colors, order
+
+
+def dsatur(graph):
+    nodes, adj = index_graph(graph)
+    colors, _ = dsatur_order(nodes, adj)
+    return {nodes[i]: c for i, c in enumerate(colors)}
+
+
+def welsh_powell(graph):
+    nodes, adj = index_graph(graph)
+    colors = [-1] * len(nodes)
+    for v in sorted(range(len(nodes)), key=lambda v: (-len(adj[v]), v)):
+        colors[v] = _smallest_missing({colors[u] for u in adj[v] if colors[u] != -1})
+    return {nodes[i]: c for i, c in enumerate(colors)}
+
+
+def rlf(graph):
+    nodes, adj = index_graph(graph)
+    n = len(nodes)
+    colors = [-1] * n
+    uncolored = set(range(n))
+    deg_u = [len(a) for a in adj]  # uncoloured neighbours (= in U + in W)
+    color = 0
+
+    while uncolored:
+        # U: candidates for this colour class, W: uncoloured but forbidden
+        candidate = set(uncolored)
+        in_w = [0] * n  # neighbours in W, for nodes of U
+        heap = [(-deg_u[v], 0, v) for v in candidate]
+        heapq.heapify(heap)
+        first = True
+
+        while candidate:
+            # First node: max degree in U. Then: max neighbours in W, ties by
+            # fewest neighbours in U (keeps U large for the next picks).
+            while True:
+                key_a, key_b, v = heapq.heappop(heap)
+                if v not in candidate:
+                    continue
+                if first and -key_a == deg_u[v]:
+                    break
+                if not first and -key_a == in_w[v] and key_b == deg_u[v] - in_w[v]:
+                    break
+
+            if first:
+                first = False
+                heap = [(-in_w[u], deg_u[u] - in_w[u], u) for u in candidate]
+                heapq.heapify(heap)
+
+            colors[v] = color
+            candidate.discard(v)
+            uncolored.discard(v)
+            for u in adj[v]:
+                if u in uncolored:
+                    deg_u[u] -= 1
+            # v's uncoloured neighbours move from U to W
+            for u in adj[v]:
+                if u in candidate:
+                    candidate.discard(u)
+                    for w in adj[u]:
+                        if w in candidate:
+                            in_w[w] += 1
+                            heapq.heappush(heap, (-in_w[w], deg_u[w] - in_w[w], w))
+        color += 1
+    return {nodes[i]: c for i, c in enumerate(colors)}
@@ -0,0 +1,179 @@
+"""
+Local search for k-colouring on indexed graphs (see graph.index_graph).
+
+`ConflictTable` keeps gamma[v][c], the number of neighbours of v that have
+colour c. With it, the change in conflicts of recolouring v to c is
+gamma[v][c] - gamma[v][colour of v], an O(1) lookup, and applying a move
+only touches the neighbours of v (O(deg)). The set of conflicting nodes is
+maintained alongside (a list with a position index, so that adding,
+removing and sampling are all O(1)), so the searches only look at nodes
+that matter.
+
+- `tabu_search`: Tabucol (Hertz & de Werra, with the Galinier-Hao tenure
+  L + alpha * |conflicting nodes|). After v leaves colour c, moving v back
+  to c is tabu for that many iterations unless it beats the best score seen
+  (aspiration).
+- `annealing`: simulated annealing over random recolourings of conflicting
+  nodes.
+
+Both return (colors, conflicts, iterations); conflicts == 0 means a proper
+k-colouring was found.
+"""
+
+import math
+import random
+import time
+
+from .graph import index_graph
+from .greedy import dsatur_order
+
+
+class ConflictTable:
+    def __init__(self, adj, k, colors):
+        self.adj = adj
+        self.k = k
+        self.colors = list(colors)
+        self.gamma = [[0] * k for _ in adj]
+        for v, neighbors in enumerate(adj):
+            row = self.gamma[v]
+            for u in neighbors:
+                row[self.colors[u]] += 1
+        self.conflicts = sum(self.gamma[v][self.colors[v]] for v in range(len(adj))) // 2
+        self.conflicting = [v for v in range(len(adj)) if self.gamma[v][self.colors[v]] > 0]
+        self._position = [-1] * len(adj)
+        for i, v in enumerate(self.conflicting):
+            self._position[v] = i
+
+    def _update(self, v):
+        """Puts v in or out of the conflicting list according to its current colour."""
+        position = self._position
+        if self.gamma[v][self.colors[v]] > 0:
+            if position[v] < 0:
+                position[v] = len(self.conflicting)
+                self.conflicting.append(v)
+        elif position[v] >= 0:
+            last = self.conflicting.pop()
+            if last != v:
+                self.conflicting[position[v]] = last
+                position[last] = position[v]
+            position[v] = -1
+
+    def delta(self, v, c):
+        """Change in the number of conflicting edges if v is recoloured to c."""
+        row = self.gamma[v]
+        return row[c] - row[self.colors[v]]
+
+    def move(self, v, c):
+        old = self.colors[v]
+        if old == c:
+            return
+        self.conflicts += self.delta(v, c)
+        self.colors[v] = c
+        gamma = self.gamma
+        colors = self.colors
+        for u in self.adj[v]:
+            row = gamma[u]
+            row[old] -= 1
+            row[c] += 1
+            if colors[u] == old or colors[u] == c:
+                self._update(u)
+        self._update(v)
+
+
+def initial_colors(nodes, adj, k, rng):
+    """DSATUR colouring with the colours beyond k replaced by random ones."""
+    colors, _ = dsatur_order(nodes, adj)
+    return [c if c < k else rng.randrange(k) for c in colors]
+
+
+def tabu_search(adj, k, colors, max_iters=100000, tenure=10, alpha=0.6, time_limit=None, rng=None):
+    rng = rng or random.Random()
+    table = ConflictTable(adj, k, colors)
+    # tabu[v][c]: iteration until which moving v to c is forbidden
+    tabu = [[0] * k for _ in adj]
+    best_colors = list(table.colors)
+    best_conflicts = table.conflicts
+    if k < 2:
+        return best_colors, best_conflicts, 0  # a single colour leaves no move to make
+    deadline = time.time() + time_limit if time_limit is not None else None
+
+    iteration = 0
+    while best_conflicts > 0 and iteration < max_iters:
+        iteration += 1
+        if deadline is not None and iteration % 256 == 0 and time.time() > deadline:
+            break
+
+        best_delta = None
+        candidates = []
+        for v in table.conflicting:
+            row = table.gamma[v]
+            current = row[table.colors[v]]
+            tabu_row = tabu[v]
+            for c in range(k):
+                if c == table.colors[v]:
+                    continue
+                d = row[c] - current
+                if tabu_row[c] > iteration and table.conflicts + d >= best_conflicts:
+                    continue  # tabu and no aspiration
+                if best_delta is None or d < best_delta:
+                    best_delta = d
+                    candidates = [(v, c)]
+                elif d == best_delta:
+                    candidates.append((v, c))
+
+        if not candidates:
+            # Every move is tabu: recolour a random conflicting node
+            v = rng.choice(table.conflicting)
+            c = rng.choice([c for c in range(k) if c != table.colors[v]])
+        else:
+            v, c = rng.choice(candidates)
+
+        old = table.colors[v]
+        table.move(v, c)
+        tabu[v][old] = iteration + rng.randrange(tenure) + int(alpha * len(table.conflicting)) + 1
+
+        if table.conflicts < best_conflicts:
+            best_conflicts = table.conflicts
+            best_colors = list(table.colors)
+
+    return best_colors, best_conflicts, iteration
+
+
+def annealing(adj, k, colors, max_steps=10000, initial_temp=100.0, cooling_rate=0.995, min_temp=0.05, rng=None):
+    rng = rng or random.Random()
+    table = ConflictTable(adj, k, colors)
+    best_colors = list(table.colors)
+    best_conflicts = table.conflicts
+    temp = initial_temp
+
+    step = 0
+    while best_conflicts > 0 and step < max_steps and k > 1:
+        step += 1
+        v = rng.choice(table.conflicting)
+        c = rng.randrange(k - 1)
+        if c >= table.colors[v]:
+            c += 1
+        d = table.delta(v, c)
+        if d <= 0 or rng.random() < math.exp(-d / temp):
+            table.move(v, c)
+            if table.conflicts < best_conflicts:
+                best_conflicts = table.conflicts
+                best_colors = list(table.colors)
+        temp = max(temp * cooling_rate, min_temp)
+
+    return best_colors, best_conflicts, step
+
+
+def tabucol(graph, colors, max_iters=100000, time_limit=None, seed=None):
+    """
+    Tabucol on an adjacency dict with the palette `colors`. Returns the best
+    assignment found (node -> colour), which may still have conflicts.
+    """
+    rng = random.Random(seed)
+    nodes, adj = index_graph(graph)
+    k = len(colors)
+    if not nodes or k == 0:
+        return {}
+    start = initial_colors(nodes, adj, k, rng)
+    best, _, _ = tabu_search(adj, k, start, max_iters=max_iters, time_limit=time_limit, rng=rng)
+    return {nodes[i]: colors[c] for i, c in enumerate(best)}
@@ -0,0 +1,227 @@
+"""
+Size-aware planning for `solve_graph_coloring`.
+
+`graph_features` measures the instance (nodes, edges, density, degrees,
+palette size, colours of a DSATUR colouring, size of a greedy clique). `COST_MODEL` maps every
+algorithm to an estimate of its work units for those features, and `SECONDS_PER_UNIT` (measured on a laptop,
+CPython 3.11) turns units into seconds. `plan` compares each prediction to
+the per-algorithm budget:
+
+    run     the prediction fits the budget
+    budget  the algorithm runs with a `max_nodes` cap worth the budget (the
+            exhaustive searches may still find a solution early)
+    skip    even a capped run is pointless (a full traversal of the search
+            tree is needed before any solution can be returned)
+
+The exhaustive estimates multiply, depth by depth, the expected number of
+colours compatible with the already-coloured neighbours of the next node,
+k * (1 - 1/k) ** (its earlier neighbours), to get the size of each level of
+the search tree. Tabucol and HEA are bounded by the solver's time limit.
+
+Every run is recorded in a `PredictionLog` (predicted vs measured seconds)
+so the constants can be tuned; `summary()` gives the median log10 error
+per algorithm, and `save()` appends the records as JSON lines. The log keeps
+only the last `MAX_RECORDS` runs, so a long-lived server does not grow it
+without bound.
+"""
+
+import json
+import math
+import statistics
+from collections import deque
+
+from .exact import greedy_clique
+from .graph import index_graph
+from .greedy import dsatur_order
+
+# Log10 cap for the exhaustive estimates (anything beyond is "forever")
+MAX_LOG10 = 30.0
+
+# Runs kept by a `PredictionLog` (older ones are dropped)
+MAX_RECORDS = 1000
+
+SECONDS_PER_UNIT = {
+    'DSATUR': 1.6e-7,
+    'RLF': 4e-7,
+    'Welsh-Powell': 7.5e-7,
+    'BFS': 3e-7,
+    'DFS': 3e-7,
+    'IDDFS': 2e-7,
+    'Simulated Annealing': 2e-7,
+    'Tabucol': 2e-7,
+    'Evolutiv (HEA)': 1.8e-6,
+    'MRV': 2e-8,
+}
+
+# Searches that cannot return anything before the whole tree (up to depth n) is built
+_TRAVERSAL_FIRST = ('BFS', 'IDDFS')
+_EXHAUSTIVE = ('BFS', 'DFS', 'IDDFS', 'MRV')
+_TIME_BOUNDED = ('Tabucol', 'Evolutiv (HEA)')
+
+
+def graph_features(graph, colors):
+    nodes, adj = index_graph(graph)
+    n = len(nodes)
+    degrees = [len(a) for a in adj]
+    m = sum(degrees) // 2
+    greedy, _ = dsatur_order(nodes, adj)
+    by_degree = sorted(range(n), key=lambda v: -degrees[v])
+    return {
+        'nodes': n,
+        'edges': m,
+        'density': 2 * m / (n * (n - 1)) if n > 1 else 0.0,
+        'avg_degree': 2 * m / n if n else 0.0,
+        'max_degree': max(degrees, default=0),
+        'colors': len(colors),
+        'greedy_colors': len(set(greedy)),
+        'clique': len(greedy_clique(nodes, adj, by_degree[:200])),
+    }
+
+
+def _log10_sum(logs):
+    top = max(logs)
+    return top + math.log10(sum(10 ** (x - top) for x in logs))
+
+
+def _log10_levels(f):
+    """
+    log10 of the expected number of states at each depth of the exhaustive
+    search tree. The i-th node has on average avg_degree * i / (n - 1)
+    coloured neighbours, so it keeps k * (1 - 1/k) ** that many colours.
+    """
+    k, n = f['colors'], f['nodes']
+    levels = [0.0]
+    if k == 0:
+        return levels
+    earlier_per_position = f['avg_degree'] / (n - 1) if n > 1 else 0.0
+    shrink = math.log10(1 - 1 / k) if k > 1 else -MAX_LOG10
+    log_size = 0.0
+    for i in range(n):
+        log_size += math.log10(k) + earlier_per_position * i * shrink
+        if log_size < -6 or log_size > MAX_LOG10:
+            break  # the tree has died out / is astronomically large
+        levels.append(log_size)
+    if log_size > MAX_LOG10:
+        levels.append(MAX_LOG10)
+    return levels
+
+
+def _tree_size(f, iterative=False):
+    """Expected states of the search tree; `iterative` counts IDDFS's re-expansions (depth d is visited n - d + 1 times)."""
+    levels = _log10_levels(f)
+    if iterative:
+        levels = [x + math.log10(f['nodes'] + 1 - d) for d, x in enumerate(levels)]
+    return 10 ** min(_log10_sum(levels), MAX_LOG10)
+
+
+def _greedy_suffices(f):
+    """With more colours than the maximum degree, the first path of any search succeeds."""
+    return f['colors'] > f['max_degree']
+
+
+def _first_solution(f, per_node):
+    if _greedy_suffices(f):
+        return f['nodes'] * per_node
+    return _tree_size(f) * per_node
+
+
+def _local_search(f, per_iteration, iterations):
+    """Local searches start from DSATUR: nothing to do if it already fits the palette."""
+    if f['greedy_colors'] <= f['colors']:
+        return (f['nodes'] + f['edges']) * math.log2(f['nodes'] + 2)
+    return iterations * per_iteration
+
+
+COST_MODEL = {
+    'DSATUR': lambda f: (f['nodes'] + f['edges']) * math.log2(f['nodes'] + 2),
+    'RLF': lambda f: (f['nodes'] + f['edges']) * math.log2(f['nodes'] + 2) * max(f['max_degree'], 1) ** 0.5,
+    'Welsh-Powell': lambda f: f['nodes'] * math.log2(f['nodes'] + 2) + f['edges'],
+    'BFS': lambda f: _tree_size(f) * f['colors'] * (f['avg_degree'] + 1),
+    'IDDFS': lambda f: _tree_size(f, iterative=True) * f['colors'] * (f['avg_degree'] + 1),
+    'DFS': lambda f: _first_solution(f, f['colors'] * (f['avg_degree'] + 1)),
+    'Simulated Annealing': lambda f: f['nodes'] + f['edges'] + 10000 * (f['avg_degree'] + f['colors']),
+    # Tabucol scans (conflicting nodes x colours) per iteration, up to 100000 iterations
+    'Tabucol': lambda f: _local_search(f, f['nodes'] * f['colors'], 100000),
+    # Setup only (DSATUR, clique); when it has to search, HEA runs until the time limit (see predict)
+    'Evolutiv (HEA)': lambda f: (f['nodes'] + f['edges']) * math.log2(f['nodes'] + 2),
+    'MRV': lambda f: _first_solution(f, f['nodes'] * (f['avg_degree'] + f['colors'])),
+}
+
+
+def predict(name, features, time_limit=None):
+    """Predicted seconds for algorithm `name`; `time_limit` caps the time-bounded local searches."""
+    seconds = COST_MODEL[name](features) * SECONDS_PER_UNIT[name]
+    if name in _TIME_BOUNDED and time_limit is not None:
+        # HEA gives up at once below the clique bound, otherwise searches until the limit
+        if name == 'Evolutiv (HEA)' and features['clique'] <= features['colors'] < features['greedy_colors']:
+            return time_limit
+        seconds = min(seconds, time_limit)
+    return seconds
+
+
+def node_budget(name, features, budget):
+    """`max_nodes` cap worth about `budget` seconds for an exhaustive search.
+
+    A secondary limit: the per-node estimate leaves out the assignment copies, so the
+    solver also passes `budget` as a wall-clock `time_limit`.
+    """
+    per_node = SECONDS_PER_UNIT[name] * features['colors'] * (features['avg_degree'] + 1)
+    if name == 'MRV':
+        per_node = SECONDS_PER_UNIT[name] * features['nodes'] * (features['avg_degree'] + features['colors'])
+    return max(int(budget / max(per_node, 1e-12)), 1)
+
+
+def plan(features, algorithms, budget=2.0, time_limit=None):
+    """
+    Returns one entry per algorithm, in order:
+        {'algorithm', 'action' ('run' | 'budget' | 'skip'), 'predicted', 'max_nodes'}
+    """
+    entries = []
+    for name in algorithms:
+        predicted = predict(name, features, time_limit)
+        entry = {'algorithm': name, 'action': 'run', 'predicted': predicted, 'max_nodes': None}
+        if predicted > budget and name in _EXHAUSTIVE:
+            if name in _TRAVERSAL_FIRST:
+                entry['action'] = 'skip'
+            else:
+                entry['action'] = 'budget'
+                entry['max_nodes'] = node_budget(name, features, budget)
+        entries.append(entry)
+    return entries
+
+
+class PredictionLog:
+    def __init__(self, max_records=MAX_RECORDS):
+        self.records = deque(maxlen=max_records)
+        self.unsaved = 0  # records appended since the last `save`
+
+    def record(self, features, entry, actual, completed=True):
+        """`completed` is False for runs cut by their node budget (their time says nothing about the model)."""
+        self.records.append({
+            'algorithm': entry['algorithm'],
+            'action': entry['action'],
+            'predicted': entry['predicted'],
+            'actual': actual,
+            'completed': completed,
+            **features,
+        })
+        self.unsaved = min(self.unsaved + 1, len(self.records))
+
+    def summary(self):
+        """Per algorithm, over the kept runs: runs used and median log10(actual / predicted) (0 = exact, 1 = 10x slower)."""
+        errors = {}
+        for r in self.records:
+            if r['action'] == 'skip' or not r['completed'] or r['predicted'] <= 0:
+                continue
+            errors.setdefault(r['algorithm'], []).append(math.log10(max(r['actual'], 1e-7) / r['predicted']))
+        return {name: {'runs': len(e), 'median_log10_error': statistics.median(e)} for name, e in errors.items()}
+
+    def save(self, path):
+        """Appends the records not saved yet (so repeated saves do not duplicate lines)."""
+        with open(path, 'a') as f:
+            for r in list(self.records)[len(self.records) - self.unsaved:]:
+                f.write(json.dumps(r) + "\n")
+        self.unsaved = 0
+
+
+PREDICTIONS = PredictionLog()
@@ -1,6 +1,6 @@
 from ai_project.csp.model import CSP, BinaryConstraint
 
-def create_coloring_problem(graph, colors):
+def create_coloring_problem(graph, colors, symmetry_breaking=False):
     """
     Creează o problemă de colorare a grafurilor ca o problemă de satisfacere a constrângerilor (CSP).
 
@@ -10,6 +10,10 @@ def create_coloring_problem(graph, colors):
                       Exemplu: {'A': ['B', 'C'], 'B': ['A'], 'C': ['A']}
         colors (list): O listă de culori disponibile.
                        Exemplu: ['red', 'green', 'blue']
+        symmetry_breaking (bool): Culorile sunt interschimbabile: solverul încearcă doar
+                       culorile deja folosite plus o singură culoare nouă (al i-lea nod
+                       colorat poate folosi doar culorile 0..i), deci fiecare fundătură
+                       este explorată o singură dată, nu de k! ori.
 
     Returns:
         CSP: O instanță a clasei CSP care modelează problema de colorare a grafului.
@@ -25,4 +29,7 @@ def create_coloring_problem(graph, colors):
                 constraint = BinaryConstraint(node, neighbor, '!=')
                 constraints.append(constraint)
                 
-    return CSP(variables, domains, constraints)
+    csp = CSP(variables, domains, constraints)
+    if symmetry_breaking:
+        csp.interchangeable_values = list(colors)
+    return csp
@@ -5,56 +5,99 @@ from contextlib import redirect_stdout
 from .problem import create_coloring_problem
 from ai_project.csp.solver import solve_step_by_step
 from .algorithms import bfs, dfs, iddfs, simulated_annealing, solve_coloring_mrv, count_conflicts
+from .greedy import dsatur, rlf, welsh_powell
+from .graph import colors_used
+from .exact import chromatic_number
+from .local_search import tabucol
+from .evolutionary import hybrid_evolutionary
+from .planner import graph_features, plan, PREDICTIONS
 
-def solve_graph_coloring(graph_str, colors_str):
+ALGORITHMS = ('DSATUR', 'RLF', 'Welsh-Powell', 'BFS', 'DFS', 'IDDFS', 'MRV',
+              'Simulated Annealing', 'Tabucol', 'Evolutiv (HEA)')
+
+def solve_graph_coloring(graph_str, colors_str, mode='feasibility', time_limit=10.0, algorithm_budget=2.0):
     """
     Rezolvă o problemă de colorare a grafului folosind mai mulți algoritmi și compară rezultatele.
 
     Args:
-        graph_str (str): O reprezentare JSON a grafului (listă de adiacență).
+        graph_str (str | dict | CSRGraph): O reprezentare JSON a grafului (listă de adiacență)
+                         sau un graf deja încărcat (de ex. cu `load_graph`, din CLI). Căile de
+                         fișiere nu sunt acceptate aici: interfața web trimite textul direct.
         colors_str (str): O listă de culori separate prin virgulă.
+        mode (str): 'feasibility' (se poate colora cu culorile date?) sau
+                    'chromatic' (numărul cromatic, cu demonstrație de optimalitate).
+        time_limit (float): Bugetul de timp (secunde) pentru modul 'chromatic' și bugetul
+                            comun al căutărilor locale: HEA primește doar ce a rămas după Tabucol
+                            și rulează numai dacă niciun alt algoritm nu a găsit o colorare validă.
+        algorithm_budget (float): Timpul (secunde) permis fiecărei căutări exhaustive: fiecare
+                                  se oprește la acest termen; planificatorul le omite sau le
+                                  limitează și numărul de stări.
 
     Returns:
         str: Un raport detaliat cu performanța algoritmilor și soluția găsită.
     """
     try:
-        graph = json.loads(graph_str)
-        colors = [c.strip() for c in colors_str.split(',')]
-    except (json.JSONDecodeError, AttributeError):
+        graph = json.loads(graph_str) if isinstance(graph_str, str) else graph_str
+        colors = [c.strip() for c in colors_str.split(',') if c.strip()]
+    except (json.JSONDecodeError, AttributeError, ValueError):
         return "Format invalid pentru graf sau culori. Graful trebuie să fie un JSON, iar culorile o listă separată de virgule."
 
+    if mode == 'chromatic':
+        return solve_chromatic_number(graph, colors, time_limit)
+
     results = {}
     output_buffer = io.StringIO()
 
+    # Planificare: estimează costul fiecărui algoritm și omite / limitează căutările exhaustive
+    features = graph_features(graph, colors)
+    planned = {e['algorithm']: e for e in plan(features, ALGORITHMS, budget=algorithm_budget, time_limit=time_limit)}
+
+    def record(name, duration, completed=True):
+        PREDICTIONS.record(features, planned[name], duration, completed)
+        if planned[name]['action'] == 'budget':
+            print(f"Estimare planificator: peste bugetul de {algorithm_budget}s.")
+        else:
+            print(f"Estimare planificator: {planned[name]['predicted']:.4f}s.")
+
     with redirect_stdout(output_buffer):
         print(f"Rezolvare Graph Coloring pentru {len(graph)} noduri și {len(colors)} culori...\n")
+        print(f"Caracteristici: {features['edges']} muchii, densitate {features['density']:.3f}, "
+              f"grad maxim {features['max_degree']}.\n")
 
-        # --- BFS ---
-        print("--- Testare BFS ---")
-        start = time.time()
-        sol_bfs = bfs(graph, colors)
-        duration = time.time() - start
-        results['BFS'] = {'time': duration, 'solution': sol_bfs}
-        print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_bfs else 'NU'}")
-        print("-" * 20 + "\n")
+        # --- Euristici rapide (DSATUR, RLF, Welsh-Powell) ---
+        # Colorează fără paletă fixă; soluția e validă dacă folosesc cel mult len(colors) culori.
+        for name, algo in (('DSATUR', dsatur), ('RLF', rlf), ('Welsh-Powell', welsh_powell)):
+            print(f"--- Testare {name} ---")
+            start = time.time()
+            coloring = algo(graph)
+            duration = time.time() - start
+            used = colors_used(coloring)
+            solution = {node: colors[c] for node, c in coloring.items()} if used <= len(colors) else None
+            results[name] = {'time': duration, 'solution': solution}
+            print(f"Timp: {duration:.4f}s. Culori folosite: {used}. Încape în paleta dată: {'DA' if solution else 'NU'}")
+            record(name, duration)
+            print("-" * 20 + "\n")
 
-        # --- DFS ---
-        print("--- Testare DFS ---")
-        start = time.time()
-        sol_dfs = dfs(graph, colors)
-        duration = time.time() - start
-        results['DFS'] = {'time': duration, 'solution': sol_dfs}
-        print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_dfs else 'NU'}")
-        print("-" * 20 + "\n")
-
-        # --- IDDFS ---
-        print("--- Testare IDDFS ---")
-        start = time.time()
-        sol_iddfs = iddfs(graph, colors)
-        duration = time.time() - start
-        results['IDDFS'] = {'time': duration, 'solution': sol_iddfs}
-        print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_iddfs else 'NU'}")
-        print("-" * 20 + "\n")
+        # --- Căutări exhaustive (BFS, DFS, IDDFS, MRV), după plan ---
+        # Fiecare are termenul algorithm_budget (ceas real); limita de stări e doar secundară.
+        for name, algo in (('BFS', bfs), ('DFS', dfs), ('IDDFS', iddfs), ('MRV', solve_coloring_mrv)):
+            print(f"--- Testare {name} ---")
+            entry = planned[name]
+            if entry['action'] == 'skip':
+                print(f"Omis: căutarea completă ar depăși bugetul de {algorithm_budget}s.")
+                PREDICTIONS.record(features, entry, 0.0, completed=False)
+                print("-" * 20 + "\n")
+                continue
+            if entry['action'] == 'budget':
+                print(f"Limitat la {algorithm_budget}s și {entry['max_nodes']} stări.")
+            start = time.time()
+            solution = algo(graph, colors, max_nodes=entry['max_nodes'], time_limit=algorithm_budget)
+            duration = time.time() - start
+            results[name] = {'time': duration, 'solution': solution}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if solution else 'NU'}")
+            cut = entry['action'] == 'budget' or duration >= algorithm_budget
+            record(name, duration, completed=solution is not None or not cut)
+            print("-" * 20 + "\n")
 
         # --- Simulated Annealing ---
         print("--- Testare Simulated Annealing ---")
@@ -64,16 +107,40 @@ def solve_graph_coloring(graph_str, colors_str):
         conflicts = count_conflicts(graph, sol_sa)
         results['Simulated Annealing'] = {'time': duration, 'solution': sol_sa, 'conflicts': conflicts}
         print(f"Timp: {duration:.4f}s. Conflicte: {conflicts}")
+        record('Simulated Annealing', duration)
         print("-" * 20 + "\n")
 
-        # --- MRV ---
-        print("--- Testare MRV ---")
+        # --- Tabucol ---
+        # Tabucol și HEA împart același buget de timp (time_limit)
+        print("--- Testare Tabucol ---")
         start = time.time()
-        sol_mrv = solve_coloring_mrv(graph, colors)
+        sol_tabu = tabucol(graph, colors, time_limit=time_limit)
         duration = time.time() - start
-        results['MRV'] = {'time': duration, 'solution': sol_mrv}
-        print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_mrv else 'NU'}")
+        conflicts = count_conflicts(graph, sol_tabu)
+        results['Tabucol'] = {'time': duration, 'solution': sol_tabu, 'conflicts': conflicts}
+        print(f"Timp: {duration:.4f}s. Conflicte: {conflicts}")
+        record('Tabucol', duration)
         print("-" * 20 + "\n")
+        remaining = max(time_limit - duration, 0.0)
+
+        # --- Algoritm evolutiv hibrid (HEA) ---
+        # Doar dacă nimeni nu a găsit o colorare validă; rulează în proces (workers=1), fără pool per cerere.
+        found = any(res['solution'] and res.get('conflicts', 0) == 0 for res in results.values())
+        if found:
+            print("--- Evolutiv (HEA) omis (o colorare validă a fost deja găsită) ---\n")
+            PREDICTIONS.record(features, planned['Evolutiv (HEA)'], 0.0, completed=False)
+        elif remaining <= 0:
+            print("--- Evolutiv (HEA) omis (bugetul de timp a fost consumat de Tabucol) ---\n")
+            PREDICTIONS.record(features, planned['Evolutiv (HEA)'], 0.0, completed=False)
+        else:
+            print("--- Testare Evolutiv (HEA) ---")
+            start = time.time()
+            hea = hybrid_evolutionary(graph, colors, time_limit=remaining, workers=1)
+            duration = time.time() - start
+            results['Evolutiv (HEA)'] = {'time': duration, 'solution': hea['coloring'], 'conflicts': hea['conflicts']}
+            print(f"Timp: {duration:.4f}s. Generații: {hea['generations']}. Conflicte: {hea['conflicts']}")
+            record('Evolutiv (HEA)', duration)
+            print("-" * 20 + "\n")
 
     # Generare raport final
     response = output_buffer.getvalue()
@@ -83,7 +150,7 @@ def solve_graph_coloring(graph_str, colors_str):
     valid_algos = {}
     for name, res in results.items():
         if res['solution']:
-            if name == 'Simulated Annealing' and res['conflicts'] > 0:
+            if res.get('conflicts', 0) > 0:
                 continue
             valid_algos[name] = res['time']
     
@@ -98,3 +165,32 @@ def solve_graph_coloring(graph_str, colors_str):
         response += "Niciun algoritm nu a găsit o soluție validă completă."
 
     return response
+
+
+def solve_chromatic_number(graph, colors, time_limit=10.0):
+    """
+    Calculează numărul cromatic al grafului: marginea superioară din DSATUR/RLF,
+    marginea inferioară dintr-o clică, apoi branch-and-bound DSATUR în limita
+    de timp.
+
+    Returns:
+        str: Raport cu marginile găsite, dacă optimalitatea a fost demonstrată și colorarea.
+    """
+    result = chromatic_number(graph, time_limit=time_limit)
+
+    response = f"Număr cromatic pentru {len(result['coloring'])} noduri (buget {time_limit:g}s)...\n\n"
+    response += f"Timp: {result['time']:.4f}s. Noduri explorate (branch-and-bound): {result['nodes']}\n"
+    response += f"Margine inferioară (clică): {result['lower_bound']}. Cea mai bună colorare: {result['colors']} culori.\n"
+
+    response += "\n=== Concluzie ===\n"
+    if result['optimal']:
+        response += f"Numărul cromatic este **{result['colors']}** (optimalitate demonstrată).\n"
+    else:
+        response += (f"Bugetul de timp s-a epuizat: numărul cromatic este între "
+                     f"{result['lower_bound']} și {result['colors']} (optimalitate nedemonstrată).\n")
+
+    def name(c):
+        return colors[c] if c < len(colors) else f"culoarea {c + 1}"
+    formatted_sol = "\n".join(f"{k}: {name(v)}" for k, v in sorted(result['coloring'].items(), key=lambda kv: str(kv[0])))
+    response += f"\nColorarea ({result['colors']} culori):\n{formatted_sol}"
+    return response
@@ -2,7 +2,12 @@ import time
 import math
 import random
 from collections import deque
+from collections.abc import Sequence
 import heapq
+import itertools
+from array import array
+
+import numpy as np
 
 class HanoiState:
     """Represents a state in the Tower of Hanoi puzzle.
@@ -31,8 +36,8 @@ class HanoiState:
         Returns:
             bool: True if the current state is the goal state, False otherwise.
         """
-        # Goal: all disks on the last peg (index 2)
-        return len(self.pegs[2]) == self.n_disks
+        # Goal: all disks on the last peg
+        return len(self.pegs[-1]) == self.n_disks
 
     def successors(self):
         """Generates all valid successor states from the current state.
@@ -45,13 +50,14 @@ class HanoiState:
                   and the move (disk, source_peg, destination_peg) that led to it.
         """
         children = []
-        for i in range(3):
+        n_pegs = len(self.pegs)
+        for i in range(n_pegs):
             if not self.pegs[i]:
                 continue
             
             disk = self.pegs[i][-1]
             
-            for j in range(3):
+            for j in range(n_pegs):
                 if i == j:
                     continue
                 
@@ -100,129 +106,229 @@ class HanoiState:
         """
         return False # Needed for priority queue if costs are equal
 
+def initial_state(n_disks, n_pegs=3):
+    """Returns the start state: all disks on the first of `n_pegs` pegs.
+
+    Args:
+        n_disks (int): The number of disks in the puzzle.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
+
+    Returns:
+        HanoiState: The initial state.
+    """
+    initial_pegs = (tuple(range(n_disks, 0, -1)),) + ((),) * (n_pegs - 1)
+    return HanoiState(initial_pegs, n_disks)
+
+# --- Integer State Encoding ---
+# A state is the integer sum(peg(d) * n_pegs ** (d - 1)) over the disks d = 1..n
+# (base 3 for the classic puzzle): all disks on peg 0 is 0, all on the last peg
+# is n_pegs ** n - 1. BFS and DFS keep one byte per state in a bytearray of size
+# n_pegs ** n: 0 while unvisited, otherwise the move that reached it, which is
+# enough to step back to the parent, so it doubles as the parent-pointer array.
+
+MAX_STATES = 3 ** 16
+"""The largest state space (n_pegs ** n_disks) that BFS and DFS accept."""
+
+_START = 255
+"""Marker of the start state in the visited table (moves are coded 1..254)."""
+
+def encode_state(state):
+    """Encodes a HanoiState as an integer (digit d - 1, in base n_pegs, is the peg of disk d).
+
+    Args:
+        state (HanoiState): The state to encode.
+
+    Returns:
+        int: The integer code of the state.
+    """
+    n_pegs = len(state.pegs)
+    code = 0
+    for peg_idx, peg in enumerate(state.pegs):
+        for disk in peg:
+            code += peg_idx * n_pegs ** (disk - 1)
+    return code
+
+def decode_state(code, n_disks, n_pegs=3):
+    """Decodes an integer produced by `encode_state` back into a HanoiState.
+
+    Args:
+        code (int): The integer code of the state.
+        n_disks (int): The number of disks in the puzzle.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
+
+    Returns:
+        HanoiState: The decoded state.
+    """
+    pegs = [[] for _ in range(n_pegs)]
+    for disk in range(1, n_disks + 1):
+        code, peg_idx = divmod(code, n_pegs)
+        pegs[peg_idx].append(disk)
+    return HanoiState(tuple(tuple(reversed(peg)) for peg in pegs), n_disks)
+
+class IntegerMoves:
+    """Successor generation on integer-encoded states.
+
+    The top disk of each peg is the smallest disk on it, so it is read from the low
+    digits. The moves of every value of the lowest `width` digits are precomputed
+    (about 2^16 entries): when each peg has a disk among those, the successors are a
+    table lookup; otherwise the state is decoded in full.
+    """
+    def __init__(self, n_disks, n_pegs=3):
+        self.n_disks = n_disks
+        self.n_pegs = n_pegs
+        self.power = [n_pegs ** d for d in range(n_disks)]
+        width = 1
+        while width < n_disks and n_pegs ** (width + 1) <= 1 << 16:
+            width += 1
+        self.chunk = n_pegs ** width
+        self.table = []
+        for low in range(self.chunk):
+            tops = self._tops(low, width)
+            self.table.append(self._moves(tops) if all(tops) or width == n_disks else None)
+
+    def _tops(self, code, width):
+        """Top disk of each peg among the `width` smallest disks (0 for none)."""
+        tops = [0] * self.n_pegs
+        for disk in range(1, width + 1):
+            code, peg_idx = divmod(code, self.n_pegs)
+            if not tops[peg_idx]:
+                tops[peg_idx] = disk
+        return tops
+
+    def _moves(self, tops):
+        """The (code delta, move byte) pairs of every legal move."""
+        n_pegs = self.n_pegs
+        return tuple(
+            ((j - i) * self.power[tops[i] - 1], (tops[i] - 1) * n_pegs + i + 1)
+            for i in range(n_pegs) if tops[i]
+            for j in range(n_pegs) if j != i and (not tops[j] or tops[j] > tops[i])
+        )
+
+    def successors(self, code):
+        """Returns the (code delta, move byte) pairs of the moves legal in state `code`."""
+        moves = self.table[code % self.chunk]
+        if moves is None:
+            moves = self._moves(self._tops(code, self.n_disks))
+        return moves
+
+    def move(self, code, move_byte):
+        """Decodes the move byte that reached state `code` into ((disk, src, dst), parent code)."""
+        disk, src = divmod(move_byte - 1, self.n_pegs)
+        dst = code // self.power[disk] % self.n_pegs
+        return (disk + 1, src, dst), code - (dst - src) * self.power[disk]
+
+    def between(self, code, child):
+        """The move (disk, src, dst) that turns state `code` into the adjacent state `child`."""
+        disk = 0
+        while code // self.power[disk] % self.n_pegs == child // self.power[disk] % self.n_pegs:
+            disk += 1
+        return (disk + 1, code // self.power[disk] % self.n_pegs, child // self.power[disk] % self.n_pegs)
+
+    def path(self, came_from, goal):
+        """Follows the move bytes (bytearray or dict) back from `goal` to the start and returns the moves in order."""
+        moves = []
+        code = goal
+        while came_from[code] != _START:
+            move, code = self.move(code, came_from[code])
+            moves.append(move)
+        moves.reverse()
+        return moves
+
 # --- Search Algorithms ---
 
-def bfs(n_disks):
+def bfs(n_disks, n_pegs=3):
     """Solves the Tower of Hanoi puzzle using Breadth-First Search (BFS).
 
     BFS explores the state space layer by layer, guaranteeing that the first solution
-    found is the optimal one (i.e., has the minimum number of moves). However, it can
-    be memory-intensive.
+    found is the optimal one (i.e., has the minimum number of moves). States are
+    integers and the visited set is a bytearray over all n_pegs ** n_disks states,
+    so the whole space can be searched (about 10s for 15 disks on 3 pegs).
 
     Args:
         n_disks (int): The number of disks in the puzzle.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
 
     Returns:
-        list: A list of moves representing the solution path, or None if no solution
-              is found within the search limit.
+        list: A list of moves representing the solution path, or None if the state
+              space is larger than MAX_STATES.
     """
-    initial_pegs = (tuple(range(n_disks, 0, -1)), (), ())
-    start_state = HanoiState(initial_pegs, n_disks)
-    
-    if start_state.is_goal(): return []
-
-    frontier = deque([(start_state, [])])
-    explored = {start_state}
-    
-    MAX_NODES = 100000
-    nodes = 0
+    if n_pegs ** n_disks > MAX_STATES:
+        return None
+    moves = IntegerMoves(n_disks, n_pegs)
+    goal = n_pegs ** n_disks - 1
+    came_from = bytearray(n_pegs ** n_disks)
+    came_from[0] = _START
 
+    frontier = deque([0])
     while frontier:
-        state, path = frontier.popleft()
-        nodes += 1
-        if nodes > MAX_NODES: return None
+        code = frontier.popleft()
+        if code == goal:
+            return moves.path(came_from, goal)
 
-        if state.is_goal():
-            return path
-        
-        for child, move in state.successors():
-            if child not in explored:
-                explored.add(child)
-                new_path = path + [move]
-                frontier.append((child, new_path))
+        for delta, move_byte in moves.successors(code):
+            child = code + delta
+            if not came_from[child]:
+                came_from[child] = move_byte
+                frontier.append(child)
     return None
 
-def dfs(n_disks):
+def dfs(n_disks, n_pegs=3):
     """Solves the Tower of Hanoi puzzle using Depth-First Search (DFS).
 
     DFS explores as far as possible along each branch before backtracking. It is not
-    guaranteed to find the optimal solution and can get trapped in long paths.
+    guaranteed to find the optimal solution and can get trapped in long paths. It uses
+    the same integer states and bytearray visited table as `bfs`.
 
     Args:
         n_disks (int): The number of disks in the puzzle.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
 
     Returns:
-        list: A list of moves representing the solution path, or None if no solution
-              is found within the search limit.
+        list: A list of moves representing the solution path, or None if the state
+              space is larger than MAX_STATES.
     """
-    initial_pegs = (tuple(range(n_disks, 0, -1)), (), ())
-    start_state = HanoiState(initial_pegs, n_disks)
-    
-    stack = [(start_state, [])]
-    explored = {start_state}
-    
-    MAX_NODES = 100000
-    nodes = 0
+    if n_pegs ** n_disks > MAX_STATES:
+        return None
+    moves = IntegerMoves(n_disks, n_pegs)
+    goal = n_pegs ** n_disks - 1
+    came_from = bytearray(n_pegs ** n_disks)
+    came_from[0] = _START
 
+    stack = [0]
     while stack:
-        state, path = stack.pop()
-        nodes += 1
-        if nodes > MAX_NODES: return None # Prune
+        code = stack.pop()
+        if code == goal:
+            return moves.path(came_from, goal)
 
-        if state.is_goal():
-            return path
-        
-        for child, move in state.successors():
-            if child not in explored:
-                explored.add(child)
-                new_path = path + [move]
-                stack.append((child, new_path))
+        for delta, move_byte in moves.successors(code):
+            child = code + delta
+            if not came_from[child]:
+                came_from[child] = move_byte
+                stack.append(child)
     return None
 
-def iddfs(n_disks):
-    """Solves the Tower of Hanoi puzzle using Iterative Deepening DFS (IDDFS).
+def iddfs(n_disks, n_pegs=3, heuristic=None):
+    """Solves the Tower of Hanoi puzzle by iterative deepening (IDA*, see `ida_star`).
+
+    Instead of raising the depth limit one move at a time and restarting a plain
+    depth-limited DFS, the bound is an f = g + h cost that jumps to the next candidate
+    solution length, and a transposition table prunes states already searched in the
+    current iteration. Like BFS, it is guaranteed to find the optimal solution.
 
-    IDDFS combines the benefits of DFS (low memory usage) and BFS (optimal solutions)
-    by performing a series of depth-limited searches. It is guaranteed to find the
-    optimal solution.
+    With the default heuristic the estimate is exact (3 pegs, or a pattern database
+    covering every disk), so the first iteration walks the optimal path and the speed
+    comes from the heuristic alone; 'disks' exercises the bound jumps and the table.
 
     Args:
         n_disks (int): The number of disks in the puzzle.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
+        heuristic (str, optional): 'exact', 'pdb' or 'disks', as for `astar`.
 
     Returns:
-        list: A list of moves representing the optimal solution path, or None if no
-              solution is found within the maximum depth limit.
+        list: A list of moves representing the optimal solution path.
     """
-    initial_pegs = (tuple(range(n_disks, 0, -1)), (), ())
-    start_state = HanoiState(initial_pegs, n_disks)
-
-    def dls(state, path, limit, visited):
-        if state.is_goal():
-            return path
-        if limit == 0:
-            return None
-        
-        visited.add(state)
-        
-        for child, move in state.successors():
-            if child not in visited:
-                result = dls(child, path + [move], limit - 1, visited)
-                if result is not None:
-                    return result
-        
-        visited.remove(state) # Backtrack
-        return None
-
-    depth = 0
-    max_depth = 2**n_disks + 5 # Optimal is 2^n - 1
-    
-    while depth <= max_depth:
-        visited = set()
-        result = dls(start_state, [], depth, visited)
-        if result is not None:
-            return result
-        depth += 1
-    return None
+    return ida_star(initial_state(n_disks, n_pegs), decode_state(n_pegs ** n_disks - 1, n_disks, n_pegs),
+                    heuristic=heuristic)
 
 # --- Simulated Annealing ---
 
@@ -242,16 +348,17 @@ def heuristic(state):
         int: The heuristic cost of the state.
     """
     # Cost = sum(2^k * dist_to_target)
-    # If disk k is on target (peg 2), cost 0.
+    # If disk k is on target (the last peg), cost 0.
     # If disk k is on source/aux, cost 2^k.
     cost = 0
+    target = len(state.pegs) - 1
     for peg_idx, peg in enumerate(state.pegs):
         for disk in peg:
-            if peg_idx != 2: # Not on target peg
+            if peg_idx != target: # Not on target peg
                 cost += 2 ** (disk - 1)
     return cost
 
-def simulated_annealing(n_disks, max_steps=10000):
+def simulated_annealing(n_disks, max_steps=10000, n_pegs=3):
     """Solves the Tower of Hanoi puzzle using Simulated Annealing.
 
     Simulated Annealing is a probabilistic technique for approximating the global
@@ -268,14 +375,14 @@ def simulated_annealing(n_disks, max_steps=10000):
         n_disks (int): The number of disks in the puzzle.
         max_steps (int, optional): The maximum number of steps to run the algorithm for.
                                  Defaults to 10000.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
 
     Returns:
         list: A list of moves representing the solution path, or None if no solution
               is found within the given number of steps. The solution is not guaranteed
               to be optimal.
     """
-    initial_pegs = (tuple(range(n_disks, 0, -1)), (), ())
-    current_state = HanoiState(initial_pegs, n_disks)
+    current_state = initial_state(n_disks, n_pegs)
     current_cost = heuristic(current_state)
     
     path = [] # We only track the path taken, SA doesn't guarantee shortest path
@@ -347,3 +454,617 @@ def solve_hanoi_recursive(n_disks):
     
     # Convert to format (disk, from_idx, to_idx)
     return moves
+
+
+# --- Binary (Iterative) Optimal ---
+# Move k (1-based) of the optimal solution moves disk = index of the lowest set
+# bit of k; its pegs follow from k alone, so any move can be computed directly.
+
+def move_at(n_disks, k, source=0, target=2, auxiliary=1):
+    """Returns the k-th move (1 <= k <= 2^n - 1) of the optimal solution in O(1) arithmetic.
+
+    Args:
+        n_disks (int): The number of disks in the puzzle.
+        k (int): The 1-based index of the move.
+        source, target, auxiliary (int): The peg indices of the transfer.
+
+    Returns:
+        tuple: The move (disk, source_peg, destination_peg).
+    """
+    if not 1 <= k < 2 ** n_disks:
+        raise IndexError(f"move {k} out of range for {n_disks} disks")
+    disk = (k & -k).bit_length()
+    src = (k & (k - 1)) % 3
+    dst = ((k | (k - 1)) + 1) % 3
+    # The canonical sequence ends on peg 2 for odd n and on peg 1 for even n
+    pegs = (source, target, auxiliary) if n_disks % 2 == 0 else (source, auxiliary, target)
+    return (disk, pegs[src], pegs[dst])
+
+def iter_hanoi_moves(n_disks, source=0, target=2, auxiliary=1):
+    """Lazily generates the optimal move sequence, one (disk, src, dst) tuple at a time.
+
+    Args:
+        n_disks (int): The number of disks in the puzzle.
+        source, target, auxiliary (int): The peg indices of the transfer.
+
+    Yields:
+        tuple: The moves (disk, source_peg, destination_peg), in order.
+    """
+    pegs = (source, target, auxiliary) if n_disks % 2 == 0 else (source, auxiliary, target)
+    for k in range(1, 2 ** n_disks):
+        yield ((k & -k).bit_length(), pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3])
+
+class HanoiMoves(Sequence):
+    """The optimal move sequence as a read-only sequence that is never materialised.
+
+    Supports len(), indexing (via `move_at`), slicing (returns a list) and
+    iteration (via `iter_hanoi_moves`), so it can stand in for the move list
+    of `solve_hanoi_recursive` for any number of disks. From 64 disks on the
+    length no longer fits len() (a C ssize_t): use `n_moves` instead.
+    """
+    def __init__(self, n_disks, source=0, target=2, auxiliary=1):
+        self.n_disks = n_disks
+        self.pegs = (source, target, auxiliary)
+
+    @property
+    def n_moves(self):
+        """The number of moves, 2^n - 1, as a Python int of any size."""
+        return 2 ** self.n_disks - 1
+
+    def __len__(self):
+        return self.n_moves
+
+    def __bool__(self):
+        return self.n_moves > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.n_moves))]
+        if index < 0:
+            index += self.n_moves
+        if not 0 <= index < self.n_moves:
+            raise IndexError("move index out of range")
+        return move_at(self.n_disks, index + 1, *self.pegs)
+
+    def __iter__(self):
+        return iter_hanoi_moves(self.n_disks, *self.pegs)
+
+
+# --- Frame–Stewart (k pegs) ---
+# Move the t smallest disks to an intermediate peg (using all p pegs), the
+# n - t largest to the target (using the p - 1 remaining pegs), then the t
+# smallest on top of them: FS(n, p) = min_t 2 * FS(t, p) + FS(n - t, p - 1).
+# Optimal for 3 and 4 pegs (proved), conjectured optimal beyond.
+
+def frame_stewart_table(n_disks, n_pegs):
+    """Computes the Frame–Stewart move counts and optimal split points.
+
+    The cost 2 * FS(t, p) + FS(n - t, p - 1) is convex in t and its minimiser does
+    not decrease with n, so the search for each n resumes at the split of n - 1:
+    the table costs O(n_disks * n_pegs) instead of O(n_disks^2 * n_pegs).
+
+    Args:
+        n_disks (int): The largest number of disks.
+        n_pegs (int): The largest number of pegs (at least 3).
+
+    Returns:
+        tuple: (moves, split), where moves[p][n] is the number of moves for n disks on
+               p pegs and split[p][n] the number of small disks parked on the way
+               (for 3 <= p <= n_pegs, 0 <= n <= n_disks).
+    """
+    if n_pegs < 3:
+        raise ValueError("Frame–Stewart needs at least 3 pegs")
+    moves = {3: [2 ** n - 1 for n in range(n_disks + 1)]}
+    split = {3: [max(n - 1, 0) for n in range(n_disks + 1)]}
+    for p in range(4, n_pegs + 1):
+        fewer = moves[p - 1]
+        cur, best_t = [0] * (n_disks + 1), [0] * (n_disks + 1)
+        t = 0
+        for n in range(1, n_disks + 1):
+            cost = lambda t: 2 * cur[t] + fewer[n - t]
+            while t + 1 < n and cost(t + 1) <= cost(t):
+                t += 1
+            cur[n], best_t[n] = cost(t), t
+        moves[p], split[p] = cur, best_t
+    return moves, split
+
+
+class FrameStewartMoves(Sequence):
+    """The Frame–Stewart move sequence from peg 0 to the last peg, never materialised.
+
+    Indexing descends the split tree using the move counts of `frame_stewart_table`
+    down to a three-peg sub-transfer, answered by `move_at`; iteration
+    streams the moves, and slicing returns a list. As for `HanoiMoves`, `n_moves`
+    gives the length when it is too large for len().
+    """
+    def __init__(self, n_disks, n_pegs=3):
+        self.n_disks = n_disks
+        self.n_pegs = n_pegs
+        self.moves, self.split = frame_stewart_table(n_disks, n_pegs)
+
+    @property
+    def n_moves(self):
+        """The number of moves, as a Python int of any size."""
+        return self.moves[self.n_pegs][self.n_disks]
+
+    def __len__(self):
+        return self.n_moves
+
+    def __bool__(self):
+        return self.n_moves > 0
+
+    def _parts(self, n, pegs):
+        """The three sub-transfers of moving n disks over `pegs` (source first, target last)."""
+        p = len(pegs)
+        t = self.split[p][n]
+        source, parking, target = pegs[0], pegs[-2], pegs[-1]
+        return [
+            (t, 0, (source,) + pegs[1:-2] + (target, parking)),     # t smallest -> parking
+            (n - t, t, (source,) + pegs[1:-2] + (target,)),          # rest -> target, without parking
+            (t, 0, (parking,) + pegs[1:-2] + (source, target)),     # t smallest -> target
+        ]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.n_moves))]
+        if index < 0:
+            index += self.n_moves
+        if not 0 <= index < self.n_moves:
+            raise IndexError("move index out of range")
+        n, offset, pegs = self.n_disks, 0, tuple(range(self.n_pegs))
+        while len(pegs) > 3:
+            for size, shift, sub_pegs in self._parts(n, pegs):
+                count = self.moves[len(sub_pegs)][size]
+                if index < count:
+                    n, offset, pegs = size, offset + shift, sub_pegs
+                    break
+                index -= count
+        disk, src, dst = move_at(n, index + 1, pegs[0], pegs[2], pegs[1])
+        return (disk + offset, src, dst)
+
+    def __iter__(self):
+        return self._iter(self.n_disks, 0, tuple(range(self.n_pegs)))
+
+    def _iter(self, n, offset, pegs):
+        if n == 0:
+            return
+        if len(pegs) == 3:
+            for disk, src, dst in iter_hanoi_moves(n, pegs[0], pegs[2], pegs[1]):
+                yield (disk + offset, src, dst)
+            return
+        for size, shift, sub_pegs in self._parts(n, pegs):
+            yield from self._iter(size, offset + shift, sub_pegs)
+
+
+# --- Arbitrary Configurations (A*, Bidirectional BFS) ---
+# Shortest move sequences between any two legal configurations. Both searches
+# work on integer codes (`encode_state`) with dictionaries for the visited
+# states, so they are not bounded by MAX_STATES.
+
+PDB_STATES = 1 << 16
+"""Largest number of states of one pattern database group."""
+
+def _state_codes(start, goal):
+    """Validates two configurations and returns (start code, goal code, n_disks, n_pegs)."""
+    n_pegs = len(start.pegs)
+    if len(goal.pegs) != n_pegs:
+        raise ValueError("start and goal have different numbers of pegs")
+    for state in (start, goal):
+        disks = sorted(disk for peg in state.pegs for disk in peg)
+        if disks != list(range(1, state.n_disks + 1)) or any(list(peg) != sorted(peg, reverse=True) for peg in state.pegs):
+            raise ValueError("illegal configuration")
+    if start.n_disks != goal.n_disks:
+        raise ValueError("start and goal have different numbers of disks")
+    return encode_state(start), encode_state(goal), start.n_disks, n_pegs
+
+def _pegs_of(code, n_disks, n_pegs):
+    """The peg of each disk, indexed by disk (index 0 unused)."""
+    pegs = [0]
+    for _ in range(n_disks):
+        code, peg_idx = divmod(code, n_pegs)
+        pegs.append(peg_idx)
+    return pegs
+
+def _tower_distance(pegs, k, peg):
+    """Moves needed to gather disks 1..k of a 3-peg configuration on `peg`."""
+    moves = 0
+    for disk in range(k, 0, -1):
+        if pegs[disk] != peg:
+            # Disks 1..disk-1 go to the third peg, `disk` moves, and they follow it
+            moves += 2 ** (disk - 1)
+            peg = 3 - pegs[disk] - peg
+    return moves
+
+def hanoi_distance(start, goal):
+    """Returns the exact 3-peg distance between two configurations in O(n).
+
+    Disks that already sit on their goal peg above every misplaced disk are ignored.
+    The largest misplaced disk d goes from peg a to peg b either directly (the smaller
+    disks wait on the third peg c) or, if that is cheaper, through c (moving twice,
+    the smaller disks waiting on b and then on a); the smaller disks only gather into
+    towers, whose distances are closed-form.
+
+    Args:
+        start (HanoiState): The start configuration (3 pegs).
+        goal (HanoiState): The goal configuration (3 pegs).
+
+    Returns:
+        int: The minimum number of moves from start to goal.
+    """
+    start_code, goal_code, n_disks, n_pegs = _state_codes(start, goal)
+    if n_pegs != 3:
+        raise ValueError("the analytic distance is only defined for 3 pegs")
+    return _distance3(_pegs_of(start_code, n_disks, 3), _pegs_of(goal_code, n_disks, 3), n_disks)
+
+def _distance3(s, t, n_disks):
+    d = n_disks
+    while d and s[d] == t[d]:
+        d -= 1
+    if not d:
+        return 0
+    a, b = s[d], t[d]
+    c = 3 - a - b
+    direct = _tower_distance(s, d - 1, c) + 1 + _tower_distance(t, d - 1, c)
+    twice = _tower_distance(s, d - 1, b) + 1 + (2 ** (d - 1) - 1) + 1 + _tower_distance(t, d - 1, a)
+    return min(direct, twice)
+
+class PatternDatabase:
+    """Additive pattern database heuristic for one goal configuration.
+
+    The disks are split into contiguous groups of at most log_{n_pegs}(PDB_STATES)
+    disks. For each group, a BFS over its own sub-puzzle (the other disks removed)
+    from the goal's projection gives the exact distance of every projection. Each
+    move moves a disk of exactly one group, and removing disks only relaxes the
+    puzzle, so the sum over the groups is admissible and consistent.
+    """
+    def __init__(self, goal_code, n_disks, n_pegs=3):
+        self.n_pegs = n_pegs
+        size = 1
+        while size < n_disks and n_pegs ** (size + 1) <= PDB_STATES:
+            size += 1
+        self.groups = []
+        for lo in range(0, n_disks, size):
+            m = min(size, n_disks - lo)
+            projection = goal_code // n_pegs ** lo % n_pegs ** m
+            self.groups.append((n_pegs ** lo, n_pegs ** m, self._distances(projection, m)))
+
+    def _distances(self, goal, m):
+        """BFS from `goal` over the m-disk sub-puzzle (moves are reversible)."""
+        moves = IntegerMoves(m, self.n_pegs)
+        dist = array('l', [-1]) * self.n_pegs ** m
+        dist[goal] = 0
+        frontier = deque([goal])
+        while frontier:
+            code = frontier.popleft()
+            for delta, _ in moves.successors(code):
+                child = code + delta
+                if dist[child] < 0:
+                    dist[child] = dist[code] + 1
+                    frontier.append(child)
+        return dist
+
+    def __call__(self, code):
+        return sum(dist[code // low % span] for low, span, dist in self.groups)
+
+def _heuristic(name, goal_code, n_disks, n_pegs):
+    """Builds the heuristic `name` ('exact', 'pdb', 'disks'; None picks the best available) for a goal."""
+    name = name or ('exact' if n_pegs == 3 else 'pdb')
+    if name == 'exact':
+        if n_pegs != 3:
+            raise ValueError("the exact heuristic is only defined for 3 pegs")
+        target = _pegs_of(goal_code, n_disks, 3)
+        return lambda code: _distance3(_pegs_of(code, n_disks, 3), target, n_disks)
+    if name == 'pdb':
+        return PatternDatabase(goal_code, n_disks, n_pegs)
+    if name == 'disks':
+        target = _pegs_of(goal_code, n_disks, n_pegs)
+        return lambda code: sum(a != b for a, b in zip(_pegs_of(code, n_disks, n_pegs), target))
+    raise ValueError(f"unknown heuristic {name!r}")
+
+def astar(start, goal, heuristic=None, max_nodes=None):
+    """Finds a shortest move sequence between two configurations with A*.
+
+    Args:
+        start (HanoiState): The start configuration.
+        goal (HanoiState): The goal configuration (same disks and pegs).
+        heuristic (str, optional): 'exact' (the analytic distance, 3 pegs only: A* then
+                                   only expands states on an optimal path), 'pdb' (additive
+                                   pattern database) or 'disks' (number of misplaced
+                                   disks). Defaults to 'exact' for 3 pegs, 'pdb' otherwise.
+        max_nodes (int, optional): Give up after expanding this many states.
+
+    Returns:
+        list: The moves (disk, source_peg, destination_peg) of a shortest path, or None
+              if `max_nodes` was reached.
+    """
+    start_code, goal_code, n_disks, n_pegs = _state_codes(start, goal)
+    h = _heuristic(heuristic, goal_code, n_disks, n_pegs)
+    moves = IntegerMoves(n_disks, n_pegs)
+    came_from = {start_code: _START}
+    cost = {start_code: 0}
+    # Ties on f go to the deepest state, so a perfect heuristic walks straight to the goal
+    frontier = [(h(start_code), 0, start_code)]
+    nodes = 0
+    while frontier:
+        _, neg_g, code = heapq.heappop(frontier)
+        g = -neg_g
+        if g > cost[code]:
+            continue
+        if code == goal_code:
+            return moves.path(came_from, goal_code)
+        nodes += 1
+        if max_nodes is not None and nodes > max_nodes:
+            return None
+        for delta, move_byte in moves.successors(code):
+            child = code + delta
+            if g + 1 < cost.get(child, g + 2):
+                cost[child] = g + 1
+                came_from[child] = move_byte
+                heapq.heappush(frontier, (g + 1 + h(child), -(g + 1), child))
+    return None
+
+def bidirectional_bfs(start, goal, max_nodes=None):
+    """Finds a shortest move sequence between two configurations with bidirectional BFS.
+
+    Both searches grow one whole layer at a time, always on the smaller frontier. As
+    long as they have not met, the distance exceeds the sum of their depths, so the
+    first state of a new layer that the other search has seen joins a shortest path.
+
+    Args:
+        start (HanoiState): The start configuration.
+        goal (HanoiState): The goal configuration (same disks and pegs).
+        max_nodes (int, optional): Give up after visiting this many states.
+
+    Returns:
+        list: The moves (disk, source_peg, destination_peg) of a shortest path, or None
+              if `max_nodes` was reached.
+    """
+    start_code, goal_code, n_disks, n_pegs = _state_codes(start, goal)
+    moves = IntegerMoves(n_disks, n_pegs)
+    # {code: move byte that reached it} and the current layer, per side
+    forward, backward = {start_code: _START}, {goal_code: _START}
+    layers = {id(forward): [start_code], id(backward): [goal_code]}
+    if start_code == goal_code:
+        return []
+
+    while layers[id(forward)] and layers[id(backward)]:
+        if max_nodes is not None and len(forward) + len(backward) > max_nodes:
+            return None
+        side, other = ((forward, backward) if len(layers[id(forward)]) <= len(layers[id(backward)])
+                       else (backward, forward))
+        next_layer = []
+        for code in layers[id(side)]:
+            for delta, move_byte in moves.successors(code):
+                child = code + delta
+                if child in other:
+                    if side is backward:
+                        code, child = child, code
+                    head = moves.path(forward, code) + [moves.between(code, child)]
+                    # The goal side's moves, reversed and inverted, lead from `child` to the goal
+                    tail = moves.path(backward, child)
+                    return head + [(disk, dst, src) for disk, src, dst in reversed(tail)]
+                if child not in side:
+                    side[child] = move_byte
+                    next_layer.append(child)
+        layers[id(side)] = next_layer
+    return None
+
+
+# --- IDA* ---
+
+def ida_star(start, goal, heuristic=None, table_size=1 << 20, max_nodes=None):
+    """Finds a shortest move sequence between two configurations with IDA*.
+
+    Each iteration is a depth-first search that prunes every state whose f = g + h
+    exceeds the bound; the next bound is the smallest f that was pruned, so the bound
+    jumps straight to the next candidate length instead of growing by one move.
+    A transposition table of `table_size` slots (indexed by the state code, the newest
+    entry replaces the old one on collision) remembers the depth at which each state
+    was entered during the current iteration: reaching it again no shallower is pruned.
+
+    Args:
+        start (HanoiState): The start configuration.
+        goal (HanoiState): The goal configuration (same disks and pegs).
+        heuristic (str, optional): 'exact', 'pdb' or 'disks', as for `astar`.
+        table_size (int, optional): The number of transposition table slots.
+        max_nodes (int, optional): Give up after expanding this many states.
+
+    Returns:
+        list: The moves (disk, source_peg, destination_peg) of a shortest path, or None
+              if `max_nodes` was reached.
+    """
+    start_code, goal_code, n_disks, n_pegs = _state_codes(start, goal)
+    h = _heuristic(heuristic, goal_code, n_disks, n_pegs)
+    moves = IntegerMoves(n_disks, n_pegs)
+    # Transposition table: state code, depth and iteration of the entry in each slot
+    table_codes = [-1] * table_size
+    table_depths = array('l', [0]) * table_size
+    table_iterations = array('l', [-1]) * table_size
+
+    if start_code == goal_code:
+        return []
+
+    def expand(code, g, bound):
+        """Children within the bound (best f first) and the smallest f beyond it."""
+        children, pruned = [], math.inf
+        for delta, move_byte in moves.successors(code):
+            child = code + delta
+            f = g + 1 + h(child)
+            if f > bound:
+                pruned = min(pruned, f)
+            else:
+                children.append((f, child, move_byte))
+        children.sort()
+        return iter(children), pruned
+
+    bound = h(start_code)
+    iteration = 0
+    nodes = 0
+    while True:
+        children, next_bound = expand(start_code, 0, bound)
+        stack = [children]             # children iterators of the states on the current path
+        path = []                      # moves from the start to the current state
+        while stack:
+            step = next(stack[-1], None)
+            if step is None:
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
+            _, child, move_byte = step
+            g = len(stack)
+            move = moves.move(child, move_byte)[0]
+            if child == goal_code:
+                return path + [move]
+
+            slot = child % table_size
+            if table_codes[slot] == child and table_iterations[slot] == iteration and table_depths[slot] <= g:
+                continue
+            table_codes[slot], table_depths[slot], table_iterations[slot] = child, g, iteration
+
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                return None
+            children, pruned = expand(child, g, bound)
+            next_bound = min(next_bound, pruned)
+            path.append(move)
+            stack.append(children)
+        if next_bound == math.inf:
+            return None
+        bound = next_bound
+        iteration += 1
+
+
+# --- Packed Moves ---
+# A move is stored as its (source, destination) peg pair in a (moves, 2) uint8
+# array: 2 bytes instead of a ~72-byte tuple. The disk is implied (the top disk
+# of the source peg), so it is recovered by replaying from the start state.
+
+def pack_moves(moves):
+    """Packs a move sequence into a (len, 2) uint8 array of (source, destination) pegs.
+
+    The binary optimal sequence (`HanoiMoves`) is generated directly in vectorised
+    chunks; any other sequence (a list, `FrameStewartMoves`) is streamed.
+
+    Args:
+        moves (Sequence): The moves (disk, source_peg, destination_peg).
+
+    Returns:
+        numpy.ndarray: The packed moves.
+    """
+    if isinstance(moves, HanoiMoves):
+        return _pack_binary(moves)
+    pegs = itertools.chain.from_iterable((src, dst) for _, src, dst in moves)
+    return np.fromiter(pegs, dtype=np.uint8, count=2 * len(moves)).reshape(-1, 2)
+
+def _pack_binary(moves, chunk=1 << 20):
+    """Vectorised `move_at` over the whole sequence, `chunk` moves at a time."""
+    source, target, auxiliary = moves.pegs
+    pegs = np.array((source, target, auxiliary) if moves.n_disks % 2 == 0 else (source, auxiliary, target),
+                    dtype=np.uint8)
+    packed = np.empty((len(moves), 2), dtype=np.uint8)
+    for lo in range(1, len(moves) + 1, chunk):
+        k = np.arange(lo, min(lo + chunk, len(moves) + 1), dtype=np.int64)
+        packed[lo - 1:lo - 1 + len(k), 0] = pegs[(k & (k - 1)) % 3]
+        packed[lo - 1:lo - 1 + len(k), 1] = pegs[((k | (k - 1)) + 1) % 3]
+    return packed
+
+def unpack_moves(packed, start):
+    """Replays packed moves from `start` and returns them as (disk, source, destination) tuples.
+
+    Args:
+        packed (numpy.ndarray): The packed moves.
+        start (HanoiState): The configuration the moves start from.
+
+    Returns:
+        list: The moves, or None if one of them is illegal.
+    """
+    stacks = [list(peg) for peg in start.pegs]
+    moves = []
+    for src, dst in zip(packed[:, 0].tobytes(), packed[:, 1].tobytes()):
+        from_peg, to_peg = stacks[src], stacks[dst]
+        if src == dst or not from_peg or (to_peg and to_peg[-1] < from_peg[-1]):
+            return None
+        to_peg.append(from_peg.pop())
+        moves.append((to_peg[-1], src, dst))
+    return moves
+
+def _track_disk(src, dst, peg, n_pegs):
+    """Follows the smallest remaining disk, starting on `peg`, through the moves (src, dst).
+
+    Being the smallest, it is on top of its peg: a move leaves its peg exactly when it moves
+    it. The sequence is cut in about sqrt(len) chunks; a first sweep computes, for every chunk
+    at once, where each starting peg ends up, the chunk entry pegs follow, and a second sweep
+    replays all chunks side by side.
+
+    Returns:
+        tuple: (mask of the moves of the disk, its final peg, False if another move lands on it).
+    """
+    length = len(src)
+    width = max(64, math.isqrt(length))
+    chunks = -(-length // width)
+    # Padding moves use the missing peg `n_pegs`, so they never touch the disk
+    src_cols = np.full(chunks * width, n_pegs, dtype=np.uint8)
+    dst_cols = np.full(chunks * width, n_pegs, dtype=np.uint8)
+    src_cols[:length], dst_cols[:length] = src, dst
+    src_cols = src_cols.reshape(chunks, width).T.copy()
+    dst_cols = dst_cols.reshape(chunks, width).T.copy()
+
+    ends = np.tile(np.arange(n_pegs, dtype=np.uint8), (chunks, 1))
+    for s, d in zip(src_cols, dst_cols):
+        ends = np.where(ends == s[:, None], d[:, None], ends)
+    entry = np.empty(chunks, dtype=np.uint8)
+    for i in range(chunks):
+        entry[i] = peg
+        peg = ends[i, peg]
+
+    moved = np.empty((width, chunks), dtype=bool)
+    covered = np.zeros(chunks, dtype=bool)
+    for j, (s, d) in enumerate(zip(src_cols, dst_cols)):
+        moved[j] = s == entry
+        covered |= ~moved[j] & (d == entry)
+        entry = np.where(moved[j], d, entry)
+    return moved.T.reshape(-1)[:length], peg, not covered.any()
+
+def verify_moves(packed, n_disks, n_pegs=3, start=None, goal=None):
+    """Checks, vectorised, that packed moves are legal and reach the goal.
+
+    The peg range and the moves from a peg to itself are checked first. On three pegs,
+    from and to the default configurations, a sequence of exactly 2^n - 1 moves is valid
+    only if it is the (unique) optimal one, so it is compared with `_pack_binary` as a
+    whole. Otherwise the disks are peeled off smallest first (`_track_disk`): the moves
+    of the smallest disk are found and removed, no other move may put a disk on it, and
+    the rest must be moves of the larger disks. Each pass is a few NumPy sweeps, and the
+    smaller disks usually move the most, so the total work stays a small multiple of the
+    sequence length (2^25 moves in a few seconds).
+
+    Args:
+        packed (numpy.ndarray): The packed moves (see `pack_moves`).
+        n_disks (int): The number of disks.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
+        start (HanoiState, optional): The start configuration. Defaults to all disks on the first peg.
+        goal (HanoiState, optional): The goal configuration. Defaults to all disks on the last peg.
+
+    Returns:
+        bool: True if every move is legal and the last one reaches the goal.
+    """
+    if packed.size and (int(packed.max()) >= n_pegs or np.any(packed[:, 0] == packed[:, 1])):
+        return False
+    if n_pegs == 3 and start is None and goal is None and len(packed) == 2 ** n_disks - 1:
+        return bool(np.array_equal(packed, _pack_binary(HanoiMoves(n_disks))))
+    start = start or initial_state(n_disks, n_pegs)
+    goal = goal or decode_state(n_pegs ** n_disks - 1, n_disks, n_pegs)
+    start_peg = {disk: i for i, peg in enumerate(start.pegs) for disk in peg}
+    goal_peg = {disk: i for i, peg in enumerate(goal.pegs) for disk in peg}
+    src, dst = packed[:, 0], packed[:, 1]
+    for disk in sorted(start_peg):
+        peg = start_peg[disk]
+        if len(src):
+            moved, peg, legal = _track_disk(src, dst, peg, n_pegs)
+            if not legal:
+                return False
+            src, dst = src[~moved], dst[~moved]
+        if peg != goal_peg.get(disk):
+            return False
+    # Anything left moves a disk from an empty peg
+    return not len(src)
@@ -1,42 +1,116 @@
 import io
 import time
 from contextlib import redirect_stdout
-from .algorithms import bfs, dfs, iddfs, simulated_annealing, solve_hanoi_recursive
+from .algorithms import (bfs, dfs, iddfs, simulated_annealing, solve_hanoi_recursive, HanoiMoves, FrameStewartMoves,
+                         HanoiState, astar, bidirectional_bfs, hanoi_distance, pack_moves, verify_moves)
 
-PEGS = {0: 'A', 1: 'B', 2: 'C'}
+PEGS = {i: chr(ord('A') + i) for i in range(26)}
 """A dictionary that maps peg indices to their names."""
 
-def format_moves(moves):
+def move_count(moves):
+    """The number of moves of a solution, also for lazy sequences too long for len() (64+ disks).
+
+    Args:
+        moves (Sequence): A list of moves, or a lazy `HanoiMoves` / `FrameStewartMoves` sequence.
+
+    Returns:
+        int: The number of moves.
+    """
+    return moves.n_moves if hasattr(moves, 'n_moves') else len(moves)
+
+def format_moves(moves, excerpt=None):
     """Formats a list of moves into a human-readable string.
 
     Args:
-        moves (list): A list of tuples, where each tuple represents a move
-                      and contains the disk number, source peg, and destination peg.
+        moves (Sequence): A list (or a lazy `HanoiMoves` sequence) of tuples, where each
+                          tuple represents a move and contains the disk number, source peg,
+                          and destination peg.
+        excerpt (int, optional): If given and the sequence has more than 2 * excerpt moves,
+                                 only the first and last `excerpt` moves are formatted (by
+                                 indexing, so a lazy sequence is never materialised).
 
     Returns:
         str: A formatted string describing the sequence of moves.
     """
-    if not moves:
+    count = move_count(moves)
+    if count == 0:
         return "Nicio mutare."
+    if excerpt is not None and count > 2 * excerpt:
+        return (format_moves(moves[:excerpt]) + f"\n... (încă {count - 2 * excerpt} mutări) ...\n"
+                + format_moves(moves[-excerpt:]))
     return "\n".join([f"- Mută discul {disk} de la {PEGS[src]} la {PEGS[dest]}" for disk, src, dest in moves])
 
-def solve_hanoi(n_disks):
+def check_solution(result, n_disks, n_pegs=3):
+    """Replays a found solution (packed, see `verify_moves`) and prints the verdict.
+
+    An invalid solution is dropped from `result`, so it cannot win the comparison.
+
+    Args:
+        result (dict): The result entry of an algorithm ({'time', 'solution'}).
+        n_disks (int): The number of disks.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
+    """
+    if result['solution'] is None:
+        return
+    valid = verify_moves(pack_moves(result['solution']), n_disks, n_pegs)
+    print(f"Verificare (reluare mutări): {'validă' if valid else 'INVALIDĂ'}")
+    if not valid:
+        result['solution'] = None
+
+# Secvențele lazy mai lungi nu sunt generate doar pentru cronometrare
+LIMIT_TIMED_MOVES = 2 ** 20
+
+def time_lazy(moves):
+    """Times the generation of every move of a lazy optimal sequence (`pack_moves`) and prints it.
+
+    Building `HanoiMoves` / `FrameStewartMoves` costs nothing, so only a full generation says
+    how fast the algorithm is. Sequences longer than LIMIT_TIMED_MOVES are not generated: their
+    entry is marked lazy and left out of the fastest-algorithm ranking.
+
+    Args:
+        moves (Sequence): The lazy move sequence.
+
+    Returns:
+        dict: The result entry ('time', 'solution', 'lazy').
+    """
+    lazy = move_count(moves) > LIMIT_TIMED_MOVES
+    start = time.time()
+    if not lazy:
+        pack_moves(moves)
+    duration = time.time() - start
+    if lazy:
+        print(f"Timp: necronometrat (peste {LIMIT_TIMED_MOVES} mutări, generate la cerere). Soluție găsită: DA")
+    else:
+        print(f"Timp: {duration:.4f}s (generarea tuturor mutărilor). Soluție găsită: DA")
+    print(f"Număr mutări: {move_count(moves)}")
+    return {'time': duration, 'solution': moves, 'lazy': lazy}
+
+def solve_hanoi(n_disks, n_pegs=3):
     """Solves the Tower of Hanoi problem for a given number of disks using multiple algorithms 
     and compares their performance.
 
     This function implements and benchmarks several algorithms for solving the Tower of Hanoi puzzle:
     - Breadth-First Search (BFS)
     - Depth-First Search (DFS)
-    - Iterative Deepening DFS (IDDFS)
+    - IDA* (iterative deepening on f = g + h, with a transposition table), with the exact
+      heuristic and with the number of misplaced disks
     - Simulated Annealing
     - The optimal recursive solution
+    - The binary (iterative) optimal solution, computed lazily move by move
+    - Frame–Stewart, for more than 3 pegs (replaces the two 3-peg solutions above)
 
-    For a small number of disks (<= 4), it runs all the search algorithms. For a larger number of disks,
-    it skips the search algorithms that are too slow (BFS, DFS, IDDFS) and only runs Simulated Annealing
-    and the optimal recursive solution.
+    The two lazy sequences are timed over the generation of all their moves (see `time_lazy`).
+
+    BFS and DFS run while the state space (n_pegs ** n_disks) has at most 3^12 states, and IDA*
+    up to 15 disks on 3 pegs (exact heuristic) or 4^8 states on more pegs; beyond that they are skipped and only Simulated Annealing and the optimal
+    solution run. The exact heuristic (a pattern database covering every disk on more pegs)
+    makes IDA* walk straight down the optimal path, so its speed comes from the heuristic;
+    the misplaced-disks run (up to 3^6 states) is the one where the bound jumps and the
+    transposition table do the work. When BFS runs, its (optimal) move count verifies the Frame–Stewart one.
 
     Args:
         n_disks (int): The number of disks to solve for. Must be at least 1.
+        n_pegs (int, optional): The number of pegs, between 3 and 26. Defaults to 3.
 
     Returns:
         str: A detailed report string containing the results of each algorithm, including execution time,
@@ -45,98 +119,275 @@ def solve_hanoi(n_disks):
     """
     if n_disks < 1:
         return "Numărul de discuri trebuie să fie cel puțin 1."
+    if not 3 <= n_pegs <= len(PEGS):
+        return f"Numărul de tije trebuie să fie între 3 și {len(PEGS)}."
 
     results = {}
     output_buffer = io.StringIO()
 
     with redirect_stdout(output_buffer):
-        print(f"Rezolvare Hanoi pentru {n_disks} discuri...\n")
+        print(f"Rezolvare Hanoi pentru {n_disks} discuri și {n_pegs} tije...\n")
 
         # Limităm algoritmii de căutare. 
-        # IDDFS este extrem de lent pentru N >= 5 din cauza re-expandării masive în grafuri cu cicluri.
-        # BFS/DFS merg rezonabil până la N=5 sau 6, dar consumă multă memorie.
-        LIMIT_SEARCH = 4 
+        # IDA* are euristica exactă pe 3 tije (parcurge doar drumul optim) și pattern database pe mai multe,
+        # tot exactă până la 4^8 stări: câștigul vine din euristică. Rularea cu discurile deplasate
+        # (euristică slabă) e cea care folosește salturile pragului și tabela de transpoziție.
+        # BFS/DFS folosesc stări codificate ca întregi și un bytearray de vizitare (1 octet/stare),
+        # așa că sunt limitați doar de numărul de stări (3^12 ≈ 531441 stări: ~1s).
+        LIMIT_IDA = 15
+        LIMIT_IDA_STATES = 4 ** 8
+        LIMIT_IDA_DISKS_STATES = 3 ** 6
+        LIMIT_STATES = 3 ** 12
+        search_states = n_pegs ** n_disks <= LIMIT_STATES
 
         # --- BFS ---
-        if n_disks <= LIMIT_SEARCH:
+        if search_states:
             print("--- Testare BFS ---")
             start = time.time()
-            sol_bfs = bfs(n_disks)
+            sol_bfs = bfs(n_disks, n_pegs)
             duration = time.time() - start
             results['BFS'] = {'time': duration, 'solution': sol_bfs}
             print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_bfs is not None else 'NU'}")
             if sol_bfs: print(f"Număr mutări: {len(sol_bfs)}")
             print("-" * 20 + "\n")
         else:
-            print(f"--- BFS omis (N > {LIMIT_SEARCH}) ---\n")
+            print(f"--- BFS omis (peste {LIMIT_STATES} stări) ---\n")
 
         # --- DFS ---
-        if n_disks <= LIMIT_SEARCH:
+        if search_states:
             print("--- Testare DFS ---")
             start = time.time()
-            sol_dfs = dfs(n_disks)
+            sol_dfs = dfs(n_disks, n_pegs)
             duration = time.time() - start
             results['DFS'] = {'time': duration, 'solution': sol_dfs}
             print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_dfs is not None else 'NU'}")
             if sol_dfs: print(f"Număr mutări: {len(sol_dfs)}")
+            check_solution(results['DFS'], n_disks, n_pegs)
+            print("-" * 20 + "\n")
+        else:
+            print(f"--- DFS omis (peste {LIMIT_STATES} stări) ---\n")
+
+        # --- IDA* ---
+        if (n_disks <= LIMIT_IDA) if n_pegs == 3 else (n_pegs ** n_disks <= LIMIT_IDA_STATES):
+            print("--- Testare IDA* ---")
+            start = time.time()
+            sol_ida = iddfs(n_disks, n_pegs)
+            duration = time.time() - start
+            results['IDA*'] = {'time': duration, 'solution': sol_ida}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_ida is not None else 'NU'}")
+            if sol_ida: print(f"Număr mutări: {len(sol_ida)}")
             print("-" * 20 + "\n")
+        elif n_pegs == 3:
+            print(f"--- IDA* omis (N > {LIMIT_IDA}) ---\n")
         else:
-            print(f"--- DFS omis (N > {LIMIT_SEARCH}) ---\n")
+            print(f"--- IDA* omis (peste {LIMIT_IDA_STATES} stări) ---\n")
 
-        # --- IDDFS ---
-        if n_disks <= LIMIT_SEARCH:
-            print("--- Testare IDDFS ---")
+        # --- IDA* cu euristica discurilor deplasate ---
+        if n_pegs ** n_disks <= LIMIT_IDA_DISKS_STATES:
+            print("--- Testare IDA* (discuri deplasate) ---")
             start = time.time()
-            sol_iddfs = iddfs(n_disks)
+            sol_ida_disks = iddfs(n_disks, n_pegs, heuristic='disks')
             duration = time.time() - start
-            results['IDDFS'] = {'time': duration, 'solution': sol_iddfs}
-            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_iddfs is not None else 'NU'}")
-            if sol_iddfs: print(f"Număr mutări: {len(sol_iddfs)}")
+            results['IDA* (discuri deplasate)'] = {'time': duration, 'solution': sol_ida_disks}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_ida_disks is not None else 'NU'}")
+            if sol_ida_disks: print(f"Număr mutări: {len(sol_ida_disks)}")
             print("-" * 20 + "\n")
         else:
-            print(f"--- IDDFS omis (N > {LIMIT_SEARCH}) ---\n")
+            print(f"--- IDA* (discuri deplasate) omis (peste {LIMIT_IDA_DISKS_STATES} stări) ---\n")
 
         # --- Simulated Annealing ---
         print("--- Testare Simulated Annealing ---")
         start = time.time()
-        sol_sa = simulated_annealing(n_disks)
+        sol_sa = simulated_annealing(n_disks, n_pegs=n_pegs)
         duration = time.time() - start
         results['Simulated Annealing'] = {'time': duration, 'solution': sol_sa}
         print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_sa is not None else 'NU'}")
         if sol_sa: print(f"Număr mutări: {len(sol_sa)}")
+        check_solution(results['Simulated Annealing'], n_disks, n_pegs)
         print("-" * 20 + "\n")
 
         # --- Recursive Optimal (Standard) ---
-        print("--- Testare Recursive Optimal (Standard) ---")
-        start = time.time()
-        sol_rec = solve_hanoi_recursive(n_disks)
-        duration = time.time() - start
-        results['Recursive Optimal'] = {'time': duration, 'solution': sol_rec}
-        print(f"Timp: {duration:.4f}s. Soluție găsită: DA")
-        print(f"Număr mutări: {len(sol_rec)}")
-        print("-" * 20 + "\n")
+        # Construiește lista completă de 2^n - 1 mutări: o limităm ca memorie.
+        LIMIT_RECURSIVE = 20
+        if n_pegs == 3:
+            if n_disks <= LIMIT_RECURSIVE:
+                print("--- Testare Recursive Optimal (Standard) ---")
+                start = time.time()
+                sol_rec = solve_hanoi_recursive(n_disks)
+                duration = time.time() - start
+                results['Recursive Optimal'] = {'time': duration, 'solution': sol_rec}
+                print(f"Timp: {duration:.4f}s. Soluție găsită: DA")
+                print(f"Număr mutări: {move_count(sol_rec)}")
+                print("-" * 20 + "\n")
+            else:
+                print(f"--- Recursive Optimal omis (N > {LIMIT_RECURSIVE}, lista de mutări nu încape în memorie) ---\n")
+
+            # --- Binar (Iterativ, lazy) ---
+            # Mutarea k se calculează direct din biții lui k: secvența nu este materializată.
+            print("--- Testare Binar (Iterativ) ---")
+            results['Binar (Iterativ)'] = time_lazy(HanoiMoves(n_disks))
+            print("-" * 20 + "\n")
+
+        # --- Frame–Stewart (k tije, lazy) ---
+        # Secvența optimă pentru mai mult de 3 tije, generată la cerere din tabelul de împărțiri.
+        else:
+            print("--- Testare Frame–Stewart ---")
+            sol_fs = FrameStewartMoves(n_disks, n_pegs)
+            results['Frame–Stewart'] = time_lazy(sol_fs)
+            if results.get('BFS', {}).get('solution') is not None:
+                # BFS găsește drumul minim: confirmă optimalitatea pe instanțe mici
+                optimal = len(results['BFS']['solution']) == move_count(sol_fs)
+                print(f"Verificare BFS: {'optimă' if optimal else 'NU este optimă'} "
+                      f"({len(results['BFS']['solution'])} mutări minime)")
+            print("-" * 20 + "\n")
 
     # Generare raport
     response = output_buffer.getvalue()
     response += "\n=== Concluzie ===\n"
 
+    # Secvențele lazy negenerate nu intră în clasament (timpul lor e doar construcția obiectului)
     valid_algos = {}
     for name, res in results.items():
-        if res.get('solution') is not None:
+        if res.get('solution') is not None and not res.get('lazy'):
             valid_algos[name] = res['time']
+    lazy_algos = [name for name, res in results.items() if res.get('lazy')]
+
+    if valid_algos or lazy_algos:
+        if valid_algos:
+            fastest = min(valid_algos, key=valid_algos.get)
+            response += f"Cel mai rapid algoritm care a găsit o soluție validă este **{fastest}** ({valid_algos[fastest]:.4f}s).\n"
+        else:
+            fastest = lazy_algos[0]
+            response += (f"Doar secvența optimă **{fastest}** este disponibilă "
+                         f"(peste {LIMIT_TIMED_MOVES} mutări, generată la cerere, fără cronometrare).\n")
 
-    if valid_algos:
-        fastest = min(valid_algos, key=valid_algos.get)
-        response += f"Cel mai rapid algoritm care a găsit o soluție validă este **{fastest}** ({valid_algos[fastest]:.4f}s).\n"
-        
         final_sol = results[fastest]['solution']
         # Limităm afișarea pentru soluții foarte lungi
-        if len(final_sol) > 20:
-            formatted_sol = format_moves(final_sol[:10]) + "\n... (încă " + str(len(final_sol) - 20) + " mutări) ...\n" + format_moves(final_sol[-10:])
+        formatted_sol = format_moves(final_sol, excerpt=10)
+
+        response += f"\nSoluția ({fastest}):\n{formatted_sol}"
+    else:
+        response += "Niciun algoritm nu a găsit o soluție."
+
+    return response
+
+def parse_configuration(text, n_pegs=3):
+    """Parses a configuration given as the peg letter of each disk, smallest disk first.
+
+    For example "AAB" puts disks 1 and 2 on peg A and disk 3 on peg B.
+
+    Args:
+        text (str): The peg letters.
+        n_pegs (int, optional): The number of pegs. Defaults to 3.
+
+    Returns:
+        HanoiState: The configuration.
+
+    Raises:
+        ValueError: If a letter does not name one of the pegs.
+    """
+    names = {name: idx for idx, name in PEGS.items() if idx < n_pegs}
+    pegs = [[] for _ in range(n_pegs)]
+    for disk, letter in enumerate(text.strip().upper(), start=1):
+        if letter not in names:
+            raise ValueError(f"Tija '{letter}' nu există (tije: {', '.join(names)}).")
+        pegs[names[letter]].insert(0, disk)
+    return HanoiState(tuple(tuple(peg) for peg in pegs), len(text.strip()))
+
+def solve_hanoi_query(start_text, goal_text, n_pegs=3):
+    """Finds a shortest move sequence between two arbitrary configurations and compares the methods.
+
+    This function runs:
+    - The analytic distance (3 pegs only), used as an oracle for the path lengths
+    - A* (exact analytic heuristic for 3 pegs, additive pattern database otherwise)
+    - Bidirectional BFS, while the state space has at most 3^12 states
+
+    Args:
+        start_text (str): The start configuration (see `parse_configuration`).
+        goal_text (str): The goal configuration, with the same number of disks.
+        n_pegs (int, optional): The number of pegs, between 3 and 26. Defaults to 3.
+
+    Returns:
+        str: A detailed report string with the time and number of moves of each method,
+             followed by a conclusion with the fastest method and its solution.
+    """
+    if not 3 <= n_pegs <= len(PEGS):
+        return f"Numărul de tije trebuie să fie între 3 și {len(PEGS)}."
+    try:
+        start_state = parse_configuration(start_text, n_pegs)
+        goal_state = parse_configuration(goal_text, n_pegs)
+    except ValueError as e:
+        return f"Configurație invalidă: {e}"
+    n_disks = start_state.n_disks
+    if n_disks != goal_state.n_disks:
+        return "Configurațiile de start și final trebuie să aibă același număr de discuri."
+
+    results = {}
+    output_buffer = io.StringIO()
+
+    with redirect_stdout(output_buffer):
+        print(f"Drum minim Hanoi {start_text.strip().upper()} -> {goal_text.strip().upper()} "
+              f"({n_disks} discuri, {n_pegs} tije)...\n")
+
+        LIMIT_STATES = 3 ** 12
+        LIMIT_MOVES = 2 ** 17 # A* exact extinde doar stările de pe drum: cost proporțional cu lungimea lui
+
+        # --- Distanță analitică (oracol, 3 tije) ---
+        distance = None
+        if n_pegs == 3:
+            print("--- Distanță analitică (3 tije) ---")
+            start = time.time()
+            distance = hanoi_distance(start_state, goal_state)
+            duration = time.time() - start
+            print(f"Timp: {duration:.4f}s. Distanță minimă: {distance} mutări")
+            print("-" * 20 + "\n")
+
+        # --- A* ---
+        if (distance if distance is not None else n_pegs ** n_disks) <= (LIMIT_MOVES if n_pegs == 3 else LIMIT_STATES):
+            heuristic = 'distanță exactă' if n_pegs == 3 else 'pattern database aditiv'
+            print(f"--- Testare A* ({heuristic}) ---")
+            start = time.time()
+            sol_astar = astar(start_state, goal_state)
+            duration = time.time() - start
+            results['A*'] = {'time': duration, 'solution': sol_astar}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_astar is not None else 'NU'}")
+            if sol_astar is not None: print(f"Număr mutări: {len(sol_astar)}")
+            print("-" * 20 + "\n")
+        elif n_pegs == 3:
+            print(f"--- A* omis (drum de peste {LIMIT_MOVES} mutări) ---\n")
+        else:
+            print(f"--- A* omis (peste {LIMIT_STATES} stări) ---\n")
+
+        # --- Bidirectional BFS ---
+        if n_pegs ** n_disks <= LIMIT_STATES:
+            print("--- Testare BFS bidirecțional ---")
+            start = time.time()
+            sol_bi = bidirectional_bfs(start_state, goal_state)
+            duration = time.time() - start
+            results['BFS bidirecțional'] = {'time': duration, 'solution': sol_bi}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_bi is not None else 'NU'}")
+            if sol_bi is not None: print(f"Număr mutări: {len(sol_bi)}")
+            print("-" * 20 + "\n")
         else:
-            formatted_sol = format_moves(final_sol)
-            
+            print(f"--- BFS bidirecțional omis (peste {LIMIT_STATES} stări) ---\n")
+
+    # Generare raport
+    response = output_buffer.getvalue()
+    response += "\n=== Concluzie ===\n"
+
+    valid_algos = {name: res['time'] for name, res in results.items() if res.get('solution') is not None}
+    if distance is not None:
+        wrong = [name for name, res in results.items() if res.get('solution') is not None and len(res['solution']) != distance]
+        response += ("Lungimile găsite coincid cu distanța analitică.\n" if not wrong else
+                     f"ATENȚIE: {', '.join(wrong)} nu au găsit un drum minim.\n")
+
+    if valid_algos:
+        fastest = min(valid_algos, key=valid_algos.get)
+        response += f"Cel mai rapid algoritm care a găsit o soluție validă este **{fastest}** ({valid_algos[fastest]:.4f}s).\n"
+        formatted_sol = format_moves(results[fastest]['solution'], excerpt=10)
         response += f"\nSoluția ({fastest}):\n{formatted_sol}"
+    elif distance is not None:
+        response += f"Distanța minimă este {distance} mutări (drumul este prea lung pentru a fi listat)."
     else:
         response += "Niciun algoritm nu a găsit o soluție."
 
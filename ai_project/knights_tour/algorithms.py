@@ -1,3 +1,4 @@
+import itertools
 import random
 import time
 import math
@@ -6,63 +7,92 @@ from collections import deque
 MOVES = [(2, 1), (1, 2), (-1, 2), (-2, 1),
          (-2, -1), (-1, -2), (1, -2), (2, -1)]
 
-class KnightsTourState:
-    """Represents a state in the Knight's Tour problem.
+# --- Search Algorithms ---
+# The exact searches share a compact state: squares are
+# numbered r * n + c, the visited set is an integer bitboard (bit s set = square s
+# visited) and the moves of every square are precomputed once, so a step costs no
+# bounds checks and no copies of the path or the visited set.
+
+def _move_table(n):
+    """Precomputes the squares a knight's move away from every square r * n + c.
+
+    The targets are ordered by their number of exits on the empty board (fewest first,
+    ties in MOVES order), so the searches try corner and edge squares before they get
+    cut off.
 
-    Attributes:
+    Args:
         n (int): The size of the chessboard (n x n).
-        path (list): A list of (x, y) tuples representing the path taken by the knight so far.
-        visited (set): A set of (x, y) tuples representing the visited squares on the board.
-        current_pos (tuple): The current position of the knight (the last element in the path).
+
+    Returns:
+        list: One tuple of target squares per square.
     """
-    def __init__(self, n, path, visited):
-        """Initializes a new KnightsTourState.
-
-        Args:
-            n (int): The size of the board.
-            path (list): The path taken so far.
-            visited (set): The set of visited squares.
-        """
-        self.n = n
-        self.path = path # List of (x, y) tuples
-        self.visited = visited # Set of (x, y) tuples
-        self.current_pos = path[-1]
-
-    def is_goal(self):
-        """Checks if the current state is the goal state.
-
-        The goal is reached when the knight has visited every square on the board exactly once.
-
-        Returns:
-            bool: True if the tour is complete, False otherwise.
-        """
-        return len(self.path) == self.n * self.n
-
-    def successors(self):
-        """Generates all valid successor states from the current state.
-
-        A successor is generated by moving the knight to a valid, unvisited square.
-
-        Returns:
-            list: A list of KnightsTourState objects representing the valid next states.
-        """
-        children = []
-        cx, cy = self.current_pos
-        for dx, dy in MOVES:
-            nx, ny = cx + dx, cy + dy
-            if 0 <= nx < self.n and 0 <= ny < self.n and (nx, ny) not in self.visited:
-                new_path = self.path + [(nx, ny)]
-                new_visited = self.visited | {(nx, ny)}
-                children.append(KnightsTourState(self.n, new_path, new_visited))
-        return children
+    moves = [[(r + dr) * n + c + dc for dr, dc in MOVES if 0 <= r + dr < n and 0 <= c + dc < n]
+             for r in range(n) for c in range(n)]
+    return [tuple(sorted(targets, key=lambda s: len(moves[s]))) for targets in moves]
 
-# --- Search Algorithms ---
+def _unlink(node, n):
+    """Rebuilds the (x, y) path ending at a parent-linked node (square, parent)."""
+    path = []
+    while node is not None:
+        square, node = node
+        path.append(divmod(square, n))
+    return path[::-1]
+
+def _tour_dfs(n, start_pos, limit, max_nodes):
+    """In-place depth-first search for a tour of at most `limit` moves.
+
+    A single path list and bitboard are extended on the way down and undone on the way
+    back (a stack of iterators over the move table), so memory is O(n * n) whatever the
+    size of the search tree.
+
+    Args:
+        n (int): The size of the chessboard (n x n).
+        start_pos (tuple): The starting position of the knight.
+        limit (int): The maximum number of moves.
+        max_nodes (int): The maximum number of nodes expanded.
+
+    Returns:
+        tuple: (path, nodes, cut): the list of (x, y) tuples of the solution path or None,
+               the nodes expanded, and whether a branch was cut off at `limit` moves.
+    """
+    table = _move_table(n)
+    total = n * n
+    square = start_pos[0] * n + start_pos[1]
+    visited = 1 << square
+    path = [square]
+    stack = [iter(table[square] if limit > 0 else ())]
+    nodes_expanded = 1
+    cut = limit == 0 and total > 1
+
+    while len(path) < total:
+        square = next(stack[-1], None)
+        if square is None:
+            stack.pop()
+            if not stack:
+                return None, nodes_expanded, cut
+            visited ^= 1 << path.pop()
+            continue
+        if visited >> square & 1:
+            continue
+        nodes_expanded += 1
+        if nodes_expanded > max_nodes:
+            return None, nodes_expanded, True
+        visited |= 1 << square
+        path.append(square)
+        if len(path) > limit:
+            cut = True  # `limit` moves made: do not go deeper
+            stack.append(iter(()))
+        else:
+            stack.append(iter(table[square]))
+    return [divmod(square, n) for square in path], nodes_expanded, cut
 
 def bfs(n, start_pos=(0,0)):
     """Solves the Knight's Tour problem using Breadth-First Search (BFS).
 
-    BFS is generally not suitable for the Knight's Tour problem on boards larger than 4x4
-    due to its high memory consumption and the large branching factor of the state space.
+    BFS is generally not suitable for the Knight's Tour problem on boards larger than 4x4:
+    every tour is n*n - 1 moves deep and the frontier grows with the branching factor at
+    each level. The frontier holds (square, visited bitboard, path node) entries whose paths
+    are linked to their parents, so an entry costs O(1) memory instead of a copy of its path.
     This implementation includes a node expansion limit to prevent it from running indefinitely.
 
     Args:
@@ -73,26 +103,27 @@ def bfs(n, start_pos=(0,0)):
         list: A list of (x, y) tuples representing the solution path if found within the limit,
               otherwise None.
     """
-    start_state = KnightsTourState(n, [start_pos], {start_pos})
-    frontier = deque([start_state])
-    
-    # BFS will be extremely slow and memory intensive for N > 4
-    # We add a limit to avoid crashing
+    table = _move_table(n)
+    full = (1 << (n * n)) - 1
+    start = start_pos[0] * n + start_pos[1]
+    frontier = deque([(start, 1 << start, (start, None))])
+
     nodes_expanded = 0
-    MAX_NODES = 100000 
+    MAX_NODES = 100000
 
     while frontier:
-        state = frontier.popleft()
+        square, visited, node = frontier.popleft()
         nodes_expanded += 1
-        
-        if state.is_goal():
-            return state.path
-        
+
+        if visited == full:
+            return _unlink(node, n)
+
         if nodes_expanded > MAX_NODES:
             return None # Give up
 
-        for child in state.successors():
-            frontier.append(child)
+        for target in table[square]:
+            if not visited >> target & 1:
+                frontier.append((target, visited | 1 << target, (target, node)))
     return None
 
 def dfs(n, start_pos=(0,0)):
@@ -100,8 +131,8 @@ def dfs(n, start_pos=(0,0)):
 
     DFS explores as far as possible along each branch before backtracking. It is not
     guaranteed to find a solution, especially on larger boards, as it can get stuck
-    in a deep, non-productive path. This implementation includes a node expansion
-    limit to prune branches and prevent infinite loops.
+    in a deep, non-productive path. The search runs in place (one path and one visited
+    bitboard, undone on backtracking) and gives up after a node expansion limit.
 
     Args:
         n (int): The size of the chessboard (n x n).
@@ -110,34 +141,19 @@ def dfs(n, start_pos=(0,0)):
     Returns:
         list: A list of (x, y) tuples representing the solution path if found, otherwise None.
     """
-    start_state = KnightsTourState(n, [start_pos], {start_pos})
-    stack = [start_state]
-    
-    nodes_expanded = 0
     MAX_NODES = 500000
-
-    while stack:
-        state = stack.pop()
-        nodes_expanded += 1
-        
-        if state.is_goal():
-            return state.path
-            
-        if nodes_expanded > MAX_NODES:
-            continue # Prune this branch effectively
-
-        for child in state.successors():
-            stack.append(child)
-    return None
+    path, _, _ = _tour_dfs(n, start_pos, n * n - 1, MAX_NODES)
+    return path
 
 def iddfs(n, start_pos=(0,0)):
     """Solves the Knight's Tour problem using Iterative Deepening DFS (IDDFS).
 
     IDDFS performs a series of depth-limited DFS searches, incrementing the depth
     limit with each iteration. This combines the memory efficiency of DFS with the
-    completeness of BFS (for finite state spaces). However, for the Knight's Tour,
-    the constant re-exploration of the upper parts of the search tree can make it
-    very slow.
+    completeness of BFS (for finite state spaces). However, for the Knight's Tour
+    every solution lies at depth n*n - 1, so each shallower iteration has to exhaust
+    its whole tree first: the iterations share one node expansion limit, and the
+    search stops early if an iteration was never cut off by its depth limit.
 
     Args:
         n (int): The size of the chessboard (n x n).
@@ -146,27 +162,13 @@ def iddfs(n, start_pos=(0,0)):
     Returns:
         list: A list of (x, y) tuples representing the solution path if found, otherwise None.
     """
-    def dls(state, limit):
-        if state.is_goal():
-            return state.path
-        if limit == 0:
-            return None
-        
-        for child in state.successors():
-            result = dls(child, limit - 1)
-            if result is not None:
-                return result
-        return None
-
-    start_state = KnightsTourState(n, [start_pos], {start_pos})
-    depth = 0
-    max_depth = n * n
-    
-    while depth <= max_depth:
-        result = dls(start_state, depth)
-        if result is not None:
-            return result
-        depth += 1
+    MAX_NODES = 500000
+    remaining = MAX_NODES
+    for depth in range(n * n):
+        path, nodes_expanded, cut = _tour_dfs(n, start_pos, depth, remaining)
+        remaining -= nodes_expanded
+        if path is not None or not cut or remaining <= 0:
+            return path
     return None
 
 # --- Simulated Annealing ---
@@ -275,3 +277,418 @@ def solve_knights_tour_mrv(n, start_pos=(0,0)):
                 path[idx] = (r, c)
         return path
     return None
+
+# --- Warnsdorff (Iterative) ---
+# The board is padded with a 2-square border, so every square has the same eight
+# neighbour offsets (the precomputed neighbour table) and no bounds checks are
+# needed: border squares simply start out visited. `degree` holds the number of
+# unvisited neighbours of each square and is decremented around every square the
+# knight visits, so the Warnsdorff choice costs O(8) per move.
+
+MAX_CLOSED_STARTS = 9
+"""Starting squares (the centre and its closest squares) tried for a closed tour."""
+
+MAX_FALLBACK_STARTS = 25
+"""Further starting squares (closest to the requested start) tried for a closed tour."""
+
+MAX_RANDOM_WALKS = 100
+"""Open walks with random tie-breaking tried when everything else got stuck."""
+
+def _padded_board(rows, cols):
+    """Builds the padded board: (width, offsets, visited, degree, far).
+
+    `far` ranks squares by their distance from the centre (lower = farther), for
+    Roth's tie-breaking rule.
+    """
+    width = cols + 4
+    offsets = [dr * width + dc for dr, dc in MOVES]
+    visited = bytearray(b'\x01') * ((rows + 4) * width)
+    degree = [0] * len(visited)
+    far = [0] * len(visited)
+    top = (rows + 4) ** 2 + (cols + 4) ** 2
+    for r in range(rows):
+        base = (r + 2) * width + 2
+        visited[base:base + cols] = bytes(cols)
+        row_moves = [dc for dr, dc in MOVES if 0 <= r + dr < rows]
+        degree[base:base + cols] = [sum(0 <= c + dc < cols for dc in row_moves) for c in range(cols)]
+        dr2 = (2 * r - rows + 1) ** 2
+        far[base:base + cols] = [top - dr2 - (2 * c - cols + 1) ** 2 for c in range(cols)]
+    return width, offsets, visited, degree, far
+
+def _warnsdorff_walk(board, rows, cols, start, rule, last=None, removed=None, rng=None):
+    """One Warnsdorff walk from padded square `start`, without backtracking.
+
+    Ties on the degree are broken by `rule`: 'roth' takes the square farthest from
+    the centre, 'pohl' the one whose unvisited neighbours have the smallest degree sum,
+    'random' a random one (drawn from `rng`).
+    If `last` is given, that square may only be entered as the final move (its
+    neighbours still count it as an exit, so they are left for the end of the tour).
+    If `removed` is given, that square is left out of the tour.
+
+    Returns:
+        list: The padded squares of the tour, or None if the walk got stuck.
+    """
+    width, offsets, visited, degree, far = board
+    visited, degree = bytearray(visited), list(degree)
+    scale = (rows + 4) ** 2 + (cols + 4) ** 2 + 1
+    if removed is not None:
+        visited[removed] = 1
+        for o in offsets:
+            degree[removed + o] -= 1
+    current = start
+    visited[current] = 1
+    path = [current]
+    for o in offsets:
+        degree[current + o] -= 1
+    if last is not None:
+        if visited[last]:
+            return None
+        visited[last] = 1
+
+    for _ in range(rows * cols - 1 - (last is not None) - (removed is not None)):
+        best, best_key = -1, None
+        for o in offsets:
+            square = current + o
+            if not visited[square]:
+                if rule == 'roth':
+                    key = degree[square] * scale + far[square]
+                elif rule == 'random':
+                    key = degree[square] + rng.random()
+                else:
+                    key = degree[square] * 65 + sum(degree[square + o2] for o2 in offsets if not visited[square + o2])
+                if best_key is None or key < best_key:
+                    best, best_key = square, key
+        if best < 0:
+            return None
+        current = best
+        visited[current] = 1
+        path.append(current)
+        for o in offsets:
+            degree[current + o] -= 1
+
+    if last is not None:
+        if last - current not in offsets:
+            return None
+        path.append(last)
+    return path
+
+def closed_tour_exists(rows, cols):
+    """Schwenk's theorem: whether a rows x cols board has a closed knight's tour."""
+    m, n = sorted((rows, cols))
+    return not ((m % 2 and n % 2) or m in (1, 2, 4) or (m == 3 and n in (4, 6, 8)))
+
+def solve_knights_tour_warnsdorff(rows, cols=None, start_pos=(0, 0), closed=False):
+    """Solves the Knight's Tour problem with an iterative Warnsdorff walk.
+
+    The knight always moves to the unvisited square with the fewest onward moves.
+    Ties are broken by Roth's rule (farthest from the centre) and, if that walk gets
+    stuck, by Pohl's rule (smallest sum of onward degrees). There is no recursion and
+    no backtracking: a 1000x1000 board takes about 5-10 seconds.
+
+    For a closed tour the walk starts in the centre and reserves one neighbour of the
+    start as the last square, trying each neighbour in turn (then the squares next to
+    the centre, then those next to `start_pos`); the cycle found is then rotated to
+    begin at `start_pos`.
+
+    An open tour falls back on the same closed walks when both rules get stuck from
+    `start_pos` (about 1% of the starts, mostly on boards 5 squares wide): the closed
+    tour rotated to `start_pos` if the board has one, otherwise (an odd number of
+    squares) a closed tour of the other squares, which the knight enters from
+    `start_pos`. If those get stuck too, up to MAX_RANDOM_WALKS open walks with random
+    tie-breaking (seeded, so the result is reproducible) are tried.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int, optional): The number of columns. Defaults to `rows` (a square board).
+        start_pos (tuple, optional): The starting square (row, column). Defaults to (0, 0).
+        closed (bool, optional): Whether the last square must be a knight's move from the first.
+
+    Returns:
+        list: A list of (x, y) tuples representing the tour, or None if no attempt succeeded.
+    """
+    cols = cols or rows
+    if closed and not closed_tour_exists(rows, cols):
+        return None
+    board = _padded_board(rows, cols)
+    width, offsets = board[0], board[1]
+
+    def padded(pos):
+        return (pos[0] + 2) * width + pos[1] + 2
+
+    def nearest(row, col, count):
+        squares = sorted(((r, c) for r in range(max(row - 3, 0), min(row + 4, rows))
+                          for c in range(max(col - 3, 0), min(col + 4, cols))),
+                         key=lambda pos: (pos[0] - row) ** 2 + (pos[1] - col) ** 2)
+        return [padded(pos) for pos in squares[:count]]
+
+    # Closed tours: the centre square first, then the squares closest to it
+    starts = nearest(rows // 2, cols // 2, MAX_CLOSED_STARTS)
+
+    def closed_walk(rule, removed=None):
+        for centre in starts:
+            if centre == removed:
+                continue
+            for o in offsets:
+                path = _warnsdorff_walk(board, rows, cols, centre, rule, last=centre + o, removed=removed)
+                if path:
+                    return path
+        return None
+
+    start = padded(start_pos)
+    path = None
+    if not closed:
+        for rule in ('roth', 'pohl'):
+            path = path or _warnsdorff_walk(board, rows, cols, start, rule)
+    # Fallback: a closed tour rotated to begin at the start is an open tour from there; on boards
+    # with an odd number of squares (no closed tour), so is a closed tour of all the other squares
+    # entered from the start
+    starts += [square for square in nearest(*start_pos, MAX_FALLBACK_STARTS) if square not in starts]
+    if not path and closed_tour_exists(rows, cols):
+        for rule in ('roth', 'pohl'):
+            path = closed_walk(rule)
+            if path:
+                i = path.index(start)
+                path = path[i:] + path[:i]
+                break
+    elif not path and rows * cols % 2:
+        for rule in ('roth', 'pohl'):
+            path = closed_walk(rule, removed=start)
+            if path:
+                i = next(i for i, square in enumerate(path) if square - start in offsets)
+                path = [start] + path[i:] + path[:i]
+                break
+    if not closed:
+        rng = random.Random(0)
+        for _ in range(MAX_RANDOM_WALKS):
+            path = path or _warnsdorff_walk(board, rows, cols, start, 'random', rng=rng)
+    if path:
+        return [(square // width - 2, square % width - 2) for square in path]
+    return None
+
+# Divide and conquer (Parberry): a structured closed tour contains, next to each
+# corner, the edges (0, 1)-(2, 0) and (0, 2)-(1, 0) (row and column distances from
+# that corner). Four structured tours meeting at a point are joined into one by
+# swapping one edge at each inner corner; the outer corners are untouched, so the
+# joined tour is structured again. Large boards are split in quadrants down to base
+# boards with both sides in 6..12, whose structured tours are found once by search.
+# A part with only one side above 12 is a strip: it is cut across its long side and
+# the two tours are joined at the seam by swapping a tour edge on each side for two
+# knight moves across it, which leaves the outer corners untouched as well.
+
+MAX_BASE_SIDE = 12
+"""Largest side of a base board (larger sides are split in two)."""
+
+_STRUCTURED_TOURS = {}
+
+# Offsets from the point where the quadrants meet: the edges removed at the inner
+# corners (top-left, top-right, bottom-right, bottom-left) and those that replace them
+_SPLICE_REMOVED = [((-1, -1), (-2, -3)), ((-1, 1), (-3, 0)), ((0, 0), (1, 2)), ((0, -2), (2, -1))]
+_SPLICE_ADDED = [((-1, -1), (-3, 0)), ((-2, -3), (0, -2)), ((-1, 1), (1, 2)), ((0, 0), (2, -1))]
+
+def _structured_edges(rows, cols):
+    """The eight edges (as pairs of squares r * cols + c) a structured tour must contain."""
+    edges = []
+    for r0, dr in ((0, 1), (rows - 1, -1)):
+        for c0, dc in ((0, 1), (cols - 1, -1)):
+            for (r1, c1), (r2, c2) in (((0, 1), (2, 0)), ((0, 2), (1, 0))):
+                edges.append(((r0 + dr * r1) * cols + c0 + dc * c1, (r0 + dr * r2) * cols + c0 + dc * c2))
+    return edges
+
+def _structured_tour(rows, cols, max_nodes=200000):
+    """Finds (once, then cached) a structured closed tour of a base board.
+
+    Depth-first search in Warnsdorff order with random tie-breaking, restarted with the
+    next seed after `max_nodes` nodes. A square on a structured edge must take it. The
+    tour leaves the corner (0, 0) for (1, 2) and comes back from (2, 1), which is only
+    entered as the last square.
+
+    Args:
+        rows (int): The number of rows (even, 6 to MAX_BASE_SIDE).
+        cols (int): The number of columns (even, 6 to MAX_BASE_SIDE).
+        max_nodes (int, optional): The nodes expanded before a restart.
+
+    Returns:
+        list: The squares (r * cols + c) of the tour, starting at (0, 0).
+    """
+    if (rows, cols) in _STRUCTURED_TOURS:
+        return _STRUCTURED_TOURS[(rows, cols)]
+    n = rows * cols
+    neighbors = [[(r + dr) * cols + c + dc for dr, dc in MOVES if 0 <= r + dr < rows and 0 <= c + dc < cols]
+                 for r in range(rows) for c in range(cols)]
+    forced = [[] for _ in range(n)]
+    for u, v in _structured_edges(rows, cols):
+        forced[u].append(v)
+        forced[v].append(u)
+    first, last = cols + 2, 2 * cols + 1
+
+    for seed in itertools.count():
+        rng = random.Random(seed)
+        tie = [rng.random() for _ in range(n)]
+        visited = bytearray(n)
+        degree = [len(squares) for squares in neighbors]
+        visited[0] = visited[last] = 1
+        for square in neighbors[0]:
+            degree[square] -= 1
+        path = [0]
+
+        def options(square):
+            rest = [f for f in forced[square] if f != path[-2]]
+            if len(rest) > 1:
+                return []
+            if len(path) == n - 1:
+                return [last] if last in neighbors[square] and rest in ([], [last]) else []
+            if rest:
+                return [] if visited[rest[0]] else rest
+            free = [s for s in neighbors[square] if not visited[s] and (len(forced[s]) < 2 or square in forced[s])]
+            return sorted(free, key=lambda s: (degree[s], tie[s]))
+
+        stack = [iter([first])]
+        for _ in range(max_nodes):
+            square = next(stack[-1], None)
+            if square is None:
+                stack.pop()
+                if not stack:
+                    break
+                square = path.pop()
+                visited[square] = 0
+                for s in neighbors[square]:
+                    degree[s] += 1
+                continue
+            path.append(square)
+            if square == last:
+                _STRUCTURED_TOURS[(rows, cols)] = path
+                return path
+            visited[square] = 1
+            for s in neighbors[square]:
+                degree[s] -= 1
+            stack.append(iter(options(square)))
+
+def _halves(side):
+    """Splits an even side in two even parts, as equal as possible."""
+    first = side // 4 * 2
+    return first, side - first
+
+def _tile(rows, cols, r0, c0, blocks, splices, seams):
+    """Splits the rows x cols board at (r0, c0) into base boards and the places where they are joined.
+
+    Both sides above MAX_BASE_SIDE: four quadrants, joined at the point where they meet
+    (appended to `splices`). Only one: two halves across the long side, joined at their
+    seam (appended to `seams` as the two parts (r0, c0, rows, cols), inner seams first).
+    """
+    if rows <= MAX_BASE_SIDE and cols <= MAX_BASE_SIDE:
+        blocks.append((r0, c0, rows, cols))
+    elif rows > MAX_BASE_SIDE and cols > MAX_BASE_SIDE:
+        top, bottom = _halves(rows)
+        left, right = _halves(cols)
+        splices.append((r0 + top, c0 + left))
+        for h, r in ((top, r0), (bottom, r0 + top)):
+            for w, c in ((left, c0), (right, c0 + left)):
+                _tile(h, w, r, c, blocks, splices, seams)
+    elif rows > cols:
+        top, bottom = _halves(rows)
+        _tile(top, cols, r0, c0, blocks, splices, seams)
+        _tile(bottom, cols, r0 + top, c0, blocks, splices, seams)
+        seams.append(((r0, c0, top, cols), (r0 + top, c0, bottom, cols)))
+    else:
+        left, right = _halves(cols)
+        _tile(rows, left, r0, c0, blocks, splices, seams)
+        _tile(rows, right, r0, c0 + left, blocks, splices, seams)
+        seams.append(((r0, c0, rows, left), (r0, c0 + left, rows, right)))
+
+def _seam_swap(first, second, cols, prev, succ):
+    """Finds a tour edge (a1, a2) in `first` and (b1, b2) in `second`, both next to their
+    common side, such that a1-b1 and a2-b2 are knight moves.
+
+    Returns:
+        tuple: The squares (a1, a2, b1, b2), or None if there is no such pair.
+    """
+    (fr, fc, fh, fw), (sr, sc, sh, sw) = first, second
+    if sr > fr:
+        near = [(r, c) for r in range(sr - 2, sr) for c in range(fc, fc + fw)]
+    else:
+        near = [(r, c) for r in range(fr, fr + fh) for c in range(sc - 2, sc)]
+
+    def inside(r, c):
+        return sr <= r < sr + sh and sc <= c < sc + sw
+
+    for r, c in near:
+        a1 = r * cols + c
+        for a2 in (prev[a1], succ[a1]):
+            ar, ac = divmod(a2, cols)
+            for dr, dc in MOVES:
+                if not inside(r + dr, c + dc):
+                    continue
+                b1 = (r + dr) * cols + c + dc
+                for b2 in (prev[b1], succ[b1]):
+                    br, bc = divmod(b2, cols)
+                    if (abs(br - ar), abs(bc - ac)) in ((1, 2), (2, 1)):
+                        return a1, a2, b1, b2
+    return None
+
+def solve_knights_tour_parberry(rows, cols=None, start_pos=(0, 0)):
+    """Builds a closed knight's tour by divide and conquer (Parberry), without search.
+
+    The board is split in quadrants, or across its long side when only that one is above
+    12, until every part is a base board (sides 6 to 12). Each base board gets its
+    structured tour (searched once per size, then cached), halves are joined by swapping
+    two edges at their seam, and quadrants four at a time by replacing four edges around
+    the point where they meet. The tour is kept as two neighbours per square, so the
+    whole construction is O(rows * cols).
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int, optional): The number of columns. Defaults to `rows` (a square board).
+        start_pos (tuple, optional): The starting square (row, column). Defaults to (0, 0).
+
+    Returns:
+        list: A list of (x, y) tuples representing a closed tour, or None if a side is odd or
+              smaller than 6.
+    """
+    cols = cols or rows
+    if rows % 2 or cols % 2 or min(rows, cols) < 6:
+        return None
+    blocks, splices, seams = [], [], []
+    _tile(rows, cols, 0, 0, blocks, splices, seams)
+
+    prev, succ = [0] * (rows * cols), [0] * (rows * cols)
+    for r0, c0, h, w in blocks:
+        tour = [(r0 + square // w) * cols + c0 + square % w for square in _structured_tour(h, w)]
+        for i, square in enumerate(tour):
+            prev[square] = tour[i - 1]
+            succ[square] = tour[(i + 1) % len(tour)]
+
+    def relink(square, old, new):
+        if prev[square] == old:
+            prev[square] = new
+        else:
+            succ[square] = new
+
+    # Seams first, while the halves are still separate cycles; a swapped edge has an end
+    # within 2 squares of its seam, so it is never one of the corner edges the splices use
+    for first, second in seams:
+        swap = _seam_swap(first, second, cols, prev, succ)
+        if swap is None:
+            return None
+        a1, a2, b1, b2 = swap
+        relink(a1, a2, b1)
+        relink(a2, a1, b2)
+        relink(b1, b2, a1)
+        relink(b2, b1, a2)
+
+    for r, c in splices:
+        removed = [((r + r1) * cols + c + c1, (r + r2) * cols + c + c2) for (r1, c1), (r2, c2) in _SPLICE_REMOVED]
+        partner = {u: v for u, v in removed}
+        partner.update({v: u for u, v in removed})
+        for (r1, c1), (r2, c2) in _SPLICE_ADDED:
+            u, v = (r + r1) * cols + c + c1, (r + r2) * cols + c + c2
+            relink(u, partner[u], v)
+            relink(v, partner[v], u)
+
+    # The neighbours are no longer oriented: walk the cycle from the start
+    square = start_pos[0] * cols + start_pos[1]
+    before = prev[square]
+    path = []
+    for _ in range(rows * cols):
+        path.append(divmod(square, cols))
+        square, before = (succ[square] if prev[square] == before else prev[square]), square
+    return path
@@ -1,7 +1,8 @@
 import io
 import time
 from contextlib import redirect_stdout
-from .algorithms import bfs, dfs, iddfs, simulated_annealing, solve_knights_tour_mrv, calculate_energy
+from .algorithms import (bfs, dfs, iddfs, simulated_annealing, solve_knights_tour_mrv, solve_knights_tour_warnsdorff,
+                         solve_knights_tour_parberry, calculate_energy)
 
 def solve_knights_tour(n_size):
     """Solves the Knight's Tour problem for a given board size using multiple algorithms and compares their performance.
@@ -11,11 +12,18 @@ def solve_knights_tour(n_size):
     - Depth-First Search (DFS)
     - Iterative Deepening DFS (IDDFS)
     - Simulated Annealing
-    - Warnsdorff's rule (a Minimum Remaining Values heuristic)
-
-    For small board sizes (<= 5), it runs the classic search algorithms (BFS, DFS, IDDFS).
+    - Warnsdorff's rule (a Minimum Remaining Values heuristic), recursive
+    - Warnsdorff's rule, iterative (degree counters, Roth/Pohl tie-breaking)
+    - Divide and conquer (Parberry): structured closed tours of base boards joined quadrant by quadrant
+
+    For small board sizes (<= 7), it runs the classic search algorithms (BFS, DFS, IDDFS), which share a
+    compact state (visited bitboard, precomputed move table, no path copies). Every tour is n*n - 1 moves
+    deep, so BFS and IDDFS (which exhaust every shallower level first) only finish below 5x5 and otherwise
+    report their node limit; DFS reaches 7x7.
     For larger boards, it skips these due to their high complexity and only runs
-    Simulated Annealing and Warnsdorff's rule.
+    Simulated Annealing (up to 50x50) and Warnsdorff's rule. The recursive Warnsdorff search recurses
+    once per square, so it only runs up to 30x30; the iterative one runs for any size. The divide and
+    conquer construction needs no search and always yields a closed tour, but only for even sizes.
 
     Args:
         n_size (int): The size of the square chessboard (n_size x n_size).
@@ -38,7 +46,7 @@ def solve_knights_tour(n_size):
         print(f"Rezolvare Knight's Tour pentru tablă {n_size}x{n_size}...\n")
 
         # Limităm algoritmii clasici pentru N mare
-        LIMIT_CLASSIC = 5
+        LIMIT_CLASSIC = 7
 
         # --- BFS ---
         if n_size <= LIMIT_CLASSIC:
@@ -77,24 +85,56 @@ def solve_knights_tour(n_size):
             print("--- IDDFS omis (N prea mare) ---\n")
 
         # --- Simulated Annealing ---
-        print("--- Testare Simulated Annealing ---")
-        start = time.time()
-        sol_sa = simulated_annealing(n_size)
-        duration = time.time() - start
-        energy = calculate_energy(sol_sa, n_size)
-        results['Simulated Annealing'] = {'time': duration, 'solution': sol_sa, 'energy': energy}
-        print(f"Timp: {duration:.4f}s. Mutări invalide (Energy): {energy}")
-        print("-" * 20 + "\n")
+        # Fiecare pas recalculează energia pe toată tabla (O(N^2)): peste 50x50 durează minute.
+        LIMIT_SA = 50
+        if n_size <= LIMIT_SA:
+            print("--- Testare Simulated Annealing ---")
+            start = time.time()
+            sol_sa = simulated_annealing(n_size)
+            duration = time.time() - start
+            energy = calculate_energy(sol_sa, n_size)
+            results['Simulated Annealing'] = {'time': duration, 'solution': sol_sa, 'energy': energy}
+            print(f"Timp: {duration:.4f}s. Mutări invalide (Energy): {energy}")
+            print("-" * 20 + "\n")
+        else:
+            print(f"--- Simulated Annealing omis (N > {LIMIT_SA}) ---\n")
 
         # --- MRV (Warnsdorff) ---
-        print("--- Testare MRV (Warnsdorff) ---")
+        # Recursiv: o adâncime de apel pe pătrat, depășește limita de recursivitate peste ~31x31.
+        LIMIT_RECURSIVE = 30
+        if n_size <= LIMIT_RECURSIVE:
+            print("--- Testare MRV (Warnsdorff) ---")
+            start = time.time()
+            sol_mrv = solve_knights_tour_mrv(n_size)
+            duration = time.time() - start
+            results['MRV'] = {'time': duration, 'solution': sol_mrv}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_mrv else 'NU'}")
+            print("-" * 20 + "\n")
+        else:
+            print(f"--- MRV (Warnsdorff) omis (N > {LIMIT_RECURSIVE}, recursivitate prea adâncă) ---\n")
+
+        # --- Warnsdorff (iterativ) ---
+        print("--- Testare Warnsdorff (iterativ) ---")
         start = time.time()
-        sol_mrv = solve_knights_tour_mrv(n_size)
+        sol_warnsdorff = solve_knights_tour_warnsdorff(n_size)
         duration = time.time() - start
-        results['MRV'] = {'time': duration, 'solution': sol_mrv}
-        print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_mrv else 'NU'}")
+        results['Warnsdorff (iterativ)'] = {'time': duration, 'solution': sol_warnsdorff}
+        print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_warnsdorff else 'NU'}")
         print("-" * 20 + "\n")
 
+        # --- Divide et impera (Parberry) ---
+        # Construiește un tur închis: pe o tablă cu N impar nu există așa ceva.
+        if n_size % 2 == 0:
+            print("--- Testare Divide et impera (Parberry) ---")
+            start = time.time()
+            sol_parberry = solve_knights_tour_parberry(n_size)
+            duration = time.time() - start
+            results['Divide et impera (Parberry)'] = {'time': duration, 'solution': sol_parberry}
+            print(f"Timp: {duration:.4f}s. Soluție găsită: {'DA' if sol_parberry else 'NU'}")
+            print("-" * 20 + "\n")
+        else:
+            print("--- Divide et impera (Parberry) omis (N impar, tur închis imposibil) ---\n")
+
     # Generare raport
     response = output_buffer.getvalue()
     response += "\n=== Concluzie ===\n"
@@ -112,14 +152,22 @@ def solve_knights_tour(n_size):
         
         # Formatare soluție ca matrice
         path = results[fastest]['solution']
-        board = [[0] * n_size for _ in range(n_size)]
-        for i, (r, c) in enumerate(path):
-            board[r][c] = i + 1
-            
-        formatted_sol = ""
-        for row in board:
-            formatted_sol += " ".join(f"{num:2d}" for num in row) + "\n"
-            
+        LIMIT_DISPLAY = 20
+        if n_size <= LIMIT_DISPLAY:
+            board = [[0] * n_size for _ in range(n_size)]
+            for i, (r, c) in enumerate(path):
+                board[r][c] = i + 1
+
+            width = len(str(n_size * n_size))
+            formatted_sol = ""
+            for row in board:
+                formatted_sol += " ".join(f"{num:{width}d}" for num in row) + "\n"
+        else:
+            # Tabla nu încape pe ecran: afișăm doar capetele drumului
+            formatted_sol = (f"Tabla {n_size}x{n_size} este prea mare pentru afișare.\n"
+                             f"Primele poziții: {' '.join(map(str, path[:10]))}\n"
+                             f"Ultimele poziții: {' '.join(map(str, path[-10:]))}\n")
+
         response += f"\nSoluția ({fastest}):\n{formatted_sol}"
     else:
         response += "Niciun algoritm nu a găsit o soluție completă validă."
@@ -11,7 +11,7 @@ from ai_project.minimax import solve_minimax
 from ai_project.csp import solve_csp_problem
 from ai_project.graph_coloring.solver import solve_graph_coloring
 from ai_project.knights_tour.solver import solve_knights_tour
-from ai_project.hanoi.solver import solve_hanoi
+from ai_project.hanoi.solver import solve_hanoi, solve_hanoi_query
 from ai_project.ui_v1.app import app as app_v1
 
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
@@ -50,13 +50,19 @@ def solve():
     elif problem_type == 'graph-coloring':
         graph = data.get('graph-coloring-graph', '{}')
         colors = data.get('graph-coloring-colors', '')
-        response = solve_graph_coloring(graph, colors)
+        mode = data.get('graph-coloring-mode', 'feasibility')
+        response = solve_graph_coloring(graph, colors, mode=mode)
     elif problem_type == 'knights-tour':
         n_size = int(data.get('knights-tour-size', 5))
         response = solve_knights_tour(n_size)
     elif problem_type == 'hanoi':
         n_disks = int(data.get('hanoi-disks', 3))
-        response = solve_hanoi(n_disks)
+        n_pegs = int(data.get('hanoi-pegs', 3))
+        start, goal = data.get('hanoi-start', '').strip(), data.get('hanoi-goal', '').strip()
+        if start and goal:
+            response = solve_hanoi_query(start, goal, n_pegs)
+        else:
+            response = solve_hanoi(n_disks, n_pegs)
     else:
         response = "Unknown problem type"
 
@@ -0,0 +1,19 @@
+from ai_project.graph_coloring.dynamic import DynamicColoring
+
+
+def test_kempe_chain_skips_the_conflicting_edge():
+    dc = DynamicColoring({'a': ['b', 'c']}, colors=['red', 'green'])
+    dc.colors.update({'a': 0, 'b': 1, 'c': 0})
+    assert dc._kempe_chain('a', 0, 1, 'c') == {'a', 'b'}
+
+
+def test_kempe_swap_repairs_when_no_colour_is_free():
+    # a-b and c-d with two colours: joining a and c (both colour 0) leaves neither
+    # end a free colour, and the local search is disabled, so only the swap of the
+    # {0, 1} chain {c, d} can repair the edge
+    dc = DynamicColoring({'a': ['b'], 'c': ['d']}, colors=['red', 'green'], max_repair_steps=0)
+    dc.colors.update({'a': 0, 'b': 1, 'c': 0, 'd': 1})
+    changed = dc.add_edge('a', 'c')
+    assert not dc.conflicts
+    assert len(changed) == 2
+    assert all(dc.colors[u] != dc.colors[v] for u in dc.adj for v in dc.adj[u])